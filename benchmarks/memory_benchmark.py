@@ -0,0 +1,78 @@
+"""
+Memory benchmark: bytes per character before and after __slots__.
+
+Run from the repository root:
+    python benchmarks/memory_benchmark.py [count]
+
+"Before" is a plain-attribute replica of the original Player layout
+(7 attributes stored in a per-instance __dict__); "after" is the slotted Warrior.
+"Warmed up" Warriors have also looked up their damage and rendered their stat
+line, so any per-character caches would show up in their size.
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project2_starter import Warrior, Weapon  # noqa: E402
+
+
+class DictPlayer:
+    """Replica of the original dict-backed Player attribute layout."""
+
+    def __init__(self, name):
+        self.name = name
+        self.health = 120
+        self.strength = 15
+        self.magic = 5
+        self.character_class = "Warrior"
+        self.level = 1
+        self.experience = 0
+
+
+class DictWeapon:
+    """Replica of the original dict-backed Weapon attribute layout."""
+
+    def __init__(self, name, damage_bonus):
+        self.name = name
+        self.damage_bonus = damage_bonus
+
+
+def warmed_warrior(name):
+    """Returns a Warrior that has used its damage table and stat line once."""
+    warrior = Warrior(name)
+    warrior.damage_for("attack")
+    warrior.stat_line()
+    return warrior
+
+
+def bytes_per_object(factory, count):
+    """Returns the average traced allocation size of one object made by factory(i)."""
+    names = [f"npc{i}" for i in range(count)]  # Names are allocated outside the measurement
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(name) for name in names]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = sys.getsizeof(objects)  # The holding list isn't part of the object cost
+    return (after - before - list_overhead) / count
+
+
+def main(count=100_000):
+    """Prints bytes per object for the old and new layouts."""
+    rows = [
+        ("Character/Player (dict)", bytes_per_object(DictPlayer, count)),
+        ("Character/Player (slots)", bytes_per_object(Warrior, count)),
+        ("Warrior (slots, warmed up)", bytes_per_object(warmed_warrior, count)),
+        ("Weapon (dict)", bytes_per_object(lambda name: DictWeapon(name, 10), count)),
+        ("Weapon (slots)", bytes_per_object(lambda name: Weapon(name, 10), count)),
+    ]
+    print(f"Bytes per object ({count:,} objects each)")
+    for label, size in rows:
+        print(f"  {label:<26} {size:8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,209 @@
+"""
+Throughput benchmarks for the combat hot paths.
+
+Run from the repository root:
+    python benchmarks/run_benchmarks.py                       # print results
+    python benchmarks/run_benchmarks.py --save baseline.json  # record a baseline
+    python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.2
+
+With --compare the script exits with status 1 when any benchmark is slower
+than the baseline by more than the threshold (0.2 = 20% fewer ops/sec).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import project2_starter as game  # noqa: E402
+
+
+def _attack_case(attacker, ability):
+    """Builds a benchmark that uses one ability on a target that never dies."""
+    target = game.Character("Dummy", 10 ** 12, 0, 0)
+    use = getattr(attacker, ability)
+    return lambda: use(target)
+
+
+def _take_damage_case():
+    """Builds a benchmark for Character.take_damage."""
+    target = game.Character("Dummy", 10 ** 12, 0, 0)
+    return lambda: target.take_damage(1)
+
+
+def _take_damage_batch_case(hits=50):
+    """Builds a benchmark for Character.take_damage_batch with `hits` hits."""
+    target = game.Character("Dummy", 10 ** 12, 0, 0)
+    damages = [1] * hits
+    return lambda: target.take_damage_batch(damages)
+
+
+def _damage_tick_case(size=100, hits=1000):
+    """Builds a benchmark for one roster-wide tick of `hits` hits through apply_damage."""
+    picker = random.Random(0)
+    roster = [game.Character(f"Raider{i}", 10 ** 12, 0, 0) for i in range(size)]
+    indices = [picker.randrange(size) for _ in range(hits)]
+    amounts = [picker.randint(1, 30) for _ in range(hits)]
+    return lambda: game.apply_damage(roster, indices, amounts)
+
+
+def _factory_case():
+    """Builds a benchmark for spawning 1000 Rogues from a cached prototype."""
+    factory = game.CharacterFactory()
+    names = [f"Rogue{i}" for i in range(1000)]
+    return lambda: factory.spawn_many("Rogue", names)
+
+
+def _render_case(size=100):
+    """Builds a benchmark for rendering a roster's stat lines in one write."""
+    roster = [cls(f"{cls.__name__}{i}") for i in range(size // 3 + 1) for cls in (game.Warrior, game.Mage, game.Rogue)]
+    roster = roster[:size]
+
+    def render():
+        game.render_roster(roster, io.StringIO())
+    return render
+
+
+def _simple_battle_case():
+    """Builds a benchmark for the provided one-round SimpleBattle.fight."""
+    def fight():
+        with contextlib.redirect_stdout(io.StringIO()):  # fight() always prints its banners
+            game.SimpleBattle(game.Warrior("W"), game.Rogue("R")).fight()
+    return fight
+
+
+def _full_battle_case():
+    """Builds a benchmark for a silent multi-round battle."""
+    rng = random.Random(1)
+    return lambda: game.Battle(game.Rogue("R"), game.Warrior("W"), rng=rng).fight_until_defeat(output=False)
+
+
+def _tournament_case():
+    """Builds a benchmark for a small serial round-robin tournament."""
+    roster = [cls(f"{cls.__name__}{i}") for i in range(4) for cls in (game.Warrior, game.Mage, game.Rogue)]
+    return lambda: game.run_tournament(roster, workers=1)
+
+
+def _batch_case(size=10_000):
+    """Builds a benchmark for one vectorized round of `size` battles."""
+    pairs = [(game.Warrior("W"), game.Rogue("R"))] * size
+    batch = game.BatchBattle.from_pairs(pairs)
+    rng = game.np.random.default_rng(0)
+
+    def fight():
+        batch.health[:] = [[120], [90]]  # Reset health so every round does full work
+        batch.fight(rng=rng)
+    return fight
+
+
+def build_cases():
+    """
+    Returns {name: (callable, units per call)}.
+    Units are what the ops/sec figure counts (attacks, battles, objects...).
+    """
+    cases = {
+        "take_damage": (_take_damage_case(), 1),
+        "take_damage_batch.50": (_take_damage_batch_case(), 50),
+        "apply_damage.1k_hits": (_damage_tick_case(), 1000),
+        "character.attack": (_attack_case(game.Character("C", 100, 10, 5), "attack"), 1),
+        "warrior.attack": (_attack_case(game.Warrior("W"), "attack"), 1),
+        "mage.attack": (_attack_case(game.Mage("M"), "attack"), 1),
+        "rogue.attack": (_attack_case(game.Rogue("R"), "attack"), 1),
+        "warrior.power_strike": (_attack_case(game.Warrior("W"), "power_strike"), 1),
+        "mage.fireball": (_attack_case(game.Mage("M"), "fireball"), 1),
+        "rogue.sneak_attack": (_attack_case(game.Rogue("R"), "sneak_attack"), 1),
+        "construct.warrior": (lambda: game.Warrior("W"), 1),
+        "construct.weapon": (lambda: game.Weapon("Sword", 10), 1),
+        "construct.factory_1k": (_factory_case(), 1000),
+        "render.roster_100": (_render_case(), 100),
+        "battle.simple_fight": (_simple_battle_case(), 1),
+        "battle.until_defeat": (_full_battle_case(), 1),
+        "tournament.12_players": (_tournament_case(), 66),  # 12 * 11 / 2 matchups
+    }
+    if game.np is not None:
+        cases["batch.10k_battles"] = (_batch_case(), 10_000)
+    return cases
+
+
+def measure(function, units, min_time=0.2, repeat=3):
+    """
+    Returns the best observed units/sec for function over `repeat` timed runs.
+    Each run loops until at least min_time seconds have passed.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            function()
+            calls += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, calls * units / elapsed)
+    return best
+
+
+def run(names=None, min_time=0.2, repeat=3):
+    """Runs the selected benchmarks (all by default) with combat output silenced."""
+    previous = game.set_event_sink(game.NullSink())
+    try:
+        cases = build_cases()
+        selected = names or list(cases)
+        return {name: measure(*cases[name], min_time=min_time, repeat=repeat) for name in selected}
+    finally:
+        game.set_event_sink(previous)
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns a list of (name, baseline ops/sec, current ops/sec) for benchmarks
+    that slowed down by more than `threshold` (a fraction) against the baseline.
+    """
+    regressions = []
+    for name, current in results.items():
+        old = baseline.get(name)
+        if old and current < old * (1 - threshold):
+            regressions.append((name, old, current))
+    return regressions
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown fraction")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed run")
+    args = parser.parse_args(argv)
+
+    results = run(args.names, min_time=args.min_time)
+    for name, ops in results.items():
+        print(f"{name:<24} {ops:>14,.0f} ops/sec")
+
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump({"python": platform.python_version(), "results": results}, handle, indent=2)
+        print(f"Saved results to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, current in regressions:
+            print(f"REGRESSION {name}: {old:,.0f} -> {current:,.0f} ops/sec ({current / old - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,26 @@
 import random  # Used for Rogue's critical hit chance
+import asyncio # Live encounters multiplexed on one event loop
+import bisect  # Level lookup in the XP threshold table
+import copy    # Fresh copies of characters for each tournament matchup
+import gzip    # Compressed battle logs
+import heapq   # Target-selection index for party battles
+import hashlib # Stable build fingerprints for the win-rate cache
+import json    # One JSON record per battle log line
+import mmap    # Read-only memory-mapped roster files
+import struct  # Fixed-width binary roster records
+import sys     # Batched roster output
+import os      # CPU count for the tournament process pool
+import time    # Wall-clock timing for ability profiling
+from array import array  # Compact per-character cooldown columns
+from collections import defaultdict, namedtuple  # Health-state tables, typed records
+from functools import lru_cache, wraps  # Memoized predictions, profiling wrappers
+from operator import attrgetter  # Compiled ability damage formulas
+from concurrent.futures import ProcessPoolExecutor  # Parallel tournaments
+
+try:
+    import numpy as np  # Optional: only needed by the batch battle engine
+except ImportError:  # pragma: no cover - numpy is not required for the core classes
+    np = None
 
 """
 COMP 163 - Project 2: Character Abilities Showcase
@@ -66,6 +88,257 @@ class SimpleBattle:
             print("🤝 It's a tie!")
 
 
+# ============================================================================
+# COMBAT EVENTS (Pluggable output for attacks and damage)
+# ============================================================================
+
+class AttackEvent(namedtuple("AttackEvent", "attacker target ability damage message")):
+    """
+    Emitted when a character uses an ability on a target.
+    The message is an unformatted template; it is only filled in when rendered.
+    """
+    __slots__ = ()
+
+    def render(self):
+        """Returns the console line for this attack."""
+        return self.message.format(attacker=self.attacker.name, target=self.target.name, damage=self.damage)
+
+
+class DamageEvent(namedtuple("DamageEvent", "target damage health")):
+    """Emitted when a character takes damage. Health is the value after clamping."""
+    __slots__ = ()
+
+    def render(self):
+        """Returns the console line for this damage."""
+        return f"{self.target.name} takes {self.damage} damage! Health is now {self.health}."
+
+
+class NullSink:
+    """Event sink that discards everything (headless simulations)."""
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Ignores an attack."""
+
+    def on_damage(self, target, damage, health):
+        """Ignores damage."""
+
+
+class BufferedSink:
+    """Event sink that keeps every event in memory for later inspection."""
+
+    def __init__(self):
+        """Creates an empty event buffer."""
+        self.events = []  # AttackEvent / DamageEvent objects in emission order
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Stores an AttackEvent."""
+        self.events.append(AttackEvent(attacker, target, ability, damage, message))
+
+    def on_damage(self, target, damage, health):
+        """Stores a DamageEvent."""
+        self.events.append(DamageEvent(target, damage, health))
+
+    def render(self):
+        """Returns every buffered event as console lines."""
+        return [event.render() for event in self.events]
+
+    def clear(self):
+        """Empties the buffer."""
+        self.events.clear()
+
+
+class ConsoleSink:
+    """Event sink that prints the classic combat messages (the default)."""
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Prints the attack line."""
+        print(message.format(attacker=attacker.name, target=target.name, damage=damage))
+
+    def on_damage(self, target, damage, health):
+        """Prints the damage line."""
+        print(f"{target.name} takes {damage} damage! Health is now {health}.")
+
+
+NULL_SINK = NullSink()          # Shared sink for silent runs
+CONSOLE_SINK = ConsoleSink()    # Shared sink for normal console output
+_event_sink = CONSOLE_SINK      # Sink currently receiving combat events
+
+
+def get_event_sink():
+    """Returns the sink currently receiving combat events."""
+    return _event_sink
+
+
+def set_event_sink(sink):
+    """
+    Routes all combat events to the given sink.
+    Returns the previous sink so callers can restore it.
+    """
+    global _event_sink
+    previous = _event_sink
+    _event_sink = CONSOLE_SINK if sink is None else sink
+    return previous
+
+
+def silenced(sink):
+    """
+    Returns sink without console output: console sinks become the null sink,
+    sinks that wrap another one (anything with a quiet() method) return a
+    version whose downstream is silenced, and logs and buffers are kept.
+    """
+    if isinstance(sink, ConsoleSink):
+        return NULL_SINK
+    quiet = getattr(sink, "quiet", None)
+    return sink if quiet is None else quiet()
+
+
+def quiet_sink():
+    """Returns the sink to use when console output is disabled (the current sink, silenced)."""
+    return silenced(_event_sink)
+
+
+# ============================================================================
+# RANDOM NUMBER SOURCES (Seedable, bulk-drawn dice rolls)
+# ============================================================================
+
+class RollBuffer:
+    """
+    Pre-draws dice rolls in bulk so hot paths don't make one RNG call per roll.
+    Drop-in replacement for the random module's randint() as a character rng.
+
+    source may be None (fresh random.Random), an int seed, a random.Random,
+    or a numpy Generator (anything with an integers() method).
+    """
+
+    def __init__(self, source=None, low=1, high=10, size=4096):
+        """
+        Creates a buffer of rolls in low..high (inclusive), refilled size at a time.
+        """
+        if source is None or isinstance(source, int):
+            source = random.Random(source)
+        self.source = source  # Generator the rolls come from
+        self.low = low        # Smallest buffered roll
+        self.high = high      # Largest buffered roll
+        self.size = size      # Rolls drawn per refill
+        self._rolls = []      # Current batch of rolls
+        self._position = 0    # Index of the next unused roll
+
+    def _refill(self):
+        """Draws the next batch of rolls with a single call into the source."""
+        if hasattr(self.source, "integers"):  # numpy Generator
+            self._rolls = self.source.integers(self.low, self.high + 1, self.size).tolist()
+        else:
+            self._rolls = self.source.choices(range(self.low, self.high + 1), k=self.size)
+        self._position = 0
+
+    def randint(self, a, b):
+        """
+        Returns a random integer in a..b (inclusive), like random.randint.
+        Rolls in the buffered range come from the buffer; others go to the source.
+        """
+        if a != self.low or b != self.high:
+            if hasattr(self.source, "integers"):
+                return int(self.source.integers(a, b + 1))
+            return self.source.randint(a, b)
+        if self._position >= len(self._rolls):
+            self._refill()
+        roll = self._rolls[self._position]
+        self._position += 1
+        return roll
+
+
+# ============================================================================
+# ABILITY DEFINITIONS (Data-driven damage, compiled once per class)
+# ============================================================================
+
+# Damage = stat * multiplier + bonus; a critical hit multiplies the scaled stat by CRIT_MULTIPLIER
+AbilitySpec = namedtuple("AbilitySpec", "stat multiplier bonus crit_chance", defaults=(1, 0, 0.0))
+
+SCALING_STATS = ("strength", "magic")
+CRIT_MULTIPLIER = 2  # Critical hits deal double the scaled stat
+CRIT_DIE = 10        # Crit rolls are 1..CRIT_DIE; rolls up to crit_chance * CRIT_DIE are critical
+
+
+def crit_threshold(spec):
+    """
+    Returns the highest crit roll (0 = never crits) for an ability spec.
+    Raises ValueError unless the chance is a multiple of 1 / CRIT_DIE in [0, 1].
+    """
+    chance = AbilitySpec(*spec).crit_chance
+    threshold = round(chance * CRIT_DIE)
+    if not 0 <= threshold <= CRIT_DIE or abs(threshold - chance * CRIT_DIE) > 1e-9:
+        raise ValueError(f"crit_chance must be a multiple of 1/{CRIT_DIE} between 0 and 1, got {chance!r}")
+    return threshold
+
+
+def _compile_formula(spec, multiplier):
+    """Returns a damage callable for one spec; the spec is kept on the function."""
+    get_stat = attrgetter(spec.stat)
+    bonus = spec.bonus
+
+    def formula(character):
+        return get_stat(character) * multiplier + bonus
+
+    formula.spec = spec
+    return formula
+
+
+def compile_abilities(specs):
+    """
+    Compiles {ability: AbilitySpec or tuple} into the {key: damage callable}
+    table used by Character.damage_table(). Only the basic attack can crit;
+    it then also gets a "critical_attack" entry.
+    """
+    formulas = {}
+    for ability, spec in specs.items():
+        spec = AbilitySpec(*spec)
+        if spec.stat not in SCALING_STATS:
+            raise ValueError(f"{ability} scales with unknown stat {spec.stat!r}")
+        if crit_threshold(spec) and ability != "attack":
+            raise ValueError(f"only the basic attack can crit, not {ability}")
+        formulas[ability] = _compile_formula(spec, spec.multiplier)
+        if spec.crit_chance:
+            formulas[f"critical_{ability}"] = _compile_formula(spec, spec.multiplier * CRIT_MULTIPLIER)
+    return formulas
+
+
+# Shared damage tables: (class, strength, magic) -> {ability: damage before the weapon bonus}
+DAMAGE_TABLE_CACHE_SIZE = 4096  # Builds kept before the cache is reset
+_DAMAGE_TABLES = {}
+
+
+def ability_coefficients(spec):
+    """
+    Returns a spec as the integer vector the batch engine evaluates:
+    (strength coefficient, magic coefficient, bonus, crit threshold, crit multiplier).
+    """
+    spec = AbilitySpec(*spec)
+    return (
+        spec.multiplier if spec.stat == "strength" else 0,
+        spec.multiplier if spec.stat == "magic" else 0,
+        spec.bonus,
+        crit_threshold(spec),
+        CRIT_MULTIPLIER if spec.crit_chance else 1,
+    )
+
+
+# ============================================================================
+# STAT TEXT (Formatted stat fragments shared between characters)
+# ============================================================================
+
+# (strength, magic) or (class name, level) -> the fixed text of a display_stats() line
+STAT_TEXT_CACHE_SIZE = 4096  # Fragments kept before the cache is reset
+_STAT_TEXTS = {}
+
+
+def _share_stat_text(key, text):
+    """Stores a formatted stat fragment for every character that shares key; returns it."""
+    if len(_STAT_TEXTS) >= STAT_TEXT_CACHE_SIZE:
+        _STAT_TEXTS.clear()
+    _STAT_TEXTS[key] = text
+    return text
+
+
 # ============================================================================
 # BASE CHARACTER CLASSES
 # ============================================================================
@@ -73,6 +346,32 @@ class SimpleBattle:
 class Character:
     """Base class representing any character in the game."""
 
+    # Fixed attribute layout: no per-instance __dict__, which matters with millions of NPCs
+    __slots__ = ("name", "health", "strength", "magic", "rng")
+
+    ATTACK_MESSAGE = "{attacker} attacks {target} for {damage} damage!"
+    CRITICAL_MESSAGE = "Critical hit! {attacker} strikes {target} for {damage} damage!"
+
+    # Damage of each ability before equipment; subclass ABILITY_SPECS add to or override these
+    ABILITY_SPECS = {
+        "attack": AbilitySpec("strength"),
+    }
+    DAMAGE_FORMULAS = compile_abilities(ABILITY_SPECS)
+    CRIT_THRESHOLD = 0  # Highest d10 roll that makes a basic attack critical
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Compiles a subclass's ABILITY_SPECS, merged over its parent's, into its
+        damage dispatch table, so inherited abilities keep their formulas.
+        """
+        super().__init_subclass__(**kwargs)
+        if "ABILITY_SPECS" in cls.__dict__:
+            cls.ABILITY_SPECS = {**super(cls, cls).ABILITY_SPECS, **cls.ABILITY_SPECS}
+            cls.DAMAGE_FORMULAS = compile_abilities(cls.ABILITY_SPECS)
+            cls.CRIT_THRESHOLD = crit_threshold(cls.ABILITY_SPECS.get("attack", AbilitySpec("strength")))
+        elif "DAMAGE_FORMULAS" in cls.__dict__ and "critical_attack" not in cls.DAMAGE_FORMULAS:
+            cls.CRIT_THRESHOLD = 0  # Hand-written table without a critical entry can't crit
+
     def __init__(self, name, health, strength, magic):
         """
         Initializes basic character attributes.
@@ -81,13 +380,61 @@ class Character:
         self.health = health  # Current health points
         self.strength = strength  # Determines physical attack damage
         self.magic = magic        # Determines magical attack power
+        self.rng = None           # Random source with randint(); None uses the global random module
+
+    def weapon_bonus(self):
+        """Returns the flat damage bonus from equipment (none for a plain Character)."""
+        return 0
+
+    def _base_damage(self):
+        """
+        Returns the shared {ability: damage} table for this class, strength
+        and magic, without the weapon bonus. Every character with the same
+        build uses the same dict, so characters carry no table of their own.
+        """
+        key = (type(self), self.strength, self.magic)
+        table = _DAMAGE_TABLES.get(key)
+        if table is None:
+            if len(_DAMAGE_TABLES) >= DAMAGE_TABLE_CACHE_SIZE:
+                _DAMAGE_TABLES.clear()  # Keep the cache bounded (e.g. during balance searches)
+            table = _DAMAGE_TABLES[key] = {ability: formula(self) for ability, formula in self.DAMAGE_FORMULAS.items()}
+        return table
+
+    def damage_table(self):
+        """
+        Returns {ability: damage} for every ability, including the weapon bonus.
+        Unarmed characters get the shared table for their build.
+        """
+        table = self._base_damage()
+        bonus = self.weapon_bonus()
+        if bonus:
+            return {ability: damage + bonus for ability, damage in table.items()}
+        return table
+
+    def damage_for(self, ability):
+        """Returns the damage one use of the ability deals (the weapon bonus is read on every call)."""
+        table = _DAMAGE_TABLES.get((type(self), self.strength, self.magic)) or self._base_damage()
+        return table[ability] + self.weapon_bonus()
+
+    def invalidate_damage_table(self):
+        """Drops the shared table for this build, e.g. after editing the class's DAMAGE_FORMULAS."""
+        _DAMAGE_TABLES.pop((type(self), self.strength, self.magic), None)
+
+    def _basic_attack(self):
+        """
+        Returns (ability, damage, message) for a basic attack. Classes with a
+        crit chance roll 1..CRIT_DIE; rolls up to CRIT_THRESHOLD are critical.
+        """
+        if self.CRIT_THRESHOLD and (self.rng or random).randint(1, CRIT_DIE) <= self.CRIT_THRESHOLD:
+            return "critical_attack", self.damage_for("critical_attack"), self.CRITICAL_MESSAGE
+        return "attack", self.damage_for("attack"), self.ATTACK_MESSAGE
 
     def attack(self, target):
         """
         Performs a standard physical attack using strength.
         """
-        damage = self.strength  # Damage equals character's strength stat
-        print(f"{self.name} attacks {target.name} for {damage} damage!")
+        ability, damage, message = self._basic_attack()  # Strength (+ weapon), critical if rolled
+        _event_sink.on_attack(self, target, ability, damage, message)
         target.take_damage(damage)  # Apply damage to target
 
     def take_damage(self, damage):
@@ -98,20 +445,78 @@ class Character:
         self.health -= damage  # Subtracts incoming damage
         if self.health < 0:    # Stop health from going negative
             self.health = 0
-        print(f"{self.name} takes {damage} damage! Health is now {self.health}.")
+        _event_sink.on_damage(self, damage, self.health)
+
+    def take_damage_batch(self, damages, events=False):
+        """
+        Applies many hits in one call: the damage is summed and health is
+        clamped once. Emits one damage event for the total, or the usual
+        per-hit events (via take_damage) when events is True.
+        Returns the total damage.
+        """
+        if events:
+            total = 0
+            for damage in damages:
+                self.take_damage(damage)
+                total += damage
+            return total
+        damages = list(damages)
+        if not damages:
+            return 0
+        total = sum(damages)
+        self.health -= total
+        if self.health < 0:  # Clamp once for the whole batch
+            self.health = 0
+        _event_sink.on_damage(self, total, self.health)
+        return total
+
+    def base_line(self):
+        """
+        Returns the name, health, strength and magic line. The text after
+        health is shared by every character with the same strength and magic.
+        """
+        key = (self.strength, self.magic)
+        text = _STAT_TEXTS.get(key)
+        if text is None:
+            text = _share_stat_text(key, f" | Strength: {self.strength} | Magic: {self.magic}")
+        return f"{self.name} | Health: {self.health}{text}"
+
+    def stat_line(self):
+        """Returns the text display_stats() prints."""
+        return self.base_line()
 
     def display_stats(self):
         """Displays character's current name, health, strength, and magic."""
-        print(f"{self.name} | Health: {self.health} | Strength: {self.strength} | Magic: {self.magic}")
+        print(self.base_line())
 
 
 # ============================================================================
 # PLAYER CLASSES (Derived from Character)
 # ============================================================================
 
+MAX_LEVEL = 50
+# XP_TABLE[n] is the total experience needed to reach level n + 1 (0, 100, 300, 600, ...)
+XP_TABLE = tuple(50 * level * (level - 1) for level in range(1, MAX_LEVEL + 1))
+XP_PER_DEFEATED_LEVEL = 50  # Experience for defeating an opponent, per opponent level
+
+
+def level_for_experience(experience):
+    """Returns the level reached with the given total experience (binary search)."""
+    return bisect.bisect_right(XP_TABLE, experience)
+
+
+def experience_for_defeat(loser):
+    """Returns the experience awarded for defeating a character."""
+    return XP_PER_DEFEATED_LEVEL * getattr(loser, "level", 1)
+
+
 class Player(Character):
     """Base class for all player-controlled characters."""
 
+    __slots__ = ("character_class", "level", "experience", "weapon")
+
+    LEVEL_GROWTH = (5, 1, 1)  # Health, strength and magic gained per level
+
     def __init__(self, name, character_class, health, strength, magic):
         """
         Initializes a player with character-specific data and extra stats.
@@ -120,11 +525,67 @@ class Player(Character):
         self.character_class = character_class  # Class type (Warrior, Mage, Rogue)
         self.level = 1      # Starting level
         self.experience = 0 # Starting experience points
+        self.weapon = None  # Equipped Weapon (composition), if any
+
+    def weapon_bonus(self):
+        """Returns the equipped weapon's damage bonus, or 0 when unarmed."""
+        return self.weapon.damage_bonus if self.weapon is not None else 0
+
+    def equip(self, weapon):
+        """
+        Equips a weapon, adding its damage bonus to every ability.
+        Returns the previously equipped weapon (or None).
+        """
+        previous = self.weapon
+        self.weapon = weapon  # The bonus is read on every damage lookup, so nothing to invalidate
+        return previous
+
+    def unequip(self):
+        """Removes and returns the equipped weapon (or None)."""
+        return self.equip(None)
+
+    def gain_experience(self, amount):
+        """
+        Adds experience and applies LEVEL_GROWTH for every level gained.
+        Returns the number of levels gained.
+        """
+        if amount < 0:
+            raise ValueError("experience can't be negative")
+        self.experience += amount
+        gained = level_for_experience(self.experience) - self.level
+        if gained > 0:
+            self._grow(gained)
+        return max(gained, 0)
+
+    def _grow(self, levels):
+        """Raises the level and stats by the given number of levels."""
+        health, strength, magic = self.LEVEL_GROWTH
+        self.level += levels
+        self.health += health * levels
+        if strength:
+            self.strength += strength * levels
+        if magic:
+            self.magic += magic * levels
+
+    def class_line(self):
+        """
+        Returns the class, level and experience line. The text before
+        experience is shared by every player of the same class and level.
+        """
+        key = (self.character_class, self.level)
+        text = _STAT_TEXTS.get(key)
+        if text is None:
+            text = _share_stat_text(key, f"Class: {self.character_class} | Level: {self.level} | EXP: ")
+        return f"{text}{self.experience}"
+
+    def stat_line(self):
+        """Returns the two display_stats() lines: base stats plus class, level, and experience."""
+        return f"{self.base_line()}\n{self.class_line()}"
 
     def display_stats(self):
         """Displays base character stats plus class, level, and experience."""
         super().display_stats()  # Print Character stats
-        print(f"Class: {self.character_class} | Level: {self.level} | EXP: {self.experience}")
+        print(self.class_line())
 
 
 # ============================================================================
@@ -134,6 +595,18 @@ class Player(Character):
 class Warrior(Player):
     """A powerful melee fighter with high strength and health."""
 
+    __slots__ = ()
+
+    ATTACK_MESSAGE = "{attacker} swings a mighty sword at {target} for {damage} damage!"
+    POWER_STRIKE_MESSAGE = "{attacker} performs a POWER STRIKE on {target} for {damage} damage!"
+
+    ABILITY_SPECS = {
+        "attack": AbilitySpec("strength", bonus=5),         # Warrior bonus damage
+        "power_strike": AbilitySpec("strength", bonus=15),  # Stronger attack
+    }
+
+    LEVEL_GROWTH = (12, 2, 0)  # Tough and strong
+
     def __init__(self, name):
         """
         Creates a Warrior with predefined stats.
@@ -144,16 +617,16 @@ class Warrior(Player):
         """
         Overrides attack to add extra melee damage.
         """
-        damage = self.strength + 5  # Warrior bonus damage
-        print(f"{self.name} swings a mighty sword at {target.name} for {damage} damage!")
+        ability, damage, message = self._basic_attack()  # Strength + 5 (+ weapon)
+        _event_sink.on_attack(self, target, ability, damage, message)
         target.take_damage(damage)
 
     def power_strike(self, target):
         """
         Special ability that deals heavy physical damage.
         """
-        damage = self.strength + 15  # Stronger attack
-        print(f"{self.name} performs a POWER STRIKE on {target.name} for {damage} damage!")
+        damage = self.damage_for("power_strike")  # Strength + 15 (+ weapon)
+        _event_sink.on_attack(self, target, "power_strike", damage, self.POWER_STRIKE_MESSAGE)
         target.take_damage(damage)
 
 
@@ -162,6 +635,20 @@ class Warrior(Player):
 class Mage(Player):
     """A master of magical attacks with high magic power."""
 
+    __slots__ = ()
+
+    ATTACK_MESSAGE = "{attacker} casts a spell on {target} for {damage} magic damage!"
+    FIREBALL_MESSAGE = "{attacker} launches a FIREBALL at {target} for {damage} damage!"
+    FIREBALL_AREA_MESSAGE = "{attacker}'s FIREBALL engulfs {target} for {damage} damage!"
+    FIREBALL_RADIUS = 5.0  # Default blast radius on an Arena
+
+    ABILITY_SPECS = {
+        "attack": AbilitySpec("magic"),               # Magic-based damage
+        "fireball": AbilitySpec("magic", bonus=10),   # Stronger magic attack
+    }
+
+    LEVEL_GROWTH = (6, 0, 3)  # Magic grows fastest
+
     def __init__(self, name):
         """
         Creates a Mage with predefined stats.
@@ -172,24 +659,49 @@ class Mage(Player):
         """
         Overrides attack to use magic instead of strength.
         """
-        damage = self.magic  # Magic-based damage
-        print(f"{self.name} casts a spell on {target.name} for {damage} magic damage!")
+        ability, damage, message = self._basic_attack()  # Magic (+ weapon)
+        _event_sink.on_attack(self, target, ability, damage, message)
         target.take_damage(damage)
 
     def fireball(self, target):
         """
         Special high-damage magic attack.
         """
-        damage = self.magic + 10  # Stronger magic attack
-        print(f"{self.name} launches a FIREBALL at {target.name} for {damage} damage!")
+        damage = self.damage_for("fireball")  # Magic + 10 (+ weapon)
+        _event_sink.on_attack(self, target, "fireball", damage, self.FIREBALL_MESSAGE)
         target.take_damage(damage)
 
+    def fireball_area(self, arena, x, y, radius=None):
+        """
+        Area-of-effect fireball: full fireball damage to every standing enemy
+        within radius of (x, y) on the Arena. Returns the characters hit.
+        """
+        damage = self.damage_for("fireball")
+        targets = arena.enemies_within(self, x, y, self.FIREBALL_RADIUS if radius is None else radius)
+        for target in targets:
+            _event_sink.on_attack(self, target, "fireball", damage, self.FIREBALL_AREA_MESSAGE)
+            target.take_damage(damage)
+        return targets
+
 
 # ----------------------------------------------------------------------------
 
 class Rogue(Player):
     """A stealthy and agile fighter who excels at critical hits."""
 
+    __slots__ = ()
+
+    ATTACK_MESSAGE = "{attacker} attacks {target} for {damage} damage."
+    CRITICAL_MESSAGE = "Critical hit! {attacker} strikes {target} for {damage} damage!"
+    SNEAK_ATTACK_MESSAGE = "{attacker} performs a SNEAK ATTACK on {target} for {damage} damage!"
+
+    ABILITY_SPECS = {
+        "attack": AbilitySpec("strength", crit_chance=0.3),  # Double damage on a 30% critical hit
+        "sneak_attack": AbilitySpec("strength", multiplier=2),  # Always double damage
+    }
+
+    LEVEL_GROWTH = (8, 2, 1)  # Agile all-rounder
+
     def __init__(self, name):
         """
         Creates a Rogue with predefined stats.
@@ -201,21 +713,16 @@ class Rogue(Player):
         Attack with a random chance of critical hit.
         Critical hit = double damage (30% chance).
         """
-        crit_chance = random.randint(1, 10)  # Random value for critical hit chance
-        if crit_chance <= 3:  # Critical hit threshold
-            damage = self.strength * 2  # Double damage
-            print(f"Critical hit! {self.name} strikes {target.name} for {damage} damage!")
-        else:
-            damage = self.strength  # Normal damage
-            print(f"{self.name} attacks {target.name} for {damage} damage.")
+        ability, damage, message = self._basic_attack()  # Critical on rolls 1-3 (double damage)
+        _event_sink.on_attack(self, target, ability, damage, message)
         target.take_damage(damage)
 
     def sneak_attack(self, target):
         """
         Rogue special ability: guaranteed critical hit.
         """
-        damage = self.strength * 2  # Always double damage
-        print(f"{self.name} performs a SNEAK ATTACK on {target.name} for {damage} damage!")
+        damage = self.damage_for("sneak_attack")  # Always double damage
+        _event_sink.on_attack(self, target, "sneak_attack", damage, self.SNEAK_ATTACK_MESSAGE)
         target.take_damage(damage)
 
 
@@ -228,6 +735,8 @@ class Weapon:
     Represents a weapon that can be equipped by a character.
     """
 
+    __slots__ = ("name", "damage_bonus")
+
     def __init__(self, name, damage_bonus):
         """
         Initializes weapon with name and damage bonus.
@@ -238,6 +747,2285 @@ class Weapon:
     def display_info(self):
         """Prints weapon details."""
         print(f"Weapon: {self.name} | Damage Bonus: +{self.damage_bonus}")
+
+
+# ============================================================================
+# MULTI-ROUND BATTLES (Extends the provided SimpleBattle)
+# ============================================================================
+
+BattleResult = namedtuple("BattleResult", "winner rounds health1 health2")
+
+
+class Battle(SimpleBattle):
+    """
+    SimpleBattle that can keep fighting until one side is defeated.
+    Winners are reported as 1 (char1), 2 (char2) or 0 (tie), like BatchBattle.
+    Like every other battle type, a Battle leaves levels and stats alone
+    unless it is created with grant_experience=True.
+    """
+
+    DEFAULT_MAX_ROUNDS = 100  # Safety cap for matchups that can't finish (e.g. 0 damage)
+
+    def __init__(self, character1, character2, rng=None, grant_experience=False, effects=None):
+        """
+        Initializes the battle. If rng is given (e.g. random.Random(seed) or a
+        RollBuffer), both characters use it during fight_until_defeat.
+        With grant_experience (opt-in), a Player who defeats its opponent
+        gains experience and may level up.
+        effects is an optional StatusEffects tracker that ticks once per round.
+        """
+        super().__init__(character1, character2)
+        self.rng = rng  # Battle-wide random source, or None to keep each character's own
+        self.grant_experience = grant_experience
+        self.effects = effects
+
+    def fight_until_defeat(self, max_rounds=DEFAULT_MAX_ROUNDS, output=True):
+        """
+        Plays rounds until a character reaches 0 health or max_rounds is hit.
+        With output=False nothing is printed or formatted at all.
+        Returns a BattleResult(winner, rounds, health1, health2).
+        """
+        char1, char2 = self.char1, self.char2
+        if self.rng is not None:
+            saved_rngs = char1.rng, char2.rng
+            char1.rng = char2.rng = self.rng
+            try:
+                return self._fight(max_rounds, output)
+            finally:
+                char1.rng, char2.rng = saved_rngs
+        return self._fight(max_rounds, output)
+
+    def _fight(self, max_rounds, output):
+        """Runs fight_until_defeat with whatever rng the characters already have."""
+        char1, char2 = self.char1, self.char2
+        if output:
+            print(f"\n=== BATTLE: {char1.name} vs {char2.name} ===")
+            print("\nStarting Stats:")
+            char1.display_stats()
+            char2.display_stats()
+            rounds = self._play_rounds(max_rounds, output=True)
+        else:
+            previous = set_event_sink(quiet_sink())  # Silence console attack/damage messages too
+            try:
+                rounds = self._play_rounds(max_rounds, output=False)
+            finally:
+                set_event_sink(previous)
+
+        # Same winner rule as SimpleBattle.fight: more remaining health wins
+        if char1.health > char2.health:
+            winner = 1
+        elif char2.health > char1.health:
+            winner = 2
+        else:
+            winner = 0
+
+        result = BattleResult(winner, rounds, char1.health, char2.health)
+
+        if output:
+            print(f"\n--- Battle Results ({rounds} rounds) ---")
+            char1.display_stats()
+            char2.display_stats()
+            if winner:
+                print(f"🏆 {(char1, char2)[winner - 1].name} wins!")
+            else:
+                print("🤝 It's a tie!")
+
+        if self.grant_experience and winner:
+            victor, loser = (char1, char2) if winner == 1 else (char2, char1)
+            if loser.health == 0 and isinstance(victor, Player):  # Only defeats count, not time-outs
+                experience = experience_for_defeat(loser)
+                levels = victor.gain_experience(experience)
+                if output:
+                    print(f"{victor.name} gains {experience} EXP!" + (f" Level up to {victor.level}!" if levels else ""))
+        return result
+
+    def _play_rounds(self, max_rounds, output):
+        """Runs the round loop and returns the number of rounds played."""
+        if self.effects is not None:
+            with self.effects:
+                return self._play_effect_rounds(max_rounds, output)
+        char1, char2 = self.char1, self.char2
+        rounds = 0
+        while rounds < max_rounds and char1.health > 0 and char2.health > 0:
+            rounds += 1
+            if output:
+                print(f"\n--- Round {rounds} ---")
+                print(f"{char1.name} attacks:")
+            char1.attack(char2)  # char1 always strikes first
+
+            if char2.health > 0:  # char2 only strikes back if still standing
+                if output:
+                    print(f"\n{char2.name} attacks:")
+                char2.attack(char1)
+        return rounds
+
+    def _play_effect_rounds(self, max_rounds, output):
+        """Round loop with status effects: ticks land first, stunned characters skip their attack."""
+        char1, char2, effects = self.char1, self.char2, self.effects
+        rounds = 0
+        while rounds < max_rounds and char1.health > 0 and char2.health > 0:
+            rounds += 1
+            if output:
+                print(f"\n--- Round {rounds} ---")
+            effects.advance()
+            for attacker, defender, header in ((char1, char2, ""), (char2, char1, "\n")):
+                if attacker.health <= 0 or defender.health <= 0:
+                    break  # Ticks or the first attack ended the fight
+                if not effects.can_act(attacker):
+                    if output:
+                        print(f"{header}{attacker.name} is stunned!")
+                    continue
+                if output:
+                    print(f"{header}{attacker.name} attacks:")
+                attacker.attack(defender)
+        return rounds
+
+
+# ============================================================================
+# BATCH BATTLE ENGINE (Vectorized SimpleBattle rounds with NumPy)
+# ============================================================================
+
+# Class ids used in the columnar arrays; each id selects one attack method
+BASE_ID, WARRIOR_ID, MAGE_ID, ROGUE_ID = 0, 1, 2, 3
+
+_ATTACK_IDS = {
+    Character.attack: BASE_ID,   # strength (also used by Player)
+    Warrior.attack: WARRIOR_ID,  # strength + 5
+    Mage.attack: MAGE_ID,        # magic
+    Rogue.attack: ROGUE_ID,      # strength, doubled on a 30% critical hit
+}
+
+# Compiled attack coefficients per class id (see ability_coefficients)
+ATTACK_COEFFICIENTS = np.array(
+    [ability_coefficients(cls.ABILITY_SPECS["attack"]) for cls in (Character, Warrior, Mage, Rogue)],
+    dtype=np.int64,
+) if np is not None else None
+
+
+def attack_class_id(character):
+    """
+    Returns the batch class id matching the character's attack formula.
+    Raises TypeError for characters whose attack() the engine cannot reproduce.
+    """
+    attack = type(character).attack
+    class_id = _ATTACK_IDS.get(getattr(attack, "__wrapped__", attack))  # See through profiling wrappers
+    if class_id is None:
+        raise TypeError(f"{type(character).__name__} uses an attack the batch engine does not support")
+    return class_id
+
+
+def attack_coefficients(character):
+    """
+    Returns the batch coefficient vector for the character's basic attack.
+    Raises TypeError if the attack isn't defined by an AbilitySpec.
+    """
+    attack_class_id(character)
+    spec = getattr(type(character).DAMAGE_FORMULAS["attack"], "spec", None)
+    if spec is None:
+        raise TypeError(f"{type(character).__name__} has an attack formula the batch engine can't vectorize")
+    return ability_coefficients(spec)
+
+
+BatchResult = namedtuple("BatchResult", "winner health1 health2")
+
+
+class BatchBattle:
+    """
+    Stores N one-round battles as (2, N) NumPy arrays and resolves them all at once.
+    Row 0 holds each battle's first character, row 1 the second (as in SimpleBattle).
+    """
+
+    def __init__(self, health, strength, magic, class_id, bonus=0, coefficients=None):
+        """
+        Initializes the columns; each argument is array-like with shape (2, N).
+        bonus is the flat weapon damage bonus (a scalar applies to everyone).
+        coefficients, shape (2, N, 5), overrides the per-class attack coefficients.
+        """
+        if np is None:
+            raise ImportError("BatchBattle requires numpy")
+        self.health = np.array(health, dtype=np.int64)      # Copied so callers keep their data
+        self.strength = np.asarray(strength, dtype=np.int64)
+        self.magic = np.asarray(magic, dtype=np.int64)
+        self.class_id = np.asarray(class_id, dtype=np.int8)
+        if self.health.ndim != 2 or self.health.shape[0] != 2:
+            raise ValueError("battle columns must have shape (2, N)")
+        self.bonus = np.broadcast_to(np.asarray(bonus, dtype=np.int64), self.health.shape)
+        if coefficients is None:
+            coefficients = ATTACK_COEFFICIENTS[self.class_id]
+        self.coefficients = np.asarray(coefficients, dtype=np.int64)
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Builds a batch from (character1, character2) pairs without modifying them."""
+        sides = ([first for first, _ in pairs], [second for _, second in pairs])
+        return cls(
+            [[c.health for c in side] for side in sides],
+            [[c.strength for c in side] for side in sides],
+            [[c.magic for c in side] for side in sides],
+            [[attack_class_id(c) for c in side] for side in sides],
+            [[c.weapon_bonus() for c in side] for side in sides],
+            [[attack_coefficients(c) for c in side] for side in sides] if pairs else None,
+        )
+
+    def __len__(self):
+        """Returns the number of battles in the batch."""
+        return self.health.shape[1]
+
+    def draw_rolls(self, rng=None):
+        """
+        Draws every critical-hit roll for one round in a single call.
+        Returns a (2, N) array of values in 1..10; row k is used by side k when it is a Rogue.
+        """
+        if rng is None or isinstance(rng, (int, np.integer)):
+            rng = np.random.default_rng(rng)
+        return rng.integers(1, 11, size=self.health.shape)
+
+    def _damage(self, side, rolls):
+        """
+        Returns the attack damage dealt by every character on one side,
+        evaluated from the coefficient vectors without per-class branches.
+        """
+        strength_coef, magic_coef, bonus, threshold, crit_multiplier = np.moveaxis(self.coefficients[side], -1, 0)
+        scaled = self.strength[side] * strength_coef + self.magic[side] * magic_coef
+        crit = rolls[side] <= threshold  # Threshold 0 never crits
+        return scaled * np.where(crit, crit_multiplier, 1) + bonus + self.bonus[side]
+
+    def resolve_round(self, rolls):
+        """
+        Plays one round in every battle: side 0 attacks, then side 1 attacks if still alive.
+        """
+        health = self.health
+        health[1] = np.maximum(health[1] - self._damage(0, rolls), 0)
+        counter = np.where(health[1] > 0, self._damage(1, rolls), 0)  # Defeated characters don't swing
+        health[0] = np.maximum(health[0] - counter, 0)
+
+    def fight(self, rng=None, rolls=None):
+        """
+        Resolves one round like SimpleBattle.fight and returns a BatchResult.
+        winner is 1 or 2 for the side with more health left, 0 for a tie.
+        rng may be a seed or numpy Generator; rolls overrides it with explicit (2, N) rolls.
+        """
+        if rolls is None:
+            rolls = self.draw_rolls(rng)
+        self.resolve_round(np.asarray(rolls))
+        health1, health2 = self.health
+        winner = np.where(health1 > health2, 1, np.where(health2 > health1, 2, 0)).astype(np.int8)
+        return BatchResult(winner, health1.copy(), health2.copy())
+
+
+# ============================================================================
+# OUTCOME PREDICTION (Exact probabilities instead of simulation)
+# ============================================================================
+
+Prediction = namedtuple("Prediction", "win tie loss expected_rounds")
+
+
+def attack_damage_distribution(character):
+    """
+    Returns the character's attack damage as ((damage, probability), ...).
+    Classes with a crit chance (Rogue: 30%) have a second, critical outcome.
+    """
+    attack_class_id(character)  # Rejects attacks we can't model
+    table = character.damage_table()
+    if character.CRIT_THRESHOLD:
+        chance = character.CRIT_THRESHOLD / CRIT_DIE
+        return ((table["critical_attack"], chance), (table["attack"], 1.0 - chance))
+    return ((table["attack"], 1.0),)
+
+
+@lru_cache(maxsize=None)
+def _predict(health1, damage1, health2, damage2, max_rounds):
+    """
+    Dynamic program over (health1, health2) states, one round at a time.
+    Arguments are plain tuples so results are memoized on the stats alone.
+    """
+    win = tie = loss = expected_rounds = 0.0
+    states = {(health1, health2): 1.0} if health1 > 0 and health2 > 0 else {}
+    rounds = 0
+
+    while states and rounds < max_rounds:
+        rounds += 1
+        next_states = defaultdict(float)
+        for (h1, h2), chance in states.items():
+            for hit1, p1 in damage1:  # char1 strikes first
+                left2 = max(h2 - hit1, 0)
+                if left2 == 0:
+                    win += chance * p1
+                    expected_rounds += chance * p1 * rounds
+                    continue
+                for hit2, p2 in damage2:  # char2 strikes back while standing
+                    left1 = max(h1 - hit2, 0)
+                    if left1 == 0:
+                        loss += chance * p1 * p2
+                        expected_rounds += chance * p1 * p2 * rounds
+                    else:
+                        next_states[(left1, left2)] += chance * p1 * p2
+        states = next_states
+
+    # Fights still running at the cap (or never started) are decided on health
+    if not states and rounds == 0:
+        states = {(health1, health2): 1.0}
+    for (h1, h2), chance in states.items():
+        if h1 > h2:
+            win += chance
+        elif h2 > h1:
+            loss += chance
+        else:
+            tie += chance
+        expected_rounds += chance * rounds
+    return Prediction(win, tie, loss, expected_rounds)
+
+
+def predict_outcome(char1, char2, max_rounds=Battle.DEFAULT_MAX_ROUNDS):
+    """
+    Returns the exact Prediction(win, tie, loss, expected_rounds) for
+    Battle(char1, char2).fight_until_defeat(max_rounds), from char1's side.
+    Repeated queries with the same stats are answered from a cache.
+    """
+    return _predict(char1.health, attack_damage_distribution(char1),
+                    char2.health, attack_damage_distribution(char2), max_rounds)
+
+
+# ============================================================================
+# ROUND-ROBIN TOURNAMENTS (Parallel with a process pool)
+# ============================================================================
+
+Standing = namedtuple("Standing", "index name wins losses ties points")
+
+POINTS_PER_WIN = 3   # Standings points for a win
+POINTS_PER_TIE = 1   # Standings points for a tie
+
+_worker_roster = None  # Roster shared with each worker process by the initializer
+
+
+def matchup_seed(seed, index1, index2):
+    """
+    Returns the RNG seed for one matchup.
+    It only depends on the tournament seed and the two roster indexes, so
+    results are identical no matter which worker (or how many) plays it.
+    """
+    return f"{seed}:{index1}:{index2}"
+
+
+def _init_tournament_worker(roster):
+    """Stores the roster once per worker instead of once per shard."""
+    global _worker_roster
+    _worker_roster = roster
+
+
+def _play_matchups(matchups, seed, max_rounds):
+    """
+    Plays a shard of (index1, index2) matchups on fresh copies of the characters.
+    Returns a list of (index1, index2, winner) tuples.
+    """
+    roster = _worker_roster
+    results = []
+    for index1, index2 in matchups:
+        rng = random.Random(matchup_seed(seed, index1, index2))  # Private RNG per matchup
+        battle = Battle(copy.copy(roster[index1]), copy.copy(roster[index2]), rng=rng)
+        result = battle.fight_until_defeat(max_rounds=max_rounds, output=False)
+        results.append((index1, index2, result.winner))
+    return results
+
+
+def _shard(items, count):
+    """Splits a list into at most count contiguous, nearly equal shards."""
+    size = -(-len(items) // count) if items else 1  # Ceiling division
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def run_tournament(roster, workers=None, seed=0, max_rounds=Battle.DEFAULT_MAX_ROUNDS):
+    """
+    Plays every pair in the roster once (round robin) and returns the standings.
+
+    Matchups are sharded across a ProcessPoolExecutor with `workers` processes
+    (defaults to the CPU count; 1 or less plays everything in this process).
+    The roster characters themselves are never modified.
+    Returns a list of Standing tuples sorted by points, then wins, then roster order.
+    """
+    roster = list(roster)
+    matchups = [(i, j) for i in range(len(roster)) for j in range(i + 1, len(roster))]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        try:
+            _init_tournament_worker(roster)
+            results = _play_matchups(matchups, seed, max_rounds)
+        finally:
+            _init_tournament_worker(None)
+    else:
+        # Several shards per worker keeps every process busy until the end
+        shards = _shard(matchups, workers * 4)
+        with ProcessPoolExecutor(workers, initializer=_init_tournament_worker, initargs=(roster,)) as pool:
+            futures = [pool.submit(_play_matchups, shard, seed, max_rounds) for shard in shards]
+            results = [row for future in futures for row in future.result()]
+
+    # Merge matchup results into per-character records
+    records = [[0, 0, 0] for _ in roster]  # wins, losses, ties
+    for index1, index2, winner in results:
+        if winner == 1:
+            records[index1][0] += 1
+            records[index2][1] += 1
+        elif winner == 2:
+            records[index2][0] += 1
+            records[index1][1] += 1
+        else:
+            records[index1][2] += 1
+            records[index2][2] += 1
+
+    standings = [
+        Standing(index, roster[index].name, wins, losses, ties, wins * POINTS_PER_WIN + ties * POINTS_PER_TIE)
+        for index, (wins, losses, ties) in enumerate(records)
+    ]
+    standings.sort(key=lambda row: (-row.points, -row.wins, row.index))
+    return standings
+
+
+# ============================================================================
+# ABILITY PROFILING (Opt-in call counts, timing and damage histograms)
+# ============================================================================
+
+PROFILED_ABILITIES = ("attack", "power_strike", "fireball", "sneak_attack")
+DAMAGE_BUCKETS = (5, 10, 20, 30, 50, 100)  # Prometheus histogram upper bounds
+
+_active_profiler = None  # Only one profiler may patch the classes at a time
+
+
+class AbilityProfiler:
+    """
+    Records calls, cumulative wall time and damage per (class, ability).
+
+    Enabling swaps the ability methods on the classes for timing wrappers and
+    disabling puts the originals back, so there is no cost while disabled.
+    Damage is the health the target actually lost (after clamping at 0).
+    Use as a context manager or call enable()/disable().
+    """
+
+    def __init__(self, classes=None, abilities=PROFILED_ABILITIES):
+        """
+        Prepares a profiler for the given classes (default: the built-in hierarchy).
+        """
+        self.classes = list(classes) if classes is not None else [Character, Warrior, Mage, Rogue]
+        self.abilities = abilities
+        self.stats = {}       # (class name, ability) -> [calls, seconds, {damage: count}]
+        self._originals = []  # (class, ability, original function) to restore on disable
+
+    def _wrap(self, ability, function):
+        """Returns a timing wrapper for one ability method."""
+        stats = self.stats
+        clock = time.perf_counter
+
+        @wraps(function)
+        def profiled(character, target, *args, **kwargs):
+            health = target.health
+            start = clock()
+            result = function(character, target, *args, **kwargs)
+            elapsed = clock() - start
+            record = stats.get((type(character).__name__, ability))
+            if record is None:
+                record = stats[(type(character).__name__, ability)] = [0, 0.0, {}]
+            record[0] += 1
+            record[1] += elapsed
+            damage = health - target.health
+            record[2][damage] = record[2].get(damage, 0) + 1
+            return result
+        return profiled
+
+    def enable(self):
+        """Installs the profiling wrappers. Returns self."""
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("another AbilityProfiler is already enabled")
+        for cls in self.classes:
+            for ability in self.abilities:
+                function = cls.__dict__.get(ability)  # Only methods the class defines itself
+                if function is not None:
+                    self._originals.append((cls, ability, function))
+                    setattr(cls, ability, self._wrap(ability, function))
+        _active_profiler = self
+        return self
+
+    def disable(self):
+        """Restores the original methods; collected stats are kept."""
+        global _active_profiler
+        for cls, ability, function in reversed(self._originals):
+            setattr(cls, ability, function)
+        self._originals.clear()
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.disable()
+
+    def reset(self):
+        """Clears all collected stats."""
+        self.stats.clear()
+
+    def as_dict(self):
+        """
+        Returns {class name: {ability: {"calls", "seconds", "damage_total", "damage_histogram"}}}.
+        """
+        report = {}
+        for (class_name, ability), (calls, seconds, histogram) in sorted(self.stats.items()):
+            report.setdefault(class_name, {})[ability] = {
+                "calls": calls,
+                "seconds": seconds,
+                "damage_total": sum(damage * count for damage, count in histogram.items()),
+                "damage_histogram": dict(sorted(histogram.items())),
+            }
+        return report
+
+    def to_prometheus(self, prefix="character_ability"):
+        """Returns the stats in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_calls_total Ability uses.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        report = self.as_dict()
+        rows = [(cls, ability, data) for cls, abilities in report.items() for ability, data in abilities.items()]
+        for cls, ability, data in rows:
+            lines.append(f'{prefix}_calls_total{{class="{cls}",ability="{ability}"}} {data["calls"]}')
+        lines += [f"# HELP {prefix}_seconds_total Wall time spent in abilities.",
+                  f"# TYPE {prefix}_seconds_total counter"]
+        for cls, ability, data in rows:
+            lines.append(f'{prefix}_seconds_total{{class="{cls}",ability="{ability}"}} {data["seconds"]:.9f}')
+        lines += [f"# HELP {prefix}_damage Damage dealt per ability use.",
+                  f"# TYPE {prefix}_damage histogram"]
+        for cls, ability, data in rows:
+            labels = f'class="{cls}",ability="{ability}"'
+            histogram = data["damage_histogram"]
+            for bound in DAMAGE_BUCKETS:
+                count = sum(n for damage, n in histogram.items() if damage <= bound)
+                lines.append(f'{prefix}_damage_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{prefix}_damage_bucket{{{labels},le="+Inf"}} {data["calls"]}')
+            lines.append(f"{prefix}_damage_sum{{{labels}}} {data['damage_total']}")
+            lines.append(f"{prefix}_damage_count{{{labels}}} {data['calls']}")
+        return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# LIVE ENCOUNTERS (asyncio scheduler for many concurrent battles)
+# ============================================================================
+
+COMBAT_ABILITIES = ("attack", "power_strike", "fireball", "sneak_attack")  # Actions a controller may pick
+
+
+class InputController:
+    """
+    Controller fed by player input: each put() queues one ability name.
+    Encounters await the next queued choice (with the encounter's timeout).
+    """
+
+    def __init__(self):
+        """Creates an empty input queue."""
+        self.queue = asyncio.Queue()
+
+    def put(self, ability):
+        """Queues the player's next action."""
+        self.queue.put_nowait(ability)
+
+    async def __call__(self, actor, opponent):
+        """Waits for the player's next action."""
+        return await self.queue.get()
+
+
+class Encounter:
+    """
+    One live fight, played one turn at a time by an EncounterScheduler.
+    Rules match Battle.fight_until_defeat; controllers may pick special abilities.
+    """
+
+    def __init__(self, character1, character2, controllers=(None, None),
+                 input_timeout=1.0, max_rounds=Battle.DEFAULT_MAX_ROUNDS, effects=None, cooldowns=None):
+        """
+        controllers holds an optional async callable per side, called as
+        controller(actor, opponent) and returning an ability name. Sides
+        without a controller (or that time out) use a basic attack.
+        effects is an optional StatusEffects tracker owned by this encounter.
+        cooldowns is an optional CooldownManager; abilities that aren't ready
+        fall back to a basic attack. Its turn numbers are the round numbers.
+        """
+        self.char1 = character1
+        self.char2 = character2
+        self.controllers = controllers
+        self.input_timeout = input_timeout  # Seconds to wait for a controller's choice
+        self.max_rounds = max_rounds
+        self.effects = effects
+        self.cooldowns = cooldowns
+        self.turns_taken = 0                # Actions performed so far
+        self.input_wait = 0.0               # Seconds spent waiting for controllers
+        self.result = None                  # BattleResult once the encounter is over
+
+    async def _choose(self, side, actor, opponent):
+        """Returns the ability the side uses this turn."""
+        controller = self.controllers[side]
+        if controller is None:
+            return "attack"
+        start = time.perf_counter()
+        try:
+            ability = await asyncio.wait_for(controller(actor, opponent), self.input_timeout)
+        except asyncio.TimeoutError:
+            return "attack"  # Idle players fall back to a basic attack
+        finally:
+            self.input_wait += time.perf_counter() - start
+        if ability in COMBAT_ABILITIES and hasattr(actor, ability):
+            return ability
+        return "attack"  # Unknown or foreign abilities are ignored
+
+    async def turns(self):
+        """
+        Async generator that plays the encounter, yielding the ability used
+        after every turn so the scheduler can interleave other encounters.
+        Stunned turns yield STUN.
+        """
+        fighters = (self.char1, self.char2)
+        char1, char2 = fighters
+        effects = self.effects
+        rounds = 0
+        while rounds < self.max_rounds and char1.health > 0 and char2.health > 0:
+            rounds += 1
+            if effects is not None:
+                effects.advance()  # Applied directly: interleaved encounters share the global sink
+            for side in (0, 1):
+                actor, opponent = fighters[side], fighters[1 - side]
+                if actor.health <= 0 or opponent.health <= 0:
+                    break  # A defeated character doesn't strike back
+                if effects is not None and not effects.can_act(actor):
+                    yield STUN
+                    continue
+                ability = await self._choose(side, actor, opponent)
+                if self.cooldowns is not None and not self.cooldowns.use(actor, ability, rounds):
+                    ability = "attack"  # On cooldown or out of mana/stamina
+                getattr(actor, ability)(opponent)
+                if effects is not None:
+                    effects.apply_ability(ability, opponent)
+                self.turns_taken += 1
+                yield ability
+
+        winner = 1 if char1.health > char2.health else 2 if char2.health > char1.health else 0
+        self.result = BattleResult(winner, rounds, char1.health, char2.health)
+
+
+class EncounterScheduler:
+    """
+    Multiplexes many Encounters on one event loop.
+    Each encounter runs as its own task and yields to the loop after every
+    turn, so ready encounters take turns in FIFO order (the order they were
+    added, to start with) and one waiting on player input never holds up
+    the others. A tick is one encounter turn; its latency runs from the end
+    of the encounter's previous turn and excludes its own input wait.
+    """
+
+    def __init__(self, sink=NULL_SINK):
+        """Creates a scheduler; combat events go to sink while it runs."""
+        self.sink = sink
+        self.encounters = []     # Every encounter ever added
+        self.tick_latencies = [] # Seconds per tick, input waits excluded
+
+    def add(self, encounter):
+        """Adds an encounter and returns it."""
+        self.encounters.append(encounter)
+        return encounter
+
+    async def run(self):
+        """Plays every encounter to completion and returns their BattleResults."""
+        previous = set_event_sink(self.sink)
+        try:
+            tasks = [asyncio.ensure_future(self._play(encounter))
+                     for encounter in self.encounters if encounter.result is None]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()  # Don't leave encounters running on a restored sink
+                raise
+        finally:
+            set_event_sink(previous)
+        return [encounter.result for encounter in self.encounters]
+
+    async def _play(self, encounter):
+        """Plays one encounter to completion, timing each of its turns."""
+        clock, latencies = time.perf_counter, self.tick_latencies
+        start, waited = clock(), encounter.input_wait
+        async for _ in encounter.turns():
+            latencies.append(clock() - start - (encounter.input_wait - waited))
+            start, waited = clock(), encounter.input_wait
+            await asyncio.sleep(0)  # Back of the queue: every other ready encounter goes first
+
+    def latency_summary(self):
+        """Returns {"ticks", "mean", "p50", "p99", "max"} tick latencies in seconds."""
+        latencies = sorted(self.tick_latencies)
+        if not latencies:
+            return {"ticks": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        last = len(latencies) - 1
+        return {
+            "ticks": len(latencies),
+            "mean": sum(latencies) / len(latencies),
+            "p50": latencies[last // 2],
+            "p99": latencies[round(last * 0.99)],
+            "max": latencies[last],
+        }
+
+
+# ============================================================================
+# PARTY BATTLES (N vs M with an indexed target selection)
+# ============================================================================
+
+TARGET_POLICIES = {
+    "lowest_health": lambda character: character.health,    # Finish off the weakest enemy
+    "highest_health": lambda character: -character.health,  # Wear down the toughest enemy
+}
+
+PartyResult = namedtuple("PartyResult", "winner rounds survivors1 survivors2")
+
+
+class TargetIndex:
+    """
+    The living members of one side, kept in a heap ordered by a policy key.
+
+    Entries are never searched or removed in place: after a member's health
+    changes a fresh entry is pushed, and stale entries (old key or defeated
+    member) are discarded when they reach the top of the heap.
+    """
+
+    def __init__(self, members, key):
+        """Indexes the members that are still alive."""
+        self.key = key
+        self.alive = {}  # character -> position in the party (insertion ordered)
+        self._heap = []
+        for position, character in enumerate(members):
+            if character.health > 0:
+                self.alive[character] = position
+                self._heap.append((key(character), position, character))
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        """Returns the number of living members."""
+        return len(self.alive)
+
+    def update(self, character):
+        """Re-indexes a member after its health changed; defeated members drop out."""
+        position = self.alive.get(character)
+        if position is None:
+            return
+        if character.health <= 0:
+            del self.alive[character]  # O(1); its heap entries are now stale
+        else:
+            heapq.heappush(self._heap, (self.key(character), position, character))
+
+    def best(self):
+        """Returns the living member the policy prefers, or None if everyone is defeated."""
+        heap = self._heap
+        while heap:
+            key, position, character = heap[0]
+            if character in self.alive and key == self.key(character):
+                return character
+            heapq.heappop(heap)  # Stale entry
+        return None
+
+
+class PartyBattle:
+    """
+    Battle between two parties of any size.
+    Each round every living member of party 1 attacks, then every living
+    member of party 2, each picking its target with the chosen policy.
+    """
+
+    def __init__(self, party1, party2, policy="lowest_health"):
+        """
+        Creates the battle; policy is a name from TARGET_POLICIES.
+        """
+        if policy not in TARGET_POLICIES:
+            raise ValueError(f"unknown target policy: {policy}")
+        self.party1 = list(party1)
+        self.party2 = list(party2)
+        self.policy = policy
+
+    def _volley(self, attackers, defenders):
+        """Every living attacker strikes the defenders' preferred target."""
+        for attacker in list(attackers.alive):
+            if attacker.health <= 0:
+                continue
+            target = defenders.best()
+            if target is None:
+                return
+            attacker.attack(target)
+            defenders.update(target)
+
+    def fight(self, max_rounds=Battle.DEFAULT_MAX_ROUNDS, output=False):
+        """
+        Plays rounds until one party is wiped out or max_rounds is reached.
+        Returns PartyResult(winner, rounds, survivors1, survivors2) where winner
+        is 1, 2 or 0 (tie) by number of survivors, then by total health.
+        """
+        key = TARGET_POLICIES[self.policy]
+        side1 = TargetIndex(self.party1, key)
+        side2 = TargetIndex(self.party2, key)
+
+        previous = set_event_sink(get_event_sink() if output else quiet_sink())
+        try:
+            rounds = 0
+            while rounds < max_rounds and side1 and side2:
+                rounds += 1
+                if output:
+                    print(f"\n--- Party Round {rounds} ---")
+                self._volley(side1, side2)
+                self._volley(side2, side1)
+        finally:
+            set_event_sink(previous)
+
+        survivors1 = [c for c in self.party1 if c.health > 0]
+        survivors2 = [c for c in self.party2 if c.health > 0]
+        score1 = (len(survivors1), sum(c.health for c in survivors1))
+        score2 = (len(survivors2), sum(c.health for c in survivors2))
+        winner = 1 if score1 > score2 else 2 if score2 > score1 else 0
+        if output:
+            print(f"🏆 Party {winner} wins!" if winner else "🤝 It's a tie!")
+        return PartyResult(winner, rounds, survivors1, survivors2)
+
+
+# ============================================================================
+# ROSTER FILES (Compact binary snapshots of Player objects)
+# ============================================================================
+
+# Classes rebuilt from their character_class string; anything else loads as Player
+PLAYER_CLASSES = {"Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+
+ROSTER_MAGIC = b"RSTR"
+ROSTER_VERSION = 1
+# magic, version, reserved, player count, string count, offset of the string table
+ROSTER_HEADER = struct.Struct("<4sHHIIQ")
+# name index, class index, health, strength, magic, level, experience
+ROSTER_RECORD = struct.Struct("<IIiiiii")
+
+
+def _build_player(name, character_class, health, strength, magic, level, experience, cls=None):
+    """
+    Recreates a Player from stored fields. The class is cls when given,
+    otherwise the one registered for character_class (or Player).
+    """
+    if cls is None:
+        cls = PLAYER_CLASSES.get(character_class, Player)
+    player = cls.__new__(cls)  # Skip the subclass's fixed starting stats
+    Player.__init__(player, name, character_class, health, strength, magic)
+    player.level = level
+    player.experience = experience
+    return player
+
+
+def save_roster(path, players):
+    """
+    Writes players to a binary roster file.
+
+    Layout: header, one fixed-width record per player, then a table of
+    string offsets and the UTF-8 string blob. Names and class names are
+    interned, so repeated strings are stored once. Equipped weapons are not
+    saved. Returns the number of players written.
+    """
+    strings = {}  # string -> index in the string table
+    records = []
+    for player in players:
+        if not isinstance(player, Player):
+            raise TypeError(f"only Player objects can be saved, got {type(player).__name__}")
+        name_index = strings.setdefault(player.name, len(strings))
+        class_index = strings.setdefault(player.character_class, len(strings))
+        records.append(ROSTER_RECORD.pack(name_index, class_index, player.health, player.strength,
+                                          player.magic, player.level, player.experience))
+
+    encoded = [text.encode("utf-8") for text in strings]  # Dicts keep insertion (index) order
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    string_table = ROSTER_HEADER.size + ROSTER_RECORD.size * len(records)
+
+    with open(path, "wb") as handle:
+        handle.write(ROSTER_HEADER.pack(ROSTER_MAGIC, ROSTER_VERSION, 0, len(records), len(encoded), string_table))
+        handle.write(b"".join(records))
+        handle.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        handle.write(b"".join(encoded))
+    return len(records)
+
+
+def _read_header(buffer):
+    """Validates the header and returns (count, string count, string table offset)."""
+    magic, version, _, count, string_count, string_table = ROSTER_HEADER.unpack_from(buffer, 0)
+    if magic != ROSTER_MAGIC:
+        raise ValueError("not a roster file")
+    if version != ROSTER_VERSION:
+        raise ValueError(f"unsupported roster version {version}")
+    return count, string_count, string_table
+
+
+def load_roster(path):
+    """Reads a whole roster file and returns a list of Player objects."""
+    with open(path, "rb") as handle:
+        buffer = handle.read()
+    count, string_count, string_table = _read_header(buffer)
+
+    offsets = struct.unpack_from(f"<{string_count + 1}Q", buffer, string_table)
+    blob = string_table + 8 * (string_count + 1)
+    strings = [buffer[blob + offsets[i]:blob + offsets[i + 1]].decode("utf-8") for i in range(string_count)]
+
+    records = memoryview(buffer)[ROSTER_HEADER.size:string_table]
+    return [
+        _build_player(strings[name], strings[cls], health, strength, magic, level, experience)
+        for name, cls, health, strength, magic, level, experience in ROSTER_RECORD.iter_unpack(records)
+    ]
+
+
+class RosterView:
+    """
+    Read-only, memory-mapped view of a roster file.
+    Opening is O(1); each player is decoded only when it is accessed.
+    """
+
+    def __init__(self, path):
+        """Maps the file into memory."""
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._count, self._string_count, self._string_table = _read_header(self._map)
+        except Exception:
+            self._file.close()
+            raise
+        self._blob = self._string_table + 8 * (self._string_count + 1)
+
+    def __len__(self):
+        """Returns the number of players in the file."""
+        return self._count
+
+    def _string(self, index):
+        """Decodes one string from the string table."""
+        start, end = struct.unpack_from("<2Q", self._map, self._string_table + 8 * index)
+        return self._map[self._blob + start:self._blob + end].decode("utf-8")
+
+    def record(self, index):
+        """
+        Returns the raw fields of one player as a tuple
+        (name, character_class, health, strength, magic, level, experience).
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("roster index out of range")
+        name, cls, *stats = ROSTER_RECORD.unpack_from(self._map, ROSTER_HEADER.size + ROSTER_RECORD.size * index)
+        return (self._string(name), self._string(cls), *stats)
+
+    def __getitem__(self, index):
+        """Builds the Player object at index (negative indexes count from the end)."""
+        if index < 0:
+            index += self._count
+        return _build_player(*self.record(index))
+
+    def __iter__(self):
+        """Yields every player in file order."""
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        """Unmaps and closes the file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def open_roster(path):
+    """Opens a roster file for lazy, read-only access (see RosterView)."""
+    return RosterView(path)
+
+
+# ============================================================================
+# BATTLE LOGS (Streaming compressed JSONL writer and lazy replay)
+# ============================================================================
+
+class BattleLogWriter:
+    """
+    Event sink that appends every attack and damage event to a gzip JSONL file.
+
+    Records are buffered and written batch_size at a time. Characters get a
+    numeric id and a "character" record (name, class, health) the first time
+    they appear. Each attack starts a new turn; damage records share the turn
+    of the attack that caused them.
+
+    Used as a context manager it installs itself as the event sink and
+    restores the previous sink (and closes the file) on exit.
+    """
+
+    def __init__(self, path, batch_size=1000):
+        """Creates (or truncates) the log file."""
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self.batch_size = batch_size  # Records per write
+        self.turn = 0                 # Number of attacks logged so far
+        self._ids = {}                # character -> id
+        self._pending = []            # Encoded records waiting to be written
+        self._previous_sink = None
+
+    def _write(self, record):
+        """Buffers one record and flushes when the batch is full."""
+        self._pending.append(json.dumps(record, separators=(",", ":")))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def _id(self, character, health):
+        """Returns the character's id, logging a character record the first time."""
+        ident = self._ids.get(character)
+        if ident is None:
+            ident = self._ids[character] = len(self._ids)
+            self._write({"e": "character", "turn": self.turn, "id": ident, "name": character.name,
+                         "class": getattr(character, "character_class", type(character).__name__),
+                         "health": health})
+        return ident
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Logs an attack and starts a new turn."""
+        attacker_id = self._id(attacker, attacker.health)
+        target_id = self._id(target, target.health)  # Damage hasn't been applied yet
+        self.turn += 1
+        self._write({"e": "attack", "turn": self.turn, "attacker": attacker_id, "target": target_id,
+                     "ability": ability, "damage": damage})
+
+    def on_damage(self, target, damage, health):
+        """Logs damage with the health that resulted from it."""
+        # A target seen for the first time here had health + damage, unless the hit was clamped
+        target_id = self._id(target, health + damage if health > 0 else None)
+        self._write({"e": "damage", "turn": self.turn, "target": target_id, "damage": damage, "health": health})
+
+    def flush(self):
+        """Writes all buffered records."""
+        if self._pending:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+
+    def close(self):
+        """Flushes and closes the log."""
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        self._previous_sink = set_event_sink(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        set_event_sink(self._previous_sink)
+        self.close()
+
+
+def read_battle_log(path):
+    """Yields the records of a battle log one at a time, as dicts."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def replay_health(path):
+    """
+    Lazily replays a battle log, yielding (turn, {character id: health})
+    after each turn. The dict is updated in place between yields.
+    """
+    health = {}
+    turn = 0
+    for record in read_battle_log(path):
+        if record["turn"] != turn:
+            yield turn, health
+            turn = record["turn"]
+        if record["e"] == "character":
+            health[record["id"]] = record["health"]
+        elif record["e"] == "damage":
+            health[record["target"]] = record["health"]
+    yield turn, health
+
+
+def health_at(path, character, turn):
+    """
+    Returns a character's health after the given turn (0 = before any attack).
+    character is a log id or a name (the first character logged with it).
+    Returns None if the character hadn't appeared in the log by then.
+    """
+    ident = character if isinstance(character, int) else None
+    health = None
+    for record in read_battle_log(path):
+        if record["turn"] > turn:
+            break  # The rest of the file is never read
+        kind = record["e"]
+        if kind == "character" and ident is None and record["name"] == character:
+            ident = record["id"]
+        if kind == "character" and record["id"] == ident:
+            health = record["health"]
+        elif kind == "damage" and record["target"] == ident:
+            health = record["health"]
+    return health
+
+
+# ============================================================================
+# DETERMINISTIC REPLAY (Seed + action list fully describe a battle)
+# ============================================================================
+
+# ability_specs is ((ability, AbilitySpec fields), ...): the class's damage behaviour as plain data,
+# so records can be pickled or written to JSON and still replay defined and tuned classes exactly
+FighterSpec = namedtuple("FighterSpec", "character_class name health strength magic weapon_bonus ability_specs")
+BattleRecord = namedtuple("BattleRecord", "fighters seed actions")
+Replay = namedtuple("Replay", "health1 health2 turns")
+
+_REPLAY_CLASSES = {}  # (base class, ability specs) -> class rebuilt for replays
+
+
+def fighter_spec(character):
+    """
+    Snapshots the class name, ability specs and stats a replay needs from a
+    Player. Raises ValueError for characters whose damage isn't described
+    by ability specs (custom attack methods or callable formulas).
+    """
+    try:
+        attack_class_id(character)
+    except TypeError:
+        raise ValueError(f"{character.name}'s attack can't be recorded as data") from None
+    if any(getattr(formula, "spec", None) is None for formula in character.DAMAGE_FORMULAS.values()):
+        raise ValueError(f"{character.name} uses damage formulas that can't be recorded as data")
+    specs = tuple((ability, tuple(spec)) for ability, spec in sorted(character.ABILITY_SPECS.items()))
+    return FighterSpec(character.character_class, character.name, character.health,
+                       character.strength, character.magic, character.weapon_bonus(), specs)
+
+
+def _replay_class(spec, registry):
+    """
+    Resolves a FighterSpec's class: the registry's class for its name (plain
+    Player for unregistered names, e.g. factory-defined classes), given the
+    recorded ability specs when they differ from the class's own.
+    """
+    base = (PLAYER_CLASSES if registry is None else registry).get(spec.character_class, Player)
+    specs = {ability: AbilitySpec(*fields) for ability, fields in spec.ability_specs}
+    if specs == base.ABILITY_SPECS:
+        return base
+    key = (base, tuple(sorted(specs.items())))
+    cls = _REPLAY_CLASSES.get(key)
+    if cls is None:
+        cls = _REPLAY_CLASSES[key] = type(base.__name__, (base,), {"__slots__": (), "ABILITY_SPECS": specs})
+    return cls
+
+
+def _build_fighter(spec, registry=None):
+    """Creates a fresh Player from a FighterSpec, resolving its class through registry (default PLAYER_CLASSES)."""
+    fighter = _build_player(spec.name, spec.character_class, spec.health, spec.strength, spec.magic, 1, 0,
+                            _replay_class(spec, registry))
+    if spec.weapon_bonus:
+        fighter.equip(Weapon("Recorded weapon", spec.weapon_bonus))
+    return fighter
+
+
+def record_battle(char1, char2, seed, actions=None, max_rounds=Battle.DEFAULT_MAX_ROUNDS, registry=None):
+    """
+    Returns a BattleRecord for a fight between the two characters.
+
+    actions is an ordered list of (side, ability) with side 0 for char1 and
+    1 for char2. By default it is the Battle.fight_until_defeat order: both
+    sides alternate basic attacks, char1 first, for max_rounds rounds.
+    The battle stops at the first defeat; later actions are ignored.
+    registry ({class name: class}, default PLAYER_CLASSES) is what the
+    record will be replayed with; actions are checked against it.
+    """
+    if actions is None:
+        actions = [(side, "attack") for _ in range(max_rounds) for side in (0, 1)]
+    record = BattleRecord((fighter_spec(char1), fighter_spec(char2)), seed, tuple(map(tuple, actions)))
+    fighters = [_build_fighter(spec, registry) for spec in record.fighters]
+    for side, ability in record.actions:
+        if side not in (0, 1) or ability not in COMBAT_ABILITIES or not hasattr(fighters[side], ability):
+            raise ValueError(f"invalid action for side {side}: {ability}")
+    return record
+
+
+def play_record(record, output=False, registry=None):
+    """
+    Re-runs a BattleRecord with real character objects and returns a Replay.
+    With output=True the usual attack messages are printed. Class names
+    resolve through registry (default PLAYER_CLASSES).
+    """
+    fighters = [_build_fighter(spec, registry) for spec in record.fighters]
+    rng = random.Random(record.seed)
+    for fighter in fighters:
+        fighter.rng = rng  # Both sides draw from one seeded stream, in action order
+
+    previous = set_event_sink(get_event_sink() if output else quiet_sink())
+    turns = 0
+    try:
+        for side, ability in record.actions:
+            if fighters[0].health <= 0 or fighters[1].health <= 0:
+                break
+            getattr(fighters[side], ability)(fighters[1 - side])
+            turns += 1
+    finally:
+        set_event_sink(previous)
+    return Replay(fighters[0].health, fighters[1].health, turns)
+
+
+def fast_forward(record, turn=None, registry=None):
+    """
+    Simulates a BattleRecord up to `turn` actions (default: all) using only
+    integer arithmetic on precomputed damage tables: no events, no output
+    and no per-turn objects. Gives the same Replay as play_record.
+    """
+    fighters = [_build_fighter(spec, registry) for spec in record.fighters]
+    tables = [fighter.damage_table() for fighter in fighters]
+    # Basic attacks roll 1..CRIT_DIE and crit at or below the threshold; classes without crits never roll
+    for fighter in fighters:
+        attack_class_id(fighter)  # Rejects attacks we can't model
+    thresholds = [fighter.CRIT_THRESHOLD for fighter in fighters]
+    health = [spec.health for spec in record.fighters]
+    randint = random.Random(record.seed).randint
+
+    turns = 0
+    actions = record.actions if turn is None else record.actions[:turn]
+    for side, ability in actions:
+        if health[0] <= 0 or health[1] <= 0:
+            break
+        if ability == "attack" and thresholds[side]:
+            ability = "critical_attack" if randint(1, CRIT_DIE) <= thresholds[side] else "attack"
+        other = 1 - side
+        health[other] = max(health[other] - tables[side][ability], 0)
+        turns += 1
+    return Replay(health[0], health[1], turns)
+
+
+# ============================================================================
+# LEVELING (Bulk experience awards across a roster)
+# ============================================================================
+
+_XP_ARRAY = np.array(XP_TABLE, dtype=np.int64) if np is not None else None
+
+
+def award_experience(players, amounts):
+    """
+    Adds experience to many players at once and applies their level growth.
+
+    amounts is one value per player (or a single value for everyone);
+    fractional amounts are kept exactly, with or without numpy.
+    New levels for the whole roster are found in one vectorized
+    searchsorted over the XP table (bisect per player without numpy);
+    objects are then updated in a single write-back pass.
+    Returns the list of levels gained per player.
+    """
+    players = list(players)
+    if isinstance(amounts, (int, float)):
+        amounts = [amounts] * len(players)
+
+    if np is not None:
+        gains = np.asarray(amounts)
+        if gains.shape != (len(players),):
+            raise ValueError("need one experience amount per player")
+        if (gains < 0).any():
+            raise ValueError("experience can't be negative")
+        current = np.array([p.experience for p in players])
+        dtype = np.result_type(current.dtype, gains.dtype, np.int64)  # Fractional experience is never truncated
+        experience = current.astype(dtype) + gains.astype(dtype)
+        old_levels = np.fromiter((p.level for p in players), dtype=np.int64, count=len(players))
+        gained = np.maximum(np.searchsorted(_XP_ARRAY, experience, side="right") - old_levels, 0)
+        experience, gained = experience.tolist(), gained.tolist()
+    else:
+        amounts = list(amounts)
+        if len(amounts) != len(players):
+            raise ValueError("need one experience amount per player")
+        if any(amount < 0 for amount in amounts):
+            raise ValueError("experience can't be negative")
+        experience = [p.experience + amount for p, amount in zip(players, amounts)]
+        gained = [max(level_for_experience(xp) - p.level, 0) for p, xp in zip(players, experience)]
+
+    for player, total, levels in zip(players, experience, gained):
+        player.experience = total
+        if levels:
+            player._grow(levels)
+    return gained
+
+
+# ============================================================================
+# CHARACTER FACTORY (Class registry and prototype cloning)
+# ============================================================================
+
+def _slot_names(cls):
+    """Returns every __slots__ attribute of cls and its bases."""
+    return [name for klass in reversed(cls.__mro__) for name in klass.__dict__.get("__slots__", ())]
+
+
+def _make_spawner(cls, slots):
+    """
+    Returns spawn(names, *values) for one class: a loop that creates bare
+    instances and stores each slot through its precomputed descriptor,
+    skipping the chained __init__s.
+    """
+    new = cls.__new__
+    set_name = cls.name.__set__
+    setters = [getattr(cls, slot).__set__ for slot in slots]
+
+    def spawn(names, *values):
+        assignments = list(zip(setters, values))
+        spawned = []
+        for name in names:
+            character = new(cls)
+            set_name(character, name)
+            for setter, value in assignments:
+                setter(character, value)
+            spawned.append(character)
+        return spawned
+
+    return spawn
+
+
+class CharacterFactory:
+    """
+    Spawns characters by class name from cached prototypes.
+
+    Each class is constructed normally once; spawns copy the prototype's
+    slots onto a bare instance instead of running the chained __init__s.
+    The registry defaults to a private copy of PLAYER_CLASSES, so defining
+    or registering a class never changes it for the rest of the process.
+    Pass registry=PLAYER_CLASSES to share it, e.g. so defined classes can
+    also be loaded from roster files.
+    """
+
+    def __init__(self, registry=None):
+        """Creates a factory over a {class name: class} registry (default: a copy of PLAYER_CLASSES)."""
+        self.registry = dict(PLAYER_CLASSES) if registry is None else registry
+        self._prototypes = {}  # class name -> (spawner, prototype slot values)
+
+    def register(self, cls, name=None):
+        """Adds a class whose constructor takes just a name. Returns the class."""
+        self.registry[name or cls.__name__] = cls
+        self._prototypes.pop(name or cls.__name__, None)
+        return cls
+
+    def define(self, name, health, strength, magic, attack=None, level_growth=None):
+        """
+        Declares a new Player class from data and registers it.
+
+        attack is an AbilitySpec (or a callable taking the character) for the
+        basic attack, default strength; level_growth is a (health, strength,
+        magic) tuple per level.
+        Returns the generated class.
+        """
+        def __init__(self, character_name):
+            Player.__init__(self, character_name, name, health, strength, magic)
+
+        namespace = {
+            "__slots__": (),
+            "__init__": __init__,
+            "__doc__": f"{name} defined from data ({health} health, {strength} strength, {magic} magic).",
+        }
+        if callable(attack):
+            namespace["DAMAGE_FORMULAS"] = {"attack": attack}  # Object path only; not vectorizable
+        elif attack is not None:
+            namespace["ABILITY_SPECS"] = {"attack": AbilitySpec(*attack)}
+        if level_growth is not None:
+            namespace["LEVEL_GROWTH"] = tuple(level_growth)
+        return self.register(type(name, (Player,), namespace))
+
+    def _prototype(self, class_name):
+        """Returns (spawner, slot values) for a registered class, building it once."""
+        entry = self._prototypes.get(class_name)
+        if entry is None:
+            try:
+                cls = self.registry[class_name]
+            except KeyError:
+                raise KeyError(f"unknown character class: {class_name}") from None
+            prototype = cls("prototype")
+            if hasattr(prototype, "__dict__"):  # Subclass without __slots__: copy it the slow way
+                entry = (lambda names: [self._copy_prototype(prototype, name) for name in names], [])
+            else:
+                slots = [slot for slot in _slot_names(cls) if slot != "name"]
+                values = [getattr(prototype, slot) for slot in slots]
+                entry = (_make_spawner(cls, slots), values)
+            self._prototypes[class_name] = entry
+        return entry
+
+    @staticmethod
+    def _copy_prototype(prototype, name):
+        """Shallow-copies a prototype that has an instance __dict__."""
+        character = copy.copy(prototype)
+        character.name = name
+        return character
+
+    def spawn(self, class_name, name):
+        """Creates one character of the registered class."""
+        return self.spawn_many(class_name, [name])[0]
+
+    def spawn_many(self, class_name, names):
+        """Creates one character per name, all cloned from the class prototype."""
+        spawner, values = self._prototype(class_name)
+        return spawner(names, *values)
+
+
+# ============================================================================
+# STATUS EFFECTS (Damage over time and stuns on a turn-keyed heap)
+# ============================================================================
+
+# duration is ticks for damage-over-time effects and skipped actions for stuns
+EffectRule = namedtuple("EffectRule", "effect duration damage message")
+
+STUN = "stun"
+
+EFFECT_RULES = {
+    "fireball": EffectRule("burn", 3, 5, "{target} burns for {damage} damage!"),
+    "sneak_attack": EffectRule("bleed", 2, 4, "{target} bleeds for {damage} damage!"),
+    "power_strike": EffectRule(STUN, 1, 0, None),
+}
+
+
+class StatusEffects:
+    """
+    Tracks burns, bleeds and stuns for one fight.
+
+    Damage-over-time ticks sit in a heap keyed on the turn they fire, so
+    advance() only touches effects due on the new turn. Re-applying an effect
+    refreshes it; the superseded heap entry is skipped when it comes up.
+    Used as an event sink (a context manager installs it in front of the
+    current sink), effects are applied from any ability that emits events,
+    including SimpleBattle rounds; ticks go through Character.take_damage.
+    """
+
+    def __init__(self, rules=None):
+        """Creates an empty tracker using {ability: EffectRule} (default: EFFECT_RULES)."""
+        self.rules = EFFECT_RULES if rules is None else rules
+        self.sink = NULL_SINK  # Downstream sink while installed
+        self.turn = 0
+        self._heap = []        # (fire turn, id, target, rule, ticks left)
+        self._active = {}      # (target, effect) -> id of its live heap entry
+        self._stuns = {}       # target -> actions still to skip
+        self._ids = 0
+        self._saved = []       # (previous global sink, previous downstream) per __enter__
+
+    def __len__(self):
+        """Returns the number of active damage-over-time effects."""
+        return len(self._active)
+
+    def apply(self, target, rule):
+        """Applies (or refreshes) one effect on a target."""
+        if rule.effect == STUN:
+            self._stuns[target] = max(self._stuns.get(target, 0), rule.duration)
+            return
+        self._ids += 1
+        self._active[(target, rule.effect)] = self._ids
+        heapq.heappush(self._heap, (self.turn + 1, self._ids, target, rule, rule.duration))
+
+    def apply_ability(self, ability, target):
+        """Applies the effect (if any) that the ability inflicts on its target."""
+        rule = self.rules.get(ability)
+        if rule is not None:
+            self.apply(target, rule)
+
+    def has_effect(self, target, effect):
+        """Returns True if the target has the effect active (stuns included)."""
+        if effect == STUN:
+            return target in self._stuns
+        return (target, effect) in self._active
+
+    def can_act(self, character):
+        """Returns False, using up one stunned action, if the character is stunned."""
+        remaining = self._stuns.get(character)
+        if not remaining:
+            return True
+        if remaining == 1:
+            del self._stuns[character]
+        else:
+            self._stuns[character] = remaining - 1
+        return False
+
+    def advance(self):
+        """
+        Moves to the next turn and applies the ticks due on it.
+        Returns the number of ticks applied.
+        """
+        self.turn += 1
+        turn, heap, active = self.turn, self._heap, self._active
+        ticks = 0
+        while heap and heap[0][0] <= turn:
+            _, entry_id, target, rule, remaining = heapq.heappop(heap)
+            key = (target, rule.effect)
+            if active.get(key) != entry_id:
+                continue  # Refreshed or cleared since it was scheduled
+            if target.health <= 0:
+                del active[key]  # Defeated characters stop ticking
+                continue
+            _event_sink.on_attack(target, target, rule.effect, rule.damage, rule.message)
+            target.take_damage(rule.damage)
+            ticks += 1
+            if remaining > 1:
+                heapq.heappush(heap, (turn + 1, entry_id, target, rule, remaining - 1))
+            else:
+                del active[key]
+        return ticks
+
+    def clear(self):
+        """Removes every effect and resets the turn counter."""
+        self.turn = 0
+        self._heap.clear()
+        self._active.clear()
+        self._stuns.clear()
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Applies the ability's effect, then forwards the event."""
+        rule = self.rules.get(ability)
+        if rule is not None:
+            self.apply(target, rule)
+        self.sink.on_attack(attacker, target, ability, damage, message)
+
+    def on_damage(self, target, damage, health):
+        """Forwards damage events."""
+        self.sink.on_damage(target, damage, health)
+
+    def quiet(self):
+        """Returns a sink that applies effects to this tracker but forwards to a silenced downstream."""
+        return QuietEffects(self)
+
+    def __enter__(self):
+        """Installs the tracker in front of the current event sink."""
+        previous = set_event_sink(self)
+        self._saved.append((previous, self.sink))
+        if previous is not self:  # Re-entering keeps the original downstream
+            self.sink = previous
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """Restores the previous event sink."""
+        previous, self.sink = self._saved.pop()
+        set_event_sink(previous)
+
+
+class QuietEffects:
+    """
+    StatusEffects front end for silent runs (see silenced()): effects are
+    still applied to the shared tracker, events go to its downstream sink
+    with console output removed.
+    """
+
+    def __init__(self, effects):
+        """Wraps a tracker, silencing its current downstream sink."""
+        self.effects = effects
+        self.sink = silenced(effects.sink)
+
+    def on_attack(self, attacker, target, ability, damage, message):
+        """Applies the ability's effect, then forwards the event."""
+        self.effects.apply_ability(ability, target)
+        self.sink.on_attack(attacker, target, ability, damage, message)
+
+    def on_damage(self, target, damage, health):
+        """Forwards damage events."""
+        self.sink.on_damage(target, damage, health)
+
+
+# ============================================================================
+# COOLDOWNS AND RESOURCES (Turn-stamped readiness in compact columns)
+# ============================================================================
+
+AbilityCost = namedtuple("AbilityCost", "cooldown mana stamina", defaults=(0, 0))
+
+# Abilities without an entry (the basic attack) are always ready
+ABILITY_COSTS = {
+    "power_strike": AbilityCost(3, stamina=30),
+    "fireball": AbilityCost(2, mana=25),
+    "sneak_attack": AbilityCost(3, stamina=20),
+}
+
+
+class CooldownManager:
+    """
+    Cooldowns, mana and stamina for any number of characters.
+
+    State lives in flat array("i") columns indexed by a per-character slot:
+    4 bytes per ability plus 12 per character (24 with the default costs).
+    The character -> slot dict adds roughly 80 more, so a registered
+    character costs about 105 bytes in all. unregister() frees a slot for
+    the next registration, so despawned mobs don't pile up. Each cooldown column
+    stores the turn the ability is ready again, and resources are stored
+    with the turn they were last spent, so regeneration is worked out on
+    read instead of updating every character every turn.
+    """
+
+    def __init__(self, costs=None, max_mana=100, max_stamina=100, mana_regen=10, stamina_regen=10):
+        """Creates an empty manager using {ability: AbilityCost} (default: ABILITY_COSTS)."""
+        self.costs = ABILITY_COSTS if costs is None else costs
+        self.max_mana = max_mana
+        self.max_stamina = max_stamina
+        self.mana_regen = mana_regen        # Points regained per turn
+        self.stamina_regen = stamina_regen
+        self._slots = {}                    # character -> column index
+        self._free = []                     # Column indexes released by unregister(), reused first
+        self._ready_at = {ability: array("i") for ability in self.costs}
+        self._mana = array("i")             # Mana at the stamped turn
+        self._stamina = array("i")          # Stamina at the stamped turn
+        self._stamp = array("i")            # Turn the resources were last spent
+        self._class_abilities = {}          # class -> ((ability, cost, ready column), ...)
+
+    def __len__(self):
+        """Returns the number of registered characters."""
+        return len(self._slots)
+
+    def register(self, character, turn=0):
+        """Gives a character full resources and no cooldowns; returns its column index."""
+        index = self._slots.get(character)
+        if index is not None:
+            return index
+        if self._free:
+            index = self._slots[character] = self._free.pop()  # Reuse a released column
+            for column in self._ready_at.values():
+                column[index] = turn
+            self._mana[index] = self.max_mana
+            self._stamina[index] = self.max_stamina
+            self._stamp[index] = turn
+        else:
+            index = self._slots[character] = len(self._stamp)
+            for column in self._ready_at.values():
+                column.append(turn)
+            self._mana.append(self.max_mana)
+            self._stamina.append(self.max_stamina)
+            self._stamp.append(turn)
+        return index
+
+    def unregister(self, character):
+        """
+        Forgets a character (e.g. a despawned mob), dropping the reference to
+        it and freeing its column for reuse. Returns True if it was registered.
+        """
+        index = self._slots.pop(character, None)
+        if index is None:
+            return False
+        self._free.append(index)
+        return True
+
+    def _slot(self, character):
+        """Returns the character's column index, registering it on first use."""
+        index = self._slots.get(character)
+        return self.register(character) if index is None else index
+
+    def _resources(self, index, turn):
+        """Returns (mana, stamina) at `turn`, including regeneration since the last spend."""
+        elapsed = turn - self._stamp[index]
+        return (min(self.max_mana, self._mana[index] + self.mana_regen * elapsed),
+                min(self.max_stamina, self._stamina[index] + self.stamina_regen * elapsed))
+
+    def mana(self, character, turn):
+        """Returns the character's mana at `turn`."""
+        return self._resources(self._slot(character), turn)[0]
+
+    def stamina(self, character, turn):
+        """Returns the character's stamina at `turn`."""
+        return self._resources(self._slot(character), turn)[1]
+
+    def _abilities(self, cls):
+        """Returns the cached ((ability, cost, ready column), ...) entries a class can use."""
+        entries = self._class_abilities.get(cls)
+        if entries is None:
+            entries = self._class_abilities[cls] = tuple(
+                (ability, self.costs.get(ability), self._ready_at.get(ability))
+                for ability in COMBAT_ABILITIES if hasattr(cls, ability)
+            )
+        return entries
+
+    def is_ready(self, character, ability, turn):
+        """Returns True if the character can use the ability on `turn`."""
+        cost = self.costs.get(ability)
+        if cost is None:
+            return hasattr(character, ability)
+        index = self._slot(character)
+        mana, stamina = self._resources(index, turn)
+        return self._ready_at[ability][index] <= turn and mana >= cost.mana and stamina >= cost.stamina
+
+    def ready_abilities(self, character, turn):
+        """Returns every combat ability the character can use on `turn`, in COMBAT_ABILITIES order."""
+        index = self._slot(character)
+        mana, stamina = self._resources(index, turn)
+        return tuple(
+            ability for ability, cost, ready_at in self._abilities(type(character))
+            if cost is None or (ready_at[index] <= turn and mana >= cost.mana and stamina >= cost.stamina)
+        )
+
+    def use(self, character, ability, turn):
+        """
+        Spends the ability's cost and starts its cooldown if it is ready on
+        `turn`. Returns False (changing nothing) if it isn't.
+        """
+        if not self.is_ready(character, ability, turn):
+            return False
+        cost = self.costs.get(ability)
+        if cost is not None:
+            index = self._slots[character]
+            mana, stamina = self._resources(index, turn)
+            self._ready_at[ability][index] = turn + cost.cooldown
+            self._mana[index] = mana - cost.mana
+            self._stamina[index] = stamina - cost.stamina
+            self._stamp[index] = turn
+        return True
+
+
+# ============================================================================
+# BALANCE TUNING (Parallel stat search toward target win rates)
+# ============================================================================
+
+# Target win rate of the first class against the second (ties count as half a win)
+BALANCE_TARGETS = {
+    ("Warrior", "Mage"): 0.5,
+    ("Warrior", "Rogue"): 0.5,
+    ("Mage", "Rogue"): 0.5,
+}
+
+BALANCE_STATS = ("health", "strength", "magic")
+WILSON_Z = 1.96  # 95% confidence for early stopping
+
+MatchupEstimate = namedtuple("MatchupEstimate", "target win_rate battles low high")
+CandidateResult = namedtuple("CandidateResult", "score stats matchups")
+
+
+def wilson_interval(wins, battles, z=WILSON_Z):
+    """Returns the (low, high) Wilson score interval for a win rate."""
+    if not battles:
+        return 0.0, 1.0
+    rate = wins / battles
+    spread = z * z / battles
+    centre = (rate + spread / 2) / (1 + spread)
+    margin = z * (rate * (1 - rate) / battles + spread / (4 * battles)) ** 0.5 / (1 + spread)
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def _tuned_class(class_name, params):
+    """
+    Returns the class to build for one candidate. Keys like "attack.bonus"
+    change an AbilitySpec field, which needs a (per-process) subclass.
+    Fields no attack path reads (a crit chance outside the basic attack)
+    raise ValueError when the subclass compiles its specs.
+    """
+    cls = PLAYER_CLASSES[class_name]
+    specs = {}  # Only the changed abilities; the subclass merges them over cls's specs
+    for key, value in params.items():
+        if key in BALANCE_STATS:
+            continue
+        ability, _, field = key.partition(".")
+        if ability not in cls.ABILITY_SPECS or field not in AbilitySpec._fields:
+            raise ValueError(f"unknown balance parameter {class_name}.{key}")
+        specs[ability] = specs.get(ability, cls.ABILITY_SPECS[ability])._replace(**{field: value})
+    if all(spec == cls.ABILITY_SPECS[ability] for ability, spec in specs.items()):
+        return cls
+    return type(class_name, (cls,), {"__slots__": (), "ABILITY_SPECS": specs})
+
+
+def _tuned_fighter(cls, class_name, params):
+    """Creates a fresh fighter with the candidate's stats."""
+    fighter = cls(class_name)
+    for stat in BALANCE_STATS:
+        if stat in params:
+            setattr(fighter, stat, params[stat])
+    return fighter
+
+
+def _estimate_matchup(classes, stats, pair, target, rng, tolerance, batch_size, max_battles, max_rounds):
+    """
+    Simulates one class pair in batches until the Wilson interval settles
+    (inside the tolerance band, or clearly outside it) or max_battles is hit.
+    Sides alternate who strikes first.
+    """
+    wins = battles = 0
+    low, high = 0.0, 1.0
+    while battles < max_battles:
+        for _ in range(min(batch_size, max_battles - battles)):
+            first, second = (_tuned_fighter(classes[name], name, stats.get(name, {})) for name in pair)
+            swapped = battles % 2 == 1
+            if swapped:
+                first, second = second, first
+            winner = Battle(first, second, rng=rng).fight_until_defeat(
+                max_rounds=max_rounds, output=False).winner
+            if winner == 0:
+                wins += 0.5
+            elif (winner == 1) != swapped:
+                wins += 1
+            battles += 1
+        low, high = wilson_interval(wins, battles)
+        on_target = target - tolerance <= low and high <= target + tolerance
+        off_target = high < target - tolerance or low > target + tolerance
+        if on_target or off_target:
+            break  # Statistically settled; more battles won't change the verdict
+    return MatchupEstimate(target, wins / battles, battles, low, high)
+
+
+def evaluate_candidate(stats, targets=None, seed=0, tolerance=0.05, batch_size=50, max_battles=1000,
+                       max_rounds=Battle.DEFAULT_MAX_ROUNDS):
+    """
+    Estimates every target matchup for one candidate and returns a
+    CandidateResult whose score is the summed squared distance from the targets.
+    stats is {class name: {"health": ..., "attack.bonus": ..., ...}}.
+    """
+    targets = BALANCE_TARGETS if targets is None else targets
+    classes = {name: _tuned_class(name, stats.get(name, {})) for pair in targets for name in pair}
+    matchups = {}
+    for index, (pair, target) in enumerate(targets.items()):
+        rng = random.Random(matchup_seed(seed, index, json.dumps(stats, sort_keys=True)))
+        matchups[pair] = _estimate_matchup(classes, stats, pair, target, rng, tolerance,
+                                           batch_size, max_battles, max_rounds)
+    score = sum((estimate.win_rate - estimate.target) ** 2 for estimate in matchups.values())
+    return CandidateResult(score, stats, matchups)
+
+
+def balance_candidates(space, strategy="grid", samples=20, seed=0):
+    """
+    Returns candidate stat dicts from a search space such as
+    {"Warrior": {"health": [100, 120], "attack.bonus": [3, 5]}, ...}.
+    "grid" returns every combination; "random" returns up to `samples`
+    distinct combinations drawn with the seed.
+    """
+    keys = [(name, param) for name in sorted(space) for param in sorted(space[name])]
+    choices = [list(space[name][param]) for name, param in keys]
+    total = 1
+    for values in choices:
+        total *= len(values)
+    if strategy == "grid":
+        indices = range(total)
+    elif strategy == "random":
+        indices = random.Random(seed).sample(range(total), min(samples, total))
+    else:
+        raise ValueError(f"unknown search strategy {strategy!r}")
+
+    candidates = []
+    for index in indices:
+        positions = []
+        for values in reversed(choices):  # Mixed-radix decode, last key varies fastest
+            index, position = divmod(index, len(values))
+            positions.append(position)
+        stats = {}
+        for (name, param), values, position in zip(keys, choices, reversed(positions)):
+            stats.setdefault(name, {})[param] = values[position]
+        candidates.append(stats)
+    return candidates
+
+
+def _evaluate_shard(candidates, options):
+    """Evaluates a shard of candidates in a worker process."""
+    return [evaluate_candidate(stats, **options) for stats in candidates]
+
+
+def search_balance(space, targets=None, strategy="grid", samples=20, workers=None, seed=0, **options):
+    """
+    Evaluates the candidates from balance_candidates() and returns their
+    CandidateResults, best (lowest score) first. Candidates are sharded
+    across `workers` processes like run_tournament; results don't depend on
+    the worker count. Other options go to evaluate_candidate().
+    """
+    candidates = balance_candidates(space, strategy, samples, seed)
+    options.update(targets=targets, seed=seed)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        results = _evaluate_shard(candidates, options)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_evaluate_shard, shard, options) for shard in _shard(candidates, workers * 4)]
+            results = [result for future in futures for result in future.result()]
+
+    results.sort(key=lambda result: result.score)  # Stable: ties keep candidate order
+    return results
+
+
+def balance_report(results, top=10):
+    """Returns the best `top` results as a JSON-ready dict."""
+    return {
+        "candidates": len(results),
+        "best": [
+            {
+                "rank": rank,
+                "score": result.score,
+                "stats": result.stats,
+                "matchups": {f"{first} vs {second}": estimate._asdict()
+                             for (first, second), estimate in result.matchups.items()},
+            }
+            for rank, result in enumerate(results[:top], 1)
+        ],
+    }
+
+
+def write_balance_report(path, results, top=10):
+    """Writes balance_report() to a JSON file."""
+    with open(path, "w") as handle:
+        json.dump(balance_report(results, top), handle, indent=2)
+
+
+# ============================================================================
+# WIN-RATE MATRIX (Cached pairwise predictions keyed by build fingerprints)
+# ============================================================================
+
+WIN_RATE_CACHE_VERSION = 1
+
+
+def _formula_signature(formula):
+    """
+    Returns a stable description of one damage formula. Free-form formulas
+    are identified by their bytecode, constants, defaults and the values
+    their closures captured, so make(2) and make(5) don't collide.
+    """
+    spec = getattr(formula, "spec", None)
+    if spec is not None:
+        return repr(tuple(spec))
+    code = formula.__code__
+    captured = []
+    for cell in formula.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # Cell not filled in yet
+            value = None
+        captured.append(_formula_signature(value) if hasattr(value, "__code__") else repr(value))
+    return code.co_code.hex() + repr((code.co_consts, formula.__defaults__, captured))
+
+
+def build_fingerprint(character):
+    """
+    Returns a stable hash of everything that decides how a character
+    fights: its class and attack behaviour, damage formulas and stats.
+    """
+    cls = type(character)
+    payload = [
+        cls.__module__, cls.__qualname__, cls.attack.__qualname__, cls.CRIT_THRESHOLD,
+        sorted((ability, _formula_signature(formula)) for ability, formula in cls.DAMAGE_FORMULAS.items()),
+        character.health, character.strength, character.magic, character.weapon_bonus(),
+    ]
+    return hashlib.sha256(repr(payload).encode()).hexdigest()[:16]
+
+
+def matchup_win_rate(char1, char2, max_rounds=Battle.DEFAULT_MAX_ROUNDS):
+    """
+    Returns char1's exact win rate against char2 when each side strikes
+    first half the time. Ties count as half a win.
+    """
+    first = predict_outcome(char1, char2, max_rounds)
+    second = predict_outcome(char2, char1, max_rounds)
+    return (first.win + second.loss + (first.tie + second.tie) / 2) / 2
+
+
+class WinRateMatrix:
+    """
+    Build-vs-build win rates for matchmaking.
+
+    Rates are cached per pair of build fingerprints, so after a build or a
+    class changes only the pairs involving it miss the cache: one row and
+    one column. The cache can be saved to and loaded from a JSON file.
+    """
+
+    def __init__(self, path=None, max_rounds=Battle.DEFAULT_MAX_ROUNDS):
+        """Creates a matrix, loading cached rates from path if the file exists."""
+        self.path = path
+        self.max_rounds = max_rounds
+        self.builds = {}    # name -> character whose stats and class define the build
+        self.computed = 0   # Pairs predicted (cache misses) so far
+        self._rates = {}    # "fingerprint1:fingerprint2" (sorted) -> win rate of the first
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def add(self, name, character):
+        """Adds or replaces a build."""
+        self.builds[name] = character
+
+    def add_class(self, cls, name=None):
+        """Adds a class at its starting stats as a build (named after the class)."""
+        name = name or cls.__name__
+        self.builds[name] = cls(name)
+
+    def remove(self, name):
+        """Removes a build; its cached rates stay available."""
+        del self.builds[name]
+
+    def _rate(self, key1, key2, char1, char2):
+        """Returns char1's win rate against char2, predicting it on a cache miss."""
+        if key1 == key2:
+            return 0.5  # Mirror match
+        if key1 > key2:
+            return 1.0 - self._rate(key2, key1, char2, char1)
+        key = f"{key1}:{key2}"
+        rate = self._rates.get(key)
+        if rate is None:
+            rate = self._rates[key] = matchup_win_rate(char1, char2, self.max_rounds)
+            self.computed += 1
+        return rate
+
+    def win_rate(self, name1, name2):
+        """Returns build name1's win rate against build name2."""
+        char1, char2 = self.builds[name1], self.builds[name2]
+        return self._rate(build_fingerprint(char1), build_fingerprint(char2), char1, char2)
+
+    def matrix(self):
+        """Returns {(name1, name2): win rate of name1} for every ordered pair of builds."""
+        keys = {name: build_fingerprint(character) for name, character in self.builds.items()}
+        builds = self.builds
+        return {
+            (name1, name2): self._rate(keys[name1], keys[name2], builds[name1], builds[name2])
+            for name1 in builds for name2 in builds
+        }
+
+    def load(self, path):
+        """Merges cached rates from a JSON file; files for another version or round cap are ignored."""
+        with open(path) as handle:
+            data = json.load(handle)
+        if data.get("version") == WIN_RATE_CACHE_VERSION and data.get("max_rounds") == self.max_rounds:
+            self._rates.update(data["rates"])
+
+    def save(self, path=None, prune=False):
+        """
+        Writes the cache to path (default: the constructor's path). With
+        prune, only rates between the current builds are kept.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("no path to save the win-rate cache to")
+        rates = self._rates
+        if prune:
+            keys = sorted({build_fingerprint(character) for character in self.builds.values()})
+            rates = {f"{key1}:{key2}": rates[f"{key1}:{key2}"]
+                     for i, key1 in enumerate(keys) for key2 in keys[i + 1:] if f"{key1}:{key2}" in rates}
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump({"version": WIN_RATE_CACHE_VERSION, "max_rounds": self.max_rounds, "rates": rates}, handle)
+        os.replace(temporary, path)  # Never leave a half-written cache behind
+
+
+# ============================================================================
+# STAT RENDERING (Batched roster output from cached stat lines)
+# ============================================================================
+
+def render_roster(characters, stream=None):
+    """
+    Writes every character's display_stats() text to stream (default:
+    sys.stdout) with a single write call instead of one print per line.
+    Returns the number of characters rendered.
+    """
+    lines = [character.stat_line() for character in characters]
+    if lines:
+        (sys.stdout if stream is None else stream).write("\n".join(lines) + "\n")
+    return len(lines)
+
+
+# ============================================================================
+# ARENA (Positions on a 2D battlefield with a uniform-grid index)
+# ============================================================================
+
+class Arena:
+    """
+    A 2D battlefield. Characters are bucketed into square grid cells of
+    cell_size, so radius and nearest-enemy queries only look at nearby cells
+    and moving within a cell costs a single update. Characters on different
+    teams are enemies; defeated characters (0 health) are never returned.
+    """
+
+    def __init__(self, cell_size=10.0):
+        """Creates an empty arena; pick cell_size near the usual query radius."""
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}    # (cell x, cell y) -> {character: None}, in placement order
+        self._entries = {}  # character -> [x, y, cell, team]
+
+    def __len__(self):
+        """Returns the number of placed characters."""
+        return len(self._entries)
+
+    def __contains__(self, character):
+        """Returns True if the character is placed in the arena."""
+        return character in self._entries
+
+    def _cell(self, x, y):
+        """Returns the grid cell containing a point."""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def place(self, character, x, y, team=0):
+        """Puts a character on the battlefield."""
+        if character in self._entries:
+            raise ValueError(f"{character.name} is already in the arena; use move()")
+        cell = self._cell(x, y)
+        self._entries[character] = [x, y, cell, team]
+        self._cells.setdefault(cell, {})[character] = None
+
+    def move(self, character, x, y):
+        """Moves a placed character, re-bucketing it only if it changes cell."""
+        entry = self._entries[character]
+        cell = self._cell(x, y)
+        if cell != entry[2]:
+            self._discard(character, entry[2])
+            self._cells.setdefault(cell, {})[character] = None
+            entry[2] = cell
+        entry[0], entry[1] = x, y
+
+    def remove(self, character):
+        """Takes a character off the battlefield."""
+        self._discard(character, self._entries.pop(character)[2])
+
+    def _discard(self, character, cell):
+        """Removes a character from a cell bucket, dropping empty buckets."""
+        members = self._cells[cell]
+        del members[character]
+        if not members:
+            del self._cells[cell]
+
+    def position(self, character):
+        """Returns the character's (x, y)."""
+        x, y, _, _ = self._entries[character]
+        return x, y
+
+    def team(self, character):
+        """Returns the character's team."""
+        return self._entries[character][3]
+
+    def within(self, x, y, radius, exclude_team=None):
+        """
+        Returns the standing characters within radius of (x, y), nearest
+        first, optionally skipping one team.
+        """
+        low_x, low_y = self._cell(x - radius, y - radius)
+        high_x, high_y = self._cell(x + radius, y + radius)
+        if (high_x - low_x + 1) * (high_y - low_y + 1) <= len(self._cells):
+            cells = (self._cells.get((cx, cy)) for cx in range(low_x, high_x + 1) for cy in range(low_y, high_y + 1))
+        else:
+            cells = self._cells.values()  # Huge radius: every occupied cell is cheaper than the box
+
+        limit = radius * radius
+        entries = self._entries
+        found = []
+        for members in cells:
+            if not members:
+                continue
+            for character in members:
+                px, py, _, team = entries[character]
+                distance = (px - x) ** 2 + (py - y) ** 2
+                if distance <= limit and character.health > 0 and team != exclude_team:
+                    found.append((distance, character))
+        found.sort(key=lambda item: item[0])  # Stable: equal distances keep placement order
+        return [character for _, character in found]
+
+    def enemies_within(self, character, x, y, radius):
+        """Returns the character's standing enemies within radius of (x, y), nearest first."""
+        return self.within(x, y, radius, exclude_team=self.team(character))
+
+    def _ring(self, cx, cy, ring):
+        """Yields the cells at Chebyshev distance `ring` from (cx, cy)."""
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
+
+    def nearest_enemy(self, character, max_radius=None):
+        """
+        Returns the closest standing enemy (or None), searching rings of
+        cells outward from the character's cell and stopping as soon as no
+        unvisited cell can hold anything closer. Once the searched box would
+        cover more cells than are occupied, the occupied cells are scanned
+        directly instead, so sparse arenas never walk huge empty rings.
+        """
+        x, y, (cx, cy), team = self._entries[character]
+        entries, cells, cell_size = self._entries, self._cells, self.cell_size
+        best, best_distance = None, float("inf")
+        seen, ring = 0, 0
+        while True:
+            exhaustive = (2 * ring + 1) ** 2 > len(cells)
+            if exhaustive:
+                ring_cells = cells.values()  # Cheaper than the box, as in within()
+            else:
+                ring_cells = (cells.get(cell) for cell in self._ring(cx, cy, ring))
+            for members in ring_cells:
+                if not members:
+                    continue
+                seen += len(members)
+                for other in members:
+                    px, py, _, other_team = entries[other]
+                    if other_team == team or other.health <= 0:
+                        continue
+                    distance = (px - x) ** 2 + (py - y) ** 2
+                    if distance < best_distance:
+                        best, best_distance = other, distance
+            if exhaustive:
+                break
+            reach = ring * cell_size  # Cells beyond this ring are at least this far away
+            if best_distance <= reach * reach or seen >= len(entries):
+                break
+            if max_radius is not None and reach > max_radius:
+                break
+            ring += 1
+        if max_radius is not None and best_distance > max_radius * max_radius:
+            return None
+        return best
+
+    def attack_nearest(self, character, max_radius=None):
+        """Makes the character attack its nearest enemy; returns the target (or None)."""
+        target = self.nearest_enemy(character, max_radius)
+        if target is not None:
+            character.attack(target)
+        return target
+
+
+# ============================================================================
+# BATCHED DAMAGE (Many hits per tick, clamped once per character)
+# ============================================================================
+
+def _roster_index(index, size):
+    """Returns index as a position in a roster of size, counting negatives from the end."""
+    if not -size <= index < size:
+        raise IndexError("roster index out of range")
+    return index % size
+
+
+def apply_damage(roster, indices, amounts, events=False):
+    """
+    Applies a tick of hits to a roster: hit k deals amounts[k] to
+    roster[indices[k]]. Damage is accumulated per character (np.add.at
+    over the unique targets, a dict without numpy), each touched health is
+    clamped once, and one damage event per character carries its total.
+    With events=True every hit goes through take_damage instead, giving the
+    usual per-hit events. Returns the characters that were hit, in index order.
+    Negative indices count from the end, so -1 and len(roster) - 1 are the
+    same character; anything outside the roster raises IndexError.
+    Amounts are summed in their own type (float damage is never truncated),
+    so the result doesn't depend on whether numpy is installed.
+    """
+    size = len(roster)
+    if events:
+        indices = [_roster_index(index, size) for index in indices]
+        for index, amount in zip(indices, amounts):
+            roster[index].take_damage(amount)
+        return [roster[index] for index in sorted(set(indices))]
+
+    if np is not None:
+        amounts = np.asarray(amounts)
+        amounts = amounts.astype(np.result_type(amounts.dtype, np.int64))  # Ints stay ints, float damage stays float
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.size and (indices.min() < -size or indices.max() >= size):
+            raise IndexError("roster index out of range")
+        touched, targets = np.unique(indices % max(size, 1), return_inverse=True)
+        if amounts.shape != targets.shape:
+            raise ValueError("need one damage amount per hit")
+        totals = np.zeros(len(touched), dtype=amounts.dtype)
+        np.add.at(totals, targets, amounts)
+        touched, totals = touched.tolist(), totals.tolist()
+    else:
+        indices, amounts = [_roster_index(index, size) for index in indices], list(amounts)
+        if len(indices) != len(amounts):
+            raise ValueError("need one damage amount per hit")
+        accumulated = defaultdict(int)
+        for index, amount in zip(indices, amounts):
+            accumulated[index] += amount
+        touched = sorted(accumulated)
+        totals = [accumulated[index] for index in touched]
+
+    hit = []
+    for index, total in zip(touched, totals):
+        character = roster[index]
+        health = character.health - total
+        character.health = health if health > 0 else 0  # Clamp once
+        _event_sink.on_damage(character, total, character.health)
+        hit.append(character)
+    return hit
+
+
 # ============================================================================
 # MAIN PROGRAM FOR TESTING (YOU CAN MODIFY THIS FOR TESTING)
 # ============================================================================
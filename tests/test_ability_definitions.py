@@ -0,0 +1,167 @@
+import random
+import pytest
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, BatchBattle, CharacterFactory,
+    AbilitySpec, compile_abilities, ability_coefficients, attack_coefficients,
+    predict_outcome, set_event_sink, NullSink,
+)
+
+class TestCompileAbilities:
+    """Test compiling ability specs into damage tables"""
+
+    def test_formula_from_spec(self):
+        """Test that a spec becomes stat * multiplier + bonus"""
+        table = compile_abilities({"smash": AbilitySpec("strength", 3, 4)})
+
+        assert table["smash"](Character("C", 100, 10, 0)) == 34, "Damage should be 10 * 3 + 4"
+
+    def test_crit_abilities_get_critical_entry(self):
+        """Test that crit-capable abilities also compile a doubled critical formula"""
+        table = compile_abilities({"attack": AbilitySpec("strength", crit_chance=0.5)})
+
+        assert table["critical_attack"](Character("C", 100, 7, 0)) == 14, "Critical should double the stat"
+        assert "critical_attack" not in compile_abilities({"attack": AbilitySpec("magic")}), \
+            "Abilities without crit chance should not get a critical entry"
+
+    @pytest.mark.parametrize("chance", [0.25, 0.05, 1.5, -0.1])
+    def test_crit_chance_must_fit_the_die(self, chance):
+        """Test that chances the 1..10 crit roll can't represent are rejected"""
+        with pytest.raises(ValueError):
+            compile_abilities({"attack": AbilitySpec("strength", crit_chance=chance)})
+
+    def test_only_attack_can_crit(self):
+        """Test that crit chances on other abilities are rejected instead of ignored"""
+        with pytest.raises(ValueError):
+            compile_abilities({"stab": AbilitySpec("strength", crit_chance=0.5)})
+
+    def test_unknown_stat_is_rejected(self):
+        """Test that specs must scale with strength or magic"""
+        with pytest.raises(ValueError):
+            compile_abilities({"charm": AbilitySpec("charisma")})
+
+    def test_plain_tuples_are_accepted(self):
+        """Test that specs can be written as plain tuples"""
+        table = compile_abilities({"zap": ("magic", 2)})
+
+        assert table["zap"](Character("C", 100, 0, 6)) == 12, "Tuple spec should compile like AbilitySpec"
+
+    def test_coefficients(self):
+        """Test the integer form used by the batch engine"""
+        assert ability_coefficients(Rogue.ABILITY_SPECS["attack"]) == (1, 0, 0, 3, 2), "Rogue crits on 1-3"
+        assert ability_coefficients(Mage.ABILITY_SPECS["fireball"]) == (0, 1, 10, 0, 1), "Fireball is magic + 10"
+
+class TestClassTables:
+    """Test that the built-in classes keep their original damage"""
+
+    @pytest.mark.parametrize("character, ability, damage", [
+        (Warrior("W"), "attack", 20), (Warrior("W"), "power_strike", 30),
+        (Mage("M"), "attack", 20), (Mage("M"), "fireball", 30),
+        (Rogue("R"), "attack", 12), (Rogue("R"), "critical_attack", 24), (Rogue("R"), "sneak_attack", 24),
+    ])
+    def test_damage_matches_original_formulas(self, character, ability, damage):
+        """Test each ability's damage at the default stats"""
+        assert character.damage_for(ability) == damage, f"{ability} should deal {damage}"
+
+    def test_subclass_specs_are_compiled(self):
+        """Test that declaring ABILITY_SPECS on a subclass rebuilds its table"""
+        class Berserker(Warrior):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", 2, crit_chance=0.1)}
+
+        berserker = Berserker("B")
+        assert berserker.damage_for("attack") == 30, "Attack should be strength * 2"
+        assert berserker.CRIT_THRESHOLD == 1, "10% crit chance should crit on a roll of 1"
+        assert Warrior.DAMAGE_FORMULAS["attack"](berserker) == 20, "Parent table should be unchanged"
+
+    def test_subclass_specs_extend_the_parent(self):
+        """Test that overriding one ability keeps the inherited abilities working"""
+        class SharpRogue(Rogue):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", crit_chance=0.5)}
+
+        target = Character("Dummy", 100, 0, 0)
+        previous = set_event_sink(NullSink())
+        try:
+            SharpRogue("S").sneak_attack(target)
+        finally:
+            set_event_sink(previous)
+
+        assert target.health == 76, "Sneak attack should still use Rogue's formula"
+        assert SharpRogue.ABILITY_SPECS["sneak_attack"] == Rogue.ABILITY_SPECS["sneak_attack"], "Specs should be merged"
+
+    def test_factory_accepts_specs(self):
+        """Test that data-defined classes can describe their attack with a spec"""
+        factory = CharacterFactory(registry={})
+        factory.define("Cleric", 90, 4, 12, attack=AbilitySpec("magic", bonus=2))
+
+        cleric = factory.spawn("Cleric", "Anna")
+        assert cleric.damage_for("attack") == 14, "Cleric should hit for magic + 2"
+        assert attack_coefficients(cleric) == (0, 1, 2, 0, 1), "Spec-defined attacks should be vectorizable"
+
+    def test_callable_attack_is_not_vectorized(self):
+        """Test that free-form formulas are refused by the batch engine"""
+        factory = CharacterFactory(registry={})
+        factory.define("Bard", 70, 5, 5, attack=lambda c: 3)
+
+        with pytest.raises(TypeError):
+            attack_coefficients(factory.spawn("Bard", "Lute"))
+
+class TestSpecDrivenEngines:
+    """Test that batch and prediction paths read the compiled specs"""
+
+    def test_batch_uses_subclass_coefficients(self):
+        """Test that batch damage for a spec-defined subclass matches the object path"""
+        class Brute(Player):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", 3, 1)}
+
+        pytest.importorskip("numpy")
+        brute = Brute("B", "Brute", 500, 10, 0)
+        result = BatchBattle.from_pairs([(brute, Mage("M"))]).fight(rng=0)
+
+        assert result.health2.tolist() == [49], "Mage should take 10 * 3 + 1"
+
+    def test_prediction_uses_crit_threshold(self):
+        """Test that a Rogue subclass with a higher crit chance is predicted to do better"""
+        class Assassin(Rogue):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", crit_chance=0.9)}
+
+        rogue = predict_outcome(Rogue("R"), Warrior("W"))
+        assassin = predict_outcome(Assassin("A"), Warrior("W"))
+
+        assert assassin.win > rogue.win, "More crits should mean more wins"
+
+    def test_rogue_crit_threshold_drives_attack(self, monkeypatch):
+        """Test that Rogue.attack crits exactly on rolls up to its threshold"""
+        previous = set_event_sink(NullSink())
+        try:
+            for roll, expected in [(3, 24), (4, 12)]:
+                target = Character("Dummy", 100, 0, 0)
+                monkeypatch.setattr(random, "randint", lambda a, b: roll)
+                Rogue("R").attack(target)
+                assert target.health == 100 - expected, f"Roll {roll} should deal {expected}"
+        finally:
+            set_event_sink(previous)
+
+    @pytest.mark.parametrize("base", [Character, Warrior, Mage])
+    def test_every_attack_rolls_for_crits(self, base, monkeypatch):
+        """Test that non-Rogue attacks crit on the object path when their spec has a crit chance"""
+        class Lucky(base):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", crit_chance=0.5)}
+
+        lucky = Lucky("L", 100, 10, 0) if base is Character else Lucky("L")
+        normal = lucky.damage_table()["attack"]
+        previous = set_event_sink(NullSink())
+        try:
+            for roll, expected in [(5, 2 * normal), (6, normal)]:
+                target = Character("Dummy", 100, 0, 0)
+                monkeypatch.setattr(random, "randint", lambda a, b: roll)
+                lucky.attack(target)
+                assert target.health == 100 - expected, f"Roll {roll} should deal {expected}"
+        finally:
+            set_event_sink(previous)
+
+    def test_prediction_counts_non_rogue_crits(self):
+        """Test that the predictor models crits for any class with a crit chance"""
+        class LuckyWarrior(Warrior):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", 1, 5, crit_chance=0.5)}
+
+        assert predict_outcome(LuckyWarrior("L"), Rogue("R")).win > predict_outcome(Warrior("W"), Rogue("R")).win, \
+            "Crits should improve the prediction"
@@ -0,0 +1,66 @@
+import pytest
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, AbilityProfiler, attack_class_id, WARRIOR_ID,
+    set_event_sink, NullSink,
+)
+
+@pytest.fixture(autouse=True)
+def quiet():
+    """Keeps attack output out of these tests"""
+    previous = set_event_sink(NullSink())
+    yield
+    set_event_sink(previous)
+
+class TestAbilityProfiler:
+    """Test opt-in ability instrumentation"""
+
+    def test_disabled_profiler_leaves_methods_untouched(self):
+        """Test that methods are the originals before and after profiling"""
+        original = Warrior.attack
+        with AbilityProfiler():
+            assert Warrior.attack is not original, "Method should be swapped while enabled"
+
+        assert Warrior.attack is original, "Original method should be restored"
+
+    def test_counts_time_and_damage(self):
+        """Test that calls, time and damage are recorded per class and ability"""
+        target = Character("Target", 1000, 0, 0)
+        with AbilityProfiler() as profiler:
+            Warrior("W").attack(target)
+            Warrior("W").attack(target)
+            Mage("M").fireball(target)
+
+        report = profiler.as_dict()
+        assert report["Warrior"]["attack"]["calls"] == 2, "Two warrior attacks should be counted"
+        assert report["Warrior"]["attack"]["damage_histogram"] == {20: 2}, "Each swing deals 20"
+        assert report["Mage"]["fireball"]["damage_total"] == 30, "Fireball damage should be totalled"
+        assert report["Mage"]["fireball"]["seconds"] >= 0, "Wall time should be recorded"
+
+    def test_inherited_attack_is_reported_by_runtime_class(self):
+        """Test that Player (which inherits Character.attack) is reported as Player"""
+        with AbilityProfiler() as profiler:
+            Player("P", "Player", 50, 7, 0).attack(Character("T", 50, 0, 0))
+
+        assert profiler.as_dict()["Player"]["attack"]["calls"] == 1, "Player attacks should be tracked"
+
+    def test_only_one_profiler_at_a_time(self):
+        """Test that nested profilers are refused"""
+        with AbilityProfiler():
+            with pytest.raises(RuntimeError):
+                AbilityProfiler().enable()
+
+    def test_batch_engine_sees_through_wrappers(self):
+        """Test that class detection still works while profiling"""
+        with AbilityProfiler():
+            assert attack_class_id(Warrior("W")) == WARRIOR_ID, "Wrapped attack should still be recognised"
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format"""
+        with AbilityProfiler() as profiler:
+            Rogue("R").sneak_attack(Character("T", 100, 0, 0))
+        text = profiler.to_prometheus()
+
+        assert 'character_ability_calls_total{class="Rogue",ability="sneak_attack"} 1' in text, "Calls should be exported"
+        assert 'character_ability_damage_bucket{class="Rogue",ability="sneak_attack",le="20"} 0' in text, "24 > 20"
+        assert 'character_ability_damage_bucket{class="Rogue",ability="sneak_attack",le="30"} 1' in text, "24 <= 30"
+        assert "# TYPE character_ability_damage histogram" in text, "Histogram type should be declared"
@@ -0,0 +1,166 @@
+import random
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Arena, StatusEffects, BufferedSink, set_event_sink,
+)
+
+@pytest.fixture
+def silent():
+    """Routes combat events to a buffer for the duration of a test"""
+    sink = BufferedSink()
+    previous = set_event_sink(sink)
+    yield sink
+    set_event_sink(previous)
+
+def crowded_arena(count, seed, cell_size=8.0):
+    """Builds an arena with `count` dummies on two teams at random positions"""
+    picker = random.Random(seed)
+    arena = Arena(cell_size)
+    characters = [Character(f"D{i}", 50, 1, 0) for i in range(count)]
+    for i, character in enumerate(characters):
+        arena.place(character, picker.uniform(-100, 100), picker.uniform(-100, 100), team=i % 2)
+    return arena, characters, picker
+
+def distance2(arena, first, second):
+    """Returns the squared distance between two placed characters"""
+    (x1, y1), (x2, y2) = arena.position(first), arena.position(second)
+    return (x1 - x2) ** 2 + (y1 - y2) ** 2
+
+class TestPlacement:
+    """Test placing, moving and removing characters"""
+
+    def test_place_move_remove(self):
+        """Test that positions follow incremental updates"""
+        arena = Arena(cell_size=10)
+        warrior = Warrior("W")
+        arena.place(warrior, 1, 1, team=1)
+        arena.move(warrior, 35, -4)
+
+        assert arena.position(warrior) == (35, -4) and arena.team(warrior) == 1, "Move should update position"
+        assert arena.within(35, -4, 1) == [warrior], "Warrior should be found in its new cell"
+        assert arena.within(1, 1, 5) == [], "Old cell should be empty"
+
+        arena.remove(warrior)
+        assert warrior not in arena and len(arena) == 0, "Warrior should be gone"
+
+    def test_double_place_is_rejected(self):
+        """Test that a character can only be placed once"""
+        arena = Arena()
+        mage = Mage("M")
+        arena.place(mage, 0, 0)
+
+        with pytest.raises(ValueError):
+            arena.place(mage, 5, 5)
+
+    def test_cell_size_must_be_positive(self):
+        """Test that a zero cell size is rejected"""
+        with pytest.raises(ValueError):
+            Arena(cell_size=0)
+
+class TestQueries:
+    """Test radius and nearest-enemy queries against brute force"""
+
+    @pytest.mark.parametrize("radius", [3, 12, 40, 500])
+    def test_within_matches_brute_force(self, radius):
+        """Test radius queries on a crowded battlefield"""
+        arena, characters, picker = crowded_arena(400, seed=radius)
+        for _ in range(20):
+            x, y = picker.uniform(-100, 100), picker.uniform(-100, 100)
+            expected = {c for c in characters
+                        if (arena.position(c)[0] - x) ** 2 + (arena.position(c)[1] - y) ** 2 <= radius ** 2}
+
+            assert set(arena.within(x, y, radius)) == expected, "Grid query should match a full scan"
+
+    def test_within_is_sorted_by_distance(self):
+        """Test that radius results come back nearest first"""
+        arena, _, _ = crowded_arena(200, seed=3)
+        found = arena.within(0, 0, 50)
+        distances = [arena.position(c)[0] ** 2 + arena.position(c)[1] ** 2 for c in found]
+
+        assert distances == sorted(distances), "Results should be ordered by distance"
+
+    def test_nearest_enemy_matches_brute_force(self):
+        """Test nearest-enemy queries, including after movement"""
+        arena, characters, picker = crowded_arena(300, seed=11)
+        for character in characters[:50]:
+            arena.move(character, picker.uniform(-150, 150), picker.uniform(-150, 150))
+
+        for character in characters[::7]:
+            enemies = [c for c in characters if arena.team(c) != arena.team(character)]
+            best = min(distance2(arena, character, c) for c in enemies)
+
+            assert distance2(arena, character, arena.nearest_enemy(character)) == best, "Should find the closest enemy"
+
+    def test_nearest_enemy_limits(self):
+        """Test max_radius, teams and defeated characters"""
+        arena = Arena(cell_size=5)
+        hero, ally, far, fallen = Warrior("Hero"), Mage("Ally"), Rogue("Far"), Rogue("Fallen")
+        arena.place(hero, 0, 0, team=1)
+        arena.place(ally, 1, 0, team=1)
+        arena.place(fallen, 2, 0, team=2)
+        arena.place(far, 60, 0, team=2)
+        fallen.health = 0
+
+        assert arena.nearest_enemy(hero) is far, "Allies and defeated enemies should be skipped"
+        assert arena.nearest_enemy(hero, max_radius=30) is None, "Enemies beyond max_radius should be ignored"
+
+    def test_nearest_enemy_in_sparse_arena(self, monkeypatch):
+        """Test that a distant enemy is found by scanning occupied cells, not thousands of empty rings"""
+        rings = []
+        original = Arena._ring
+        monkeypatch.setattr(Arena, "_ring", lambda self, cx, cy, ring: rings.append(ring) or original(self, cx, cy, ring))
+        arena = Arena(cell_size=1)
+        hero, enemy = Warrior("Hero"), Rogue("Enemy")
+        arena.place(hero, 0, 0, team=1)
+        arena.place(enemy, 2000, 0, team=2)
+
+        assert arena.nearest_enemy(hero) is enemy, "The only enemy should be found"
+        assert arena.nearest_enemy(hero, max_radius=1500) is None, "max_radius should still apply"
+        assert len(rings) <= 2, "Only the first ring should be walked before switching to a scan"
+
+class TestAreaAbilities:
+    """Test combat on the battlefield"""
+
+    def test_fireball_area_hits_enemies_in_radius(self, silent):
+        """Test that the area fireball damages only nearby enemies"""
+        arena = Arena(cell_size=4)
+        mage = Mage("M")
+        near1, near2, ally, far = (Character(name, 100, 0, 0) for name in ("Near1", "Near2", "Ally", "Far"))
+        arena.place(mage, 0, 0, team=1)
+        arena.place(ally, 10, 10, team=1)
+        arena.place(near1, 10, 11, team=2)
+        arena.place(near2, 13, 10, team=2)
+        arena.place(far, 30, 30, team=2)
+
+        hit = mage.fireball_area(arena, 10, 10, radius=4)
+
+        assert hit == [near1, near2], "Both enemies in the blast should be hit, nearest first"
+        assert (near1.health, near2.health, ally.health, far.health) == (70, 70, 100, 100), \
+            "Hits should go through take_damage; allies and distant enemies are untouched"
+        assert "M's FIREBALL engulfs Near1 for 30 damage!" in silent.render(), "Each hit should be reported"
+
+    def test_fireball_area_applies_burns(self, silent):
+        """Test that area hits count as fireballs for status effects"""
+        arena = Arena()
+        mage = Mage("M")
+        targets = [Character(f"T{i}", 100, 0, 0) for i in range(3)]
+        arena.place(mage, 0, 0, team=1)
+        for i, target in enumerate(targets):
+            arena.place(target, i, 0, team=2)
+
+        with StatusEffects() as effects:
+            mage.fireball_area(arena, 1, 0)
+            effects.advance()
+
+        assert [t.health for t in targets] == [65, 65, 65], "Every target should burn"
+
+    def test_attack_nearest(self, silent):
+        """Test that attack_nearest uses the normal attack on the closest enemy"""
+        arena = Arena()
+        warrior = Warrior("W")
+        close, distant = Character("Close", 100, 0, 0), Character("Distant", 100, 0, 0)
+        arena.place(warrior, 0, 0, team=1)
+        arena.place(distant, 20, 0, team=2)
+        arena.place(close, 3, 4, team=2)
+
+        assert arena.attack_nearest(warrior) is close and close.health == 80, "Closest enemy should be attacked"
@@ -0,0 +1,115 @@
+import json
+import pytest
+from project2_starter import (
+    Warrior, Mage, Rogue, wilson_interval, balance_candidates, evaluate_candidate,
+    search_balance, write_balance_report, CandidateResult,
+)
+
+SPACE = {"Warrior": {"health": [100, 140]}, "Rogue": {"attack.crit_chance": [0.3, 0.5]}}
+
+class TestCandidates:
+    """Test building candidates from a search space"""
+
+    def test_grid_covers_every_combination(self):
+        """Test that grid search enumerates the full product"""
+        candidates = balance_candidates(SPACE)
+
+        assert len(candidates) == 4, "2 x 2 grid should give 4 candidates"
+        assert {"Warrior": {"health": 140}, "Rogue": {"attack.crit_chance": 0.3}} in candidates, \
+            "Every combination should appear"
+
+    def test_random_samples_are_distinct_and_seeded(self):
+        """Test that random search draws distinct candidates reproducibly"""
+        space = {"Warrior": {"health": range(100, 150, 5), "strength": range(10, 20)}}
+        first = balance_candidates(space, "random", samples=15, seed=4)
+
+        assert len(first) == 15, "Should draw the requested number of candidates"
+        assert len({json.dumps(c, sort_keys=True) for c in first}) == 15, "Candidates should be distinct"
+        assert first == balance_candidates(space, "random", samples=15, seed=4), "Same seed, same candidates"
+
+    def test_unknown_strategy(self):
+        """Test that unsupported strategies are rejected"""
+        with pytest.raises(ValueError):
+            balance_candidates(SPACE, "annealing")
+
+class TestEvaluation:
+    """Test simulating a candidate against target win rates"""
+
+    def test_wilson_interval(self):
+        """Test that the interval contains the rate and narrows with more battles"""
+        low, high = wilson_interval(50, 100)
+        wide_low, wide_high = wilson_interval(5, 10)
+
+        assert low < 0.5 < high, "Interval should contain the observed rate"
+        assert high - low < wide_high - wide_low, "More battles should narrow the interval"
+
+    def test_settled_matchups_stop_early(self):
+        """Test that a lopsided matchup stops after the first batch"""
+        result = evaluate_candidate({"Warrior": {"health": 500}}, targets={("Warrior", "Rogue"): 0.5},
+                                    batch_size=20, max_battles=1000)
+        estimate = result.matchups[("Warrior", "Rogue")]
+
+        assert estimate.battles == 20, "A 500-health warrior should settle after one batch"
+        assert estimate.win_rate == 1.0 and result.score == 0.25, "Warrior should win every battle"
+
+    def test_ability_coefficients_are_tuned(self):
+        """Test that ability parameters change the simulated outcome"""
+        targets = {("Rogue", "Mage"): 0.5}
+        weak = evaluate_candidate({"Rogue": {"attack.crit_chance": 0.0}}, targets=targets, max_battles=200)
+        strong = evaluate_candidate({"Rogue": {"attack.crit_chance": 1.0}}, targets=targets, max_battles=200)
+
+        assert weak.matchups[("Rogue", "Mage")].win_rate < strong.matchups[("Rogue", "Mage")].win_rate, \
+            "Always-crit rogues should win more"
+
+    def test_non_rogue_crit_is_tuned(self):
+        """Test that a tuned crit chance changes outcomes for classes other than Rogue"""
+        targets = {("Warrior", "Rogue"): 0.5}
+        plain = evaluate_candidate({"Warrior": {"health": 50, "attack.crit_chance": 0.0}}, targets=targets, max_battles=200)
+        lucky = evaluate_candidate({"Warrior": {"health": 50, "attack.crit_chance": 0.9}}, targets=targets, max_battles=200)
+
+        assert plain.matchups[("Warrior", "Rogue")].win_rate < lucky.matchups[("Warrior", "Rogue")].win_rate, \
+            "Critical hits should make the warrior win more"
+
+    def test_unused_crit_chance_is_rejected(self):
+        """Test that a crit chance on an ability that never rolls is rejected instead of ignored"""
+        with pytest.raises(ValueError):
+            evaluate_candidate({"Mage": {"fireball.crit_chance": 0.5}})
+
+    def test_unknown_parameter(self):
+        """Test that parameters that don't exist are rejected"""
+        with pytest.raises(ValueError):
+            evaluate_candidate({"Mage": {"fireball.radius": 3}})
+
+    def test_tuning_does_not_change_the_classes(self):
+        """Test that evaluated candidates leave the real classes alone"""
+        evaluate_candidate({"Rogue": {"attack.crit_chance": 0.9}, "Warrior": {"health": 10}}, max_battles=50)
+
+        assert Rogue.CRIT_THRESHOLD == 3 and Warrior("W").health == 120, "Classes should be untouched"
+
+class TestSearch:
+    """Test the full search and report"""
+
+    def test_results_are_sorted_best_first(self):
+        """Test that search results come back ordered by score"""
+        results = search_balance(SPACE, workers=1, max_battles=200)
+        scores = [result.score for result in results]
+
+        assert all(isinstance(result, CandidateResult) for result in results), "Results should be records"
+        assert scores == sorted(scores), "Best candidates should come first"
+
+    def test_worker_count_does_not_change_results(self):
+        """Test that parallel evaluation matches a serial run"""
+        serial = search_balance(SPACE, workers=1, max_battles=100)
+        parallel = search_balance(SPACE, workers=2, max_battles=100)
+
+        assert serial == parallel, "Results should not depend on the number of workers"
+
+    def test_report(self, tmp_path):
+        """Test that the JSON report lists the best configurations"""
+        path = tmp_path / "balance.json"
+        write_balance_report(path, search_balance(SPACE, workers=1, max_battles=100), top=2)
+        report = json.loads(path.read_text())
+
+        assert report["candidates"] == 4 and len(report["best"]) == 2, "Report should keep the top two"
+        assert set(report["best"][0]["matchups"]["Warrior vs Mage"]) == {"target", "win_rate", "battles", "low", "high"}, \
+            "Each matchup should report its estimate"
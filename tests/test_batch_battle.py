@@ -0,0 +1,95 @@
+import random
+import pytest
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, Weapon, SimpleBattle,
+    BatchBattle, attack_class_id, WARRIOR_ID, ROGUE_ID, set_event_sink, NullSink,
+)
+
+np = pytest.importorskip("numpy")
+
+FACTORIES = [Warrior, Mage, Rogue]
+
+def random_pairs(count, seed):
+    """Builds a reproducible list of character pairs"""
+    picker = random.Random(seed)
+    return [(picker.choice(FACTORIES)("A%d" % i), picker.choice(FACTORIES)("B%d" % i)) for i in range(count)]
+
+class TestBatchConstruction:
+    """Test building batches from character objects"""
+
+    def test_class_ids(self):
+        """Test that each class maps to its attack formula"""
+        assert attack_class_id(Warrior("W")) == WARRIOR_ID, "Warrior should use the warrior formula"
+        assert attack_class_id(Rogue("R")) == ROGUE_ID, "Rogue should use the rogue formula"
+
+    def test_unknown_attack_is_rejected(self):
+        """Test that custom attack overrides are refused instead of silently mis-simulated"""
+        class Bard(Player):
+            def attack(self, target):
+                target.take_damage(1)
+
+        with pytest.raises(TypeError):
+            attack_class_id(Bard("Lute", "Bard", 50, 5, 5))
+
+    def test_from_pairs_does_not_modify_characters(self):
+        """Test that fighting a batch leaves the source characters untouched"""
+        pairs = random_pairs(10, seed=1)
+        BatchBattle.from_pairs(pairs).fight(rng=1)
+
+        assert all(a.health == type(a)("x").health for a, _ in pairs), "Source health should not change"
+
+class TestBatchMatchesSimpleBattle:
+    """Test that batch results match SimpleBattle.fight exactly"""
+
+    def test_deterministic_matchup(self):
+        """Test a matchup without randomness"""
+        result = BatchBattle.from_pairs([(Warrior("W"), Mage("M"))]).fight(rng=0)
+
+        assert result.health1.tolist() == [100], "Warrior should take one spell"
+        assert result.health2.tolist() == [60], "Mage should take one sword swing"
+        assert result.winner.tolist() == [1], "Warrior should win"
+
+    def test_same_rolls_same_results(self, monkeypatch):
+        """Test that every battle matches the object path when fed the same crit rolls"""
+        pairs = random_pairs(300, seed=7)
+        batch = BatchBattle.from_pairs(pairs)
+        rolls = batch.draw_rolls(np.random.default_rng(42))
+        result = batch.fight(rolls=rolls)
+
+        previous = set_event_sink(NullSink())
+        try:
+            for i, (first, second) in enumerate(pairs):
+                queue = iter([rolls[0, i]] * isinstance(first, Rogue) + [rolls[1, i]] * isinstance(second, Rogue))
+                monkeypatch.setattr(random, "randint", lambda a, b: int(next(queue)))
+                SimpleBattle(first, second).fight()
+
+                assert first.health == result.health1[i], "First character health should match"
+                assert second.health == result.health2[i], "Second character health should match"
+                expected = 1 if first.health > second.health else 2 if second.health > first.health else 0
+                assert result.winner[i] == expected, "Winner should match"
+        finally:
+            set_event_sink(previous)
+
+    def test_defeated_character_does_not_counter(self):
+        """Test that a character reduced to 0 health does not attack back"""
+        batch = BatchBattle([[100], [10]], [[50], [15]], [[0], [0]], [[0], [1]])
+        result = batch.fight(rng=0)
+
+        assert result.health2.tolist() == [0], "Second character should be defeated"
+        assert result.health1.tolist() == [100], "Defeated character should not strike back"
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed gives the same batch results"""
+        pairs = random_pairs(200, seed=3)
+        first = BatchBattle.from_pairs(pairs).fight(rng=11)
+        second = BatchBattle.from_pairs(pairs).fight(rng=11)
+
+        assert (first.health1 == second.health1).all() and (first.winner == second.winner).all(), "Runs should match"
+
+    def test_weapon_bonus_column(self):
+        """Test that equipped weapons are included in batch damage"""
+        warrior = Warrior("W")
+        warrior.equip(Weapon("Axe", 10))
+        result = BatchBattle.from_pairs([(warrior, Mage("M"))]).fight(rng=0)
+
+        assert result.health2.tolist() == [50], "Mage should take strength + 5 + 10"
@@ -0,0 +1,133 @@
+import random
+import pytest
+import project2_starter
+from project2_starter import Character, Warrior, Mage, Rogue, BufferedSink, set_event_sink, apply_damage
+
+@pytest.fixture
+def events():
+    """Routes combat events to a buffer for the duration of a test"""
+    sink = BufferedSink()
+    previous = set_event_sink(sink)
+    yield sink
+    set_event_sink(previous)
+
+def random_tick(size, hits, seed):
+    """Builds a reproducible roster and a tick of (indices, amounts)"""
+    picker = random.Random(seed)
+    roster = [picker.choice([Warrior, Mage, Rogue])(f"H{i}") for i in range(size)]
+    indices = [picker.randrange(size) for _ in range(hits)]
+    amounts = [picker.randint(0, 40) for _ in range(hits)]
+    return roster, indices, amounts
+
+class TestTakeDamageBatch:
+    """Test applying many hits to one character"""
+
+    def test_matches_sequential_hits(self, events):
+        """Test that the batch leaves the same health as one take_damage per hit"""
+        hits = [7, 12, 30, 5]
+        batched, sequential = Character("A", 50, 0, 0), Character("B", 50, 0, 0)
+        total = batched.take_damage_batch(hits)
+        for damage in hits:
+            sequential.take_damage(damage)
+
+        assert total == 54, "Total damage should be returned"
+        assert batched.health == sequential.health == 0, "Health should be clamped to 0 once"
+
+    def test_one_event_by_default(self, events):
+        """Test that a batch reports a single damage event with the total"""
+        Character("Boss", 500, 0, 0).take_damage_batch([10, 20, 30])
+
+        assert events.render() == ["Boss takes 60 damage! Health is now 440."], "One summary event expected"
+
+    def test_per_hit_events_on_request(self, events):
+        """Test that events=True reports every hit like take_damage"""
+        Character("Boss", 25, 0, 0).take_damage_batch([10, 20], events=True)
+
+        assert events.render() == ["Boss takes 10 damage! Health is now 15.", "Boss takes 20 damage! Health is now 0."], \
+            "Each hit should be reported with the running health"
+
+    def test_empty_batch(self, events):
+        """Test that no hits means no damage and no events"""
+        boss = Character("Boss", 25, 0, 0)
+
+        assert boss.take_damage_batch([]) == 0 and boss.health == 25 and events.events == [], "Nothing should happen"
+
+class TestApplyDamage:
+    """Test roster-level damage ticks"""
+
+    def test_matches_sequential_hits(self, events):
+        """Test that a tick gives the same health as applying every hit in order"""
+        roster, indices, amounts = random_tick(50, 400, seed=2)
+        expected, _, _ = random_tick(50, 400, seed=2)
+        for index, amount in zip(indices, amounts):
+            expected[index].take_damage(amount)
+
+        hit = apply_damage(roster, indices, amounts)
+
+        assert [c.health for c in roster] == [c.health for c in expected], "Final health should match"
+        assert hit == [roster[i] for i in sorted(set(indices))], "Hit characters should be returned in index order"
+
+    def test_one_event_per_character(self, events):
+        """Test that repeated hits on a character are summed into one event"""
+        roster = [Character("A", 100, 0, 0), Character("B", 100, 0, 0)]
+        apply_damage(roster, [1, 0, 1, 1], [5, 10, 20, 30])
+
+        assert events.render() == ["A takes 10 damage! Health is now 90.", "B takes 55 damage! Health is now 45."], \
+            "Each character should get one summary event"
+
+    def test_per_hit_events_on_request(self, events):
+        """Test that events=True falls back to ordered take_damage calls"""
+        roster = [Character("A", 100, 0, 0), Character("B", 100, 0, 0)]
+        apply_damage(roster, [1, 0, 1], [5, 10, 20], events=True)
+
+        assert len(events.events) == 3 and events.render()[2] == "B takes 20 damage! Health is now 75.", \
+            "Every hit should be reported in order"
+
+    def test_without_numpy(self, events, monkeypatch):
+        """Test that the pure-Python fallback gives the same result"""
+        roster, indices, amounts = random_tick(30, 200, seed=5)
+        expected, _, _ = random_tick(30, 200, seed=5)
+        apply_damage(expected, indices, amounts)
+
+        monkeypatch.setattr(project2_starter, "np", None)
+        apply_damage(roster, indices, amounts)
+
+        assert [c.health for c in roster] == [c.health for c in expected], "Fallback should match numpy"
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    @pytest.mark.parametrize("events_on", [True, False])
+    def test_negative_indices_count_from_the_end(self, events, monkeypatch, use_numpy, events_on):
+        """Test that -1 and the last index are the same character, clamped and reported once"""
+        if not use_numpy:
+            monkeypatch.setattr(project2_starter, "np", None)
+        roster = [Character(name, 30, 0, 0) for name in "ABC"]
+        hit = apply_damage(roster, [-1, 2], [20, 20], events=events_on)
+
+        assert hit == [roster[2]] and roster[2].health == 0, "Both hits should land on C once"
+        if not events_on:
+            assert events.render() == ["C takes 40 damage! Health is now 0."], "C should get a single event"
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_out_of_range_index(self, monkeypatch, use_numpy):
+        """Test that indices outside the roster are rejected"""
+        if not use_numpy:
+            monkeypatch.setattr(project2_starter, "np", None)
+        with pytest.raises(IndexError):
+            apply_damage([Character("A", 10, 0, 0)], [-2], [1])
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_float_damage_is_not_truncated(self, events, monkeypatch, use_numpy):
+        """Test that fractional damage gives the same health with and without numpy"""
+        if not use_numpy:
+            monkeypatch.setattr(project2_starter, "np", None)
+        roster = [Character("A", 100, 0, 0)]
+        apply_damage(roster, [0, 0], [2.5, 2.5])
+        single = Character("B", 100, 0, 0)
+        single.take_damage_batch([2.5, 2.5])
+
+        assert roster[0].health == single.health == 95.0, "Fractional damage should add up exactly"
+
+    def test_mismatched_lengths(self):
+        """Test that every hit needs an amount"""
+        with pytest.raises(ValueError):
+            apply_damage([Character("A", 10, 0, 0)], [0, 0], [1])
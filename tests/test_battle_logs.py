@@ -0,0 +1,83 @@
+import gzip
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Battle, BattleLogWriter, read_battle_log, replay_health, health_at,
+    get_event_sink,
+)
+
+def logged_battle(path, batch_size=1000):
+    """Logs a Warrior vs Mage fight (Warrior wins in four rounds)"""
+    with BattleLogWriter(path, batch_size=batch_size):
+        Battle(Warrior("W"), Mage("M")).fight_until_defeat(output=False)
+
+class TestBattleLogWriter:
+    """Test the streaming battle log writer"""
+
+    def test_log_is_gzip_jsonl(self, tmp_path):
+        """Test that the log is compressed JSON lines"""
+        path = tmp_path / "battle.jsonl.gz"
+        logged_battle(path)
+
+        with gzip.open(path, "rt") as handle:
+            first = handle.readline()
+        assert first.startswith('{"e":"character"'), "Log should start with a character record"
+
+    def test_every_event_is_recorded(self, tmp_path):
+        """Test that all attacks and damage events are logged"""
+        path = tmp_path / "battle.jsonl.gz"
+        logged_battle(path)
+        records = list(read_battle_log(path))
+
+        kinds = [record["e"] for record in records]
+        assert kinds.count("character") == 2, "Both fighters should be registered"
+        assert kinds.count("attack") == 7, "Four warrior swings and three spells"
+        assert kinds.count("damage") == 7, "Every attack deals damage"
+
+    def test_sink_is_restored(self, tmp_path):
+        """Test that the writer only captures events inside its block"""
+        before = get_event_sink()
+        logged_battle(tmp_path / "battle.jsonl.gz")
+
+        assert get_event_sink() is before, "Previous sink should be restored"
+
+    def test_small_batches_lose_nothing(self, tmp_path):
+        """Test that batched writes still capture every record"""
+        small, large = tmp_path / "small.gz", tmp_path / "large.gz"
+        logged_battle(small, batch_size=2)
+        logged_battle(large)
+
+        assert list(read_battle_log(small)) == list(read_battle_log(large)), "Batch size should not change content"
+
+    def test_direct_take_damage_is_logged(self, tmp_path):
+        """Test damage that doesn't come from an attack"""
+        path = tmp_path / "trap.gz"
+        with BattleLogWriter(path):
+            Character("Trapped", 50, 0, 0).take_damage(15)
+
+        character, damage = read_battle_log(path)
+        assert character["health"] == 50, "Starting health should be recovered from the damage"
+        assert damage["health"] == 35, "Resulting health should be logged"
+
+class TestReplay:
+    """Test lazy replay of battle logs"""
+
+    def test_health_at_turn(self, tmp_path):
+        """Test reconstructing health at specific turns"""
+        path = tmp_path / "battle.jsonl.gz"
+        logged_battle(path)
+
+        assert health_at(path, "M", 0) == 80, "Mage starts at 80"
+        assert health_at(path, "M", 1) == 60, "First sword swing"
+        assert health_at(path, "W", 2) == 100, "First spell"
+        assert health_at(path, "M", 7) == 0, "Mage falls on the last turn"
+        assert health_at(path, "Nobody", 7) is None, "Unknown characters have no health"
+
+    def test_replay_yields_each_turn(self, tmp_path):
+        """Test the per-turn replay generator"""
+        path = tmp_path / "battle.jsonl.gz"
+        logged_battle(path)
+
+        snapshots = [(turn, dict(health)) for turn, health in replay_health(path)]
+
+        assert [turn for turn, _ in snapshots] == list(range(8)), "Turns 0 through 7 should be replayed"
+        assert snapshots[-1][1] == {0: 60, 1: 0}, "Final health should match the battle"
@@ -0,0 +1,51 @@
+import importlib.util
+import json
+import os
+import pytest
+
+HARNESS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "run_benchmarks.py")
+
+@pytest.fixture(scope="module")
+def bench():
+    """Loads the standalone benchmark harness as a module"""
+    spec = importlib.util.spec_from_file_location("run_benchmarks", HARNESS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class TestBenchmarkHarness:
+    """Test the benchmark harness without doing full-length timing runs"""
+
+    def test_cases_cover_hot_paths(self, bench):
+        """Test that attacks, specials, battles, tournaments and construction are benchmarked"""
+        names = set(bench.build_cases())
+
+        for name in ["take_damage", "warrior.power_strike", "mage.fireball", "rogue.sneak_attack",
+                     "battle.simple_fight", "battle.until_defeat", "tournament.12_players", "construct.warrior"]:
+            assert name in names, f"{name} should be benchmarked"
+
+    def test_run_reports_positive_throughput(self, bench, capsys):
+        """Test that a quick run measures ops/sec and prints nothing from combat"""
+        results = bench.run(["warrior.attack", "battle.simple_fight"], min_time=0.01, repeat=1)
+
+        assert all(ops > 0 for ops in results.values()), "Throughput should be positive"
+        assert capsys.readouterr().out == "", "Benchmarks should not print combat output"
+
+    def test_compare_flags_regressions_past_threshold(self, bench):
+        """Test that only slowdowns beyond the threshold are reported"""
+        baseline = {"fast": 1000.0, "slow": 1000.0, "new": 0}
+        results = {"fast": 900.0, "slow": 700.0, "new": 5.0}
+
+        assert bench.compare(results, baseline, 0.2) == [("slow", 1000.0, 700.0)], "Only 'slow' regressed"
+
+    def test_save_and_compare_exit_status(self, bench, tmp_path, capsys):
+        """Test that --compare fails against an impossibly fast baseline"""
+        baseline = tmp_path / "baseline.json"
+        assert bench.main(["take_damage", "--min-time", "0.01", "--save", str(baseline)]) == 0, "Save should pass"
+
+        data = json.loads(baseline.read_text())
+        data["results"]["take_damage"] *= 1000
+        baseline.write_text(json.dumps(data))
+
+        assert bench.main(["take_damage", "--min-time", "0.01", "--compare", str(baseline)]) == 1, \
+            "A large slowdown should fail"
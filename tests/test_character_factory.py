@@ -0,0 +1,85 @@
+import pytest
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, Weapon, CharacterFactory, PLAYER_CLASSES,
+    set_event_sink, NullSink,
+)
+
+def stats(character):
+    """Returns the comparable state of a character"""
+    return (type(character), character.name, character.health, character.strength, character.magic,
+            character.character_class, character.level, character.experience, character.weapon, character.rng)
+
+class TestSpawning:
+    """Test spawning built-in classes from prototypes"""
+
+    def test_spawn_matches_constructor(self):
+        """Test that spawned characters equal normally constructed ones"""
+        factory = CharacterFactory()
+
+        for cls in (Warrior, Mage, Rogue):
+            assert stats(factory.spawn(cls.__name__, "Clone")) == stats(cls("Clone")), \
+                f"{cls.__name__} clone should match the constructor"
+
+    def test_spawn_many_gives_independent_characters(self):
+        """Test that clones don't share mutable state"""
+        first, second = CharacterFactory().spawn_many("Warrior", ["A", "B"])
+        first.health = 10
+        first.strength = 99
+        first.equip(Weapon("Axe", 5))
+
+        assert (second.health, second.strength, second.weapon) == (120, 15, None), "Second clone should be untouched"
+        assert second.damage_for("attack") == 20, "Second clone's damage should be unchanged"
+
+    def test_unknown_class(self):
+        """Test that unknown class names raise KeyError"""
+        with pytest.raises(KeyError):
+            CharacterFactory().spawn("Necromancer", "X")
+
+    def test_unslotted_subclass_falls_back_to_copying(self):
+        """Test registering a subclass that has an instance __dict__"""
+        class Knight(Warrior):
+            def __init__(self, name):
+                super().__init__(name)
+                self.title = "Sir"
+
+        factory = CharacterFactory(registry={})
+        factory.register(Knight)
+        knight = factory.spawn("Knight", "Lancelot")
+
+        assert (knight.name, knight.title, knight.health) == ("Lancelot", "Sir", 120), "Knight should be cloned"
+
+class TestDataDrivenClasses:
+    """Test declaring new classes from data"""
+
+    def test_define_class_from_data(self):
+        """Test that a defined class gets its stats and attack formula"""
+        factory = CharacterFactory(registry={})
+        Paladin = factory.define("Paladin", health=110, strength=13, magic=12,
+                                 attack=lambda c: c.strength + c.magic // 2, level_growth=(10, 1, 2))
+        paladin = factory.spawn("Paladin", "Uther")
+        target = Character("Target", 100, 0, 0)
+
+        previous = set_event_sink(NullSink())
+        try:
+            paladin.attack(target)
+        finally:
+            set_event_sink(previous)
+
+        assert isinstance(paladin, Player) and type(paladin) is Paladin, "Defined class should be a Player"
+        assert (paladin.health, paladin.character_class) == (110, "Paladin"), "Base stats should be applied"
+        assert target.health == 81, "Attack formula should be strength + magic // 2"
+        paladin.gain_experience(100)
+        assert paladin.magic == 14, "Level growth should come from the data"
+
+    def test_default_registry_is_private(self):
+        """Test that defining a class on a default factory leaves the roster registry alone"""
+        factory = CharacterFactory()
+        factory.define("Warrior", 10, 1, 1)
+
+        assert factory.registry is not PLAYER_CLASSES and PLAYER_CLASSES["Warrior"] is Warrior, \
+            "Built-in classes should not be replaced process-wide"
+        assert factory.spawn("Warrior", "W").health == 10, "The factory should use its own definition"
+
+    def test_registry_can_be_shared_with_rosters(self):
+        """Test that sharing the roster class registry is an explicit opt-in"""
+        assert CharacterFactory(registry=PLAYER_CLASSES).registry is PLAYER_CLASSES, "Shared registry should be used as is"
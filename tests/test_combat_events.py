@@ -0,0 +1,83 @@
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue,
+    AttackEvent, DamageEvent, NullSink, BufferedSink, ConsoleSink,
+    get_event_sink, set_event_sink,
+)
+
+@pytest.fixture
+def buffered():
+    """Routes combat events into a BufferedSink for the duration of a test"""
+    sink = BufferedSink()
+    previous = set_event_sink(sink)
+    yield sink
+    set_event_sink(previous)
+
+class TestEventSinks:
+    """Test that combat events reach the selected sink"""
+
+    def test_default_sink_is_console(self):
+        """Test that the console sink is used unless another one is selected"""
+        assert isinstance(get_event_sink(), ConsoleSink), "Console output should be the default"
+
+    def test_attack_emits_typed_events(self, buffered):
+        """Test that an attack produces an AttackEvent followed by a DamageEvent"""
+        warrior = Warrior("EventWarrior")
+        target = Character("EventTarget", 100, 0, 0)
+
+        warrior.attack(target)
+
+        attack, damage = buffered.events
+        assert isinstance(attack, AttackEvent), "First event should describe the attack"
+        assert isinstance(damage, DamageEvent), "Second event should describe the damage"
+        assert attack.attacker is warrior and attack.target is target, "Event should reference both characters"
+        assert attack.ability == "attack", "Ability name should be recorded"
+        assert attack.damage == 20, "Warrior attack damage should be strength + 5"
+        assert damage.health == 80, "Damage event should carry the resulting health"
+
+    def test_special_abilities_are_named(self, buffered):
+        """Test that special abilities report their own ability names"""
+        target = Character("AbilityTarget", 500, 0, 0)
+
+        Warrior("W").power_strike(target)
+        Mage("M").fireball(target)
+        Rogue("R").sneak_attack(target)
+
+        abilities = [event.ability for event in buffered.events if isinstance(event, AttackEvent)]
+        assert abilities == ["power_strike", "fireball", "sneak_attack"], "Each ability should be identified"
+
+    def test_null_sink_prints_nothing(self, capsys):
+        """Test that the null sink suppresses all combat output"""
+        previous = set_event_sink(NullSink())
+        try:
+            target = Character("QuietTarget", 100, 0, 0)
+            Mage("QuietMage").attack(target)
+        finally:
+            set_event_sink(previous)
+
+        assert capsys.readouterr().out == "", "Nothing should be printed"
+        assert target.health == 80, "Damage should still be applied"
+
+    def test_console_output_is_unchanged(self, capsys):
+        """Test that the console sink prints the classic messages"""
+        mage = Mage("Merlin")
+        target = Character("Dummy", 100, 0, 0)
+
+        mage.fireball(target)
+
+        assert capsys.readouterr().out == (
+            "Merlin launches a FIREBALL at Dummy for 30 damage!\n"
+            "Dummy takes 30 damage! Health is now 70.\n"
+        ), "Console output should match the original print statements"
+
+    def test_buffered_events_render_like_console(self, buffered, capsys):
+        """Test that buffered events render to the same lines the console prints"""
+        target = Character("RenderTarget", 100, 0, 0)
+        Warrior("RenderWarrior").power_strike(target)
+        lines = buffered.render()
+
+        set_event_sink(ConsoleSink())
+        target.health = 100
+        Warrior("RenderWarrior").power_strike(target)
+
+        assert capsys.readouterr().out.splitlines() == lines, "Rendering should match console output"
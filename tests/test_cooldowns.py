@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Encounter, EncounterScheduler,
+    CooldownManager, AbilityCost, ABILITY_COSTS,
+)
+
+class TestReadiness:
+    """Test cooldown and resource checks"""
+
+    def test_basic_attack_is_always_ready(self):
+        """Test that abilities without a cost never go on cooldown"""
+        manager = CooldownManager()
+        warrior = Warrior("W")
+
+        assert all(manager.use(warrior, "attack", turn) for turn in range(5)), "Attack should never be blocked"
+
+    def test_cooldown_expires_on_its_turn(self):
+        """Test that an ability is ready again exactly `cooldown` turns after use"""
+        manager = CooldownManager()
+        warrior = Warrior("W")
+
+        assert manager.use(warrior, "power_strike", 1), "First power strike should be allowed"
+        assert not manager.is_ready(warrior, "power_strike", 3), "Still cooling down on turn 3"
+        assert manager.is_ready(warrior, "power_strike", 4), "Ready again on turn 1 + 3"
+
+    def test_resources_regenerate_lazily(self):
+        """Test that mana is spent on use and regenerates with elapsed turns"""
+        manager = CooldownManager(costs={"fireball": AbilityCost(0, mana=60)}, mana_regen=10)
+        mage = Mage("M")
+        manager.use(mage, "fireball", 0)
+
+        assert manager.mana(mage, 0) == 40, "Fireball should cost 60 mana"
+        assert not manager.use(mage, "fireball", 1), "50 mana isn't enough for another fireball"
+        assert manager.mana(mage, 2) == 60 and manager.use(mage, "fireball", 2), "Mana should regenerate"
+        assert manager.mana(mage, 100) == 100, "Mana should cap at the maximum"
+
+    def test_failed_use_changes_nothing(self):
+        """Test that using an ability that isn't ready leaves state untouched"""
+        manager = CooldownManager()
+        rogue = Rogue("R")
+        manager.use(rogue, "sneak_attack", 0)
+        stamina = manager.stamina(rogue, 1)
+
+        assert not manager.use(rogue, "sneak_attack", 1), "Sneak attack should be on cooldown"
+        assert manager.stamina(rogue, 1) == stamina, "Stamina should not be spent"
+
+    def test_ready_abilities(self):
+        """Test that one call lists every ability the character can use right now"""
+        manager = CooldownManager()
+        warrior, mage = Warrior("W"), Mage("M")
+        manager.use(warrior, "power_strike", 0)
+
+        assert manager.ready_abilities(warrior, 1) == ("attack",), "Power strike is cooling down"
+        assert manager.ready_abilities(warrior, 3) == ("attack", "power_strike"), "Power strike is back"
+        assert manager.ready_abilities(mage, 0) == ("attack", "fireball"), "Mage only lists its own abilities"
+        assert manager.ready_abilities(Character("C", 10, 1, 1), 0) == ("attack",), "Base characters only attack"
+
+    def test_characters_are_independent(self):
+        """Test that cooldowns are tracked per character"""
+        manager = CooldownManager()
+        first, second = Warrior("A"), Warrior("B")
+        manager.use(first, "power_strike", 0)
+
+        assert manager.is_ready(second, "power_strike", 0), "Another warrior should not share the cooldown"
+
+    def test_register_is_idempotent(self):
+        """Test that each character gets one column slot"""
+        manager = CooldownManager()
+        roster = [Rogue(f"R{i}") for i in range(1000)]
+        indices = [manager.register(rogue) for rogue in roster]
+
+        assert indices == list(range(1000)), "Characters should get consecutive slots"
+        assert manager.register(roster[0]) == 0 and len(manager) == 1000, "Registering twice keeps the slot"
+
+    def test_unregister_frees_the_slot(self):
+        """Test that despawned characters are dropped and their column is reused with fresh state"""
+        manager = CooldownManager()
+        mob, replacement = Warrior("Mob"), Warrior("Replacement")
+        slot = manager.register(mob)
+        manager.use(mob, "power_strike", 0)
+
+        assert manager.unregister(mob) and not manager.unregister(mob), "Only registered characters are removed"
+        assert len(manager) == 0, "The manager should forget the mob"
+        assert manager.register(replacement) == slot, "The freed column should be reused"
+        assert manager.is_ready(replacement, "power_strike", 0) and manager.stamina(replacement, 0) == 100, \
+            "A reused column should start with full resources and no cooldowns"
+
+    def test_memory_is_reused(self):
+        """Test that spawning and despawning mobs doesn't grow the columns"""
+        manager = CooldownManager()
+        slots = set()
+        for wave in range(10):
+            mobs = [Rogue(f"R{wave}-{i}") for i in range(100)]
+            slots.update(manager.register(mob) for mob in mobs)
+            for mob in mobs:
+                manager.unregister(mob)
+
+        assert slots == set(range(100)), "Columns should only be as long as the largest wave"
+
+    def test_default_costs(self):
+        """Test that every special ability has a cost"""
+        assert set(ABILITY_COSTS) == {"power_strike", "fireball", "sneak_attack"}, "Specials should have costs"
+
+class TestEncounterCooldowns:
+    """Test that encounters stop controllers from spamming specials"""
+
+    def test_fireball_spam_falls_back_to_attack(self):
+        """Test that a fireball on cooldown becomes a basic attack"""
+        async def always_fireball(actor, opponent):
+            return "fireball"
+
+        encounter = Encounter(Mage("M"), Character("Dummy", 200, 0, 0), controllers=(always_fireball, None),
+                              cooldowns=CooldownManager())
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.rounds == 8, "Fireballs should alternate with 20-damage attacks"
@@ -0,0 +1,97 @@
+import json
+import pickle
+import random
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Weapon, Battle, record_battle, play_record, fast_forward,
+    BattleRecord, FighterSpec, Replay, CharacterFactory, AbilitySpec,
+)
+
+FACTORIES = [Warrior, Mage, Rogue]
+
+class TestBattleRecords:
+    """Test describing battles by stats, seed and actions"""
+
+    def test_record_snapshots_stats(self):
+        """Test that a record captures the fighters' current stats"""
+        rogue = Rogue("R")
+        rogue.health = 50
+        rogue.equip(Weapon("Dagger", 4))
+        record = record_battle(rogue, Mage("M"), seed=1)
+
+        assert isinstance(record, BattleRecord), "A BattleRecord should be returned"
+        assert record.fighters[0][:6] == ("Rogue", "R", 50, 12, 10, 4), "Stats and weapon bonus should be captured"
+        assert dict(record.fighters[0].ability_specs)["sneak_attack"] == ("strength", 2, 0, 0.0), \
+            "Ability specs should be captured as plain data"
+
+    def test_invalid_actions_are_rejected(self):
+        """Test that a side can only use abilities its class has"""
+        with pytest.raises(ValueError):
+            record_battle(Mage("M"), Warrior("W"), seed=1, actions=[(0, "power_strike")])
+
+    def test_defined_classes_replay_exactly(self):
+        """Test that a factory-defined class keeps its own attack on replay"""
+        paladin = CharacterFactory(registry={}).define("Paladin", 100, 5, 10, attack=AbilitySpec("magic", 1, 20))
+        result = Battle(paladin("P"), Warrior("W"), rng=random.Random(7)).fight_until_defeat(output=False)
+        record = record_battle(paladin("P"), Warrior("W"), seed=7)
+
+        assert (result.health1, result.health2) == play_record(record)[:2] == fast_forward(record)[:2], \
+            "Replays should match the live battle"
+
+    def test_records_are_plain_data(self):
+        """Test that a record with a defined class survives pickle and JSON"""
+        brute = CharacterFactory(registry={}).define("Brute", 150, 12, 0, attack=AbilitySpec("strength", 2))
+        record = record_battle(brute("B"), Mage("M"), seed=3)
+        expected = play_record(record)
+
+        decoded = json.loads(json.dumps(record))
+        from_json = BattleRecord([FighterSpec(*fighter) for fighter in decoded[0]], decoded[1], decoded[2])
+
+        assert play_record(pickle.loads(pickle.dumps(record))) == expected, "Pickled record should replay the same"
+        assert play_record(from_json) == fast_forward(from_json) == expected, "JSON record should replay the same"
+
+    def test_custom_attack_methods_are_rejected(self):
+        """Test that behaviour that can't be written down as data is refused at record time"""
+        class Trickster(Warrior):
+            def attack(self, target):
+                target.take_damage(1)
+
+        with pytest.raises(ValueError):
+            record_battle(Trickster("T"), Mage("M"), seed=1)
+
+class TestReplayEngines:
+    """Test replaying records with objects and with fast-forward"""
+
+    def test_default_actions_match_fight_until_defeat(self):
+        """Test that a default record replays exactly like a seeded Battle"""
+        record = record_battle(Rogue("R"), Warrior("W"), seed=99)
+        result = Battle(Rogue("R"), Warrior("W"), rng=random.Random(99)).fight_until_defeat(output=False)
+
+        assert play_record(record)[:2] == (result.health1, result.health2), "Object replay should match"
+        assert fast_forward(record)[:2] == (result.health1, result.health2), "Fast-forward should match"
+
+    def test_fast_forward_matches_objects_for_many_fights(self):
+        """Test both engines agree on random matchups and action lists"""
+        picker = random.Random(4)
+        for seed in range(300):
+            first, second = picker.choice(FACTORIES)("A"), picker.choice(FACTORIES)("B")
+            specials = {Warrior: "power_strike", Mage: "fireball", Rogue: "sneak_attack"}
+            actions = [(side, picker.choice(["attack", specials[type((first, second)[side])]]))
+                       for _ in range(10) for side in (0, 1)]
+            record = record_battle(first, second, seed=seed, actions=actions)
+
+            assert fast_forward(record) == play_record(record), f"Engines disagree for seed {seed}"
+
+    def test_fast_forward_to_turn(self):
+        """Test stopping part-way through a battle"""
+        record = record_battle(Warrior("W"), Mage("M"), seed=0)
+
+        assert fast_forward(record, turn=0) == (120, 80, 0), "Turn 0 is the starting state"
+        assert fast_forward(record, turn=3) == (100, 40, 3), "Two swings and one spell"
+        assert fast_forward(record) == Replay(60, 0, 7), "Full replay ends when the Mage falls"
+
+    def test_replay_is_silent(self, capsys):
+        """Test that replays print nothing by default"""
+        play_record(record_battle(Warrior("W"), Rogue("R"), seed=3))
+
+        assert capsys.readouterr().out == "", "Replays should be silent"
@@ -0,0 +1,124 @@
+import pytest
+import project2_starter
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, Battle, XP_TABLE, MAX_LEVEL,
+    level_for_experience, experience_for_defeat, award_experience,
+)
+
+class TestExperienceCurve:
+    """Test the precomputed XP threshold table"""
+
+    def test_table_is_increasing(self):
+        """Test that every level needs more experience than the last"""
+        assert len(XP_TABLE) == MAX_LEVEL, "One threshold per level"
+        assert XP_TABLE[0] == 0, "Level 1 needs no experience"
+        assert all(a < b for a, b in zip(XP_TABLE, XP_TABLE[1:])), "Thresholds should increase"
+
+    def test_level_lookup(self):
+        """Test level lookup at and around thresholds"""
+        assert level_for_experience(0) == 1, "Fresh players are level 1"
+        assert level_for_experience(99) == 1, "Just short of level 2"
+        assert level_for_experience(100) == 2, "Exactly at the level 2 threshold"
+        assert level_for_experience(10 ** 9) == MAX_LEVEL, "Level is capped"
+
+class TestGainExperience:
+    """Test experience and level growth on single players"""
+
+    def test_level_up_grows_class_stats(self):
+        """Test that each class grows its own stats"""
+        warrior, mage = Warrior("W"), Mage("M")
+
+        assert warrior.gain_experience(300) == 2, "300 XP reaches level 3"
+        mage.gain_experience(100)
+
+        assert (warrior.level, warrior.health, warrior.strength, warrior.magic) == (3, 144, 19, 5), \
+            "Warrior gains health and strength"
+        assert (mage.level, mage.health, mage.strength, mage.magic) == (2, 86, 8, 23), "Mage gains magic"
+
+    def test_level_up_updates_damage(self):
+        """Test that new strength is used by abilities right away"""
+        rogue = Rogue("R")
+        rogue.damage_table()
+        rogue.gain_experience(100)
+
+        assert rogue.damage_for("sneak_attack") == 28, "Sneak attack should use the new strength"
+
+    def test_negative_experience_is_rejected(self):
+        """Test that experience can't be taken away"""
+        with pytest.raises(ValueError):
+            Warrior("W").gain_experience(-5)
+
+class TestDefeatExperience:
+    """Test experience from winning battles"""
+
+    def test_winner_gains_experience(self):
+        """Test that defeating an opponent grants experience"""
+        warrior, mage = Warrior("W"), Mage("M")
+        mage.level = 2
+
+        Battle(warrior, mage, grant_experience=True).fight_until_defeat(output=False)
+
+        assert warrior.experience == experience_for_defeat(mage) == 100, "Level 2 opponents give 100 XP"
+        assert warrior.level == 2, "100 XP is enough for level 2"
+
+    def test_time_out_grants_nothing(self):
+        """Test that surviving to the round cap is not a defeat"""
+        player = Player("P", "Player", 50, 1, 0)
+        Battle(player, Character("Wall", 1000, 0, 0), grant_experience=True).fight_until_defeat(max_rounds=2, output=False)
+
+        assert player.experience == 0, "No experience without a defeat"
+
+    def test_experience_is_opt_in(self):
+        """Test that a default Battle leaves the winner's level and stats alone"""
+        warrior = Warrior("W")
+        Battle(warrior, Mage("M")).fight_until_defeat(output=False)
+
+        assert (warrior.experience, warrior.level, warrior.strength) == (0, 1, 15), "Experience should not be granted"
+
+class TestBulkAwards:
+    """Test awarding experience to a whole roster at once"""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_fractional_experience_is_kept(self, monkeypatch, use_numpy):
+        """Test that bulk awards don't truncate fractional experience"""
+        if not use_numpy:
+            monkeypatch.setattr(project2_starter, "np", None)
+        bulk, single = Warrior("A"), Warrior("B")
+        award_experience([bulk], [99.5])
+        award_experience([bulk], [0.5])
+        single.gain_experience(99.5)
+        single.gain_experience(0.5)
+
+        assert (bulk.experience, bulk.level) == (single.experience, single.level) == (100.0, 2), \
+            "Bulk awards should match gain_experience"
+
+    def test_bulk_matches_single_awards(self):
+        """Test that the vectorized pass gives the same result as one-by-one awards"""
+        amounts = [0, 50, 100, 350, 5000, 99999]
+        bulk = [Warrior("W%d" % i) for i in range(3)] + [Mage("M"), Rogue("R"), Player("P", "Player", 10, 1, 1)]
+        single = [Warrior("W%d" % i) for i in range(3)] + [Mage("M"), Rogue("R"), Player("P", "Player", 10, 1, 1)]
+
+        gained = award_experience(bulk, amounts)
+        expected = [player.gain_experience(amount) for player, amount in zip(single, amounts)]
+
+        assert gained == expected, "Levels gained should match"
+        for a, b in zip(bulk, single):
+            assert (a.level, a.experience, a.health, a.strength, a.magic) == \
+                (b.level, b.experience, b.health, b.strength, b.magic), "Stats should match"
+
+    def test_scalar_amount_and_validation(self):
+        """Test one amount for everyone and bad inputs"""
+        roster = [Rogue("R1"), Rogue("R2")]
+
+        assert award_experience(roster, 100) == [1, 1], "Everyone should reach level 2"
+        with pytest.raises(ValueError):
+            award_experience(roster, [1])
+        with pytest.raises(ValueError):
+            award_experience(roster, [10, -10])
+
+    def test_without_numpy(self, monkeypatch):
+        """Test the pure-Python fallback"""
+        monkeypatch.setattr(project2_starter, "np", None)
+        roster = [Warrior("W"), Mage("M")]
+
+        assert award_experience(roster, [300, 50]) == [2, 0], "Fallback should find the same levels"
@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Battle, Encounter, EncounterScheduler, InputController, BufferedSink,
+)
+
+class TestEncounter:
+    """Test single encounters driven by the scheduler"""
+
+    def test_matches_fight_until_defeat(self):
+        """Test that an uncontrolled encounter plays like Battle.fight_until_defeat"""
+        scheduler = EncounterScheduler()
+        scheduler.add(Encounter(Warrior("W"), Mage("M")))
+
+        results = asyncio.run(scheduler.run())
+        expected = Battle(Warrior("W"), Mage("M")).fight_until_defeat(output=False)
+
+        assert results == [expected], "Scheduler result should match the synchronous battle"
+
+    def test_controller_picks_special_abilities(self):
+        """Test that a controller can choose abilities each turn"""
+        async def always_fireball(actor, opponent):
+            return "fireball"
+
+        encounter = Encounter(Mage("M"), Character("Dummy", 60, 0, 0), controllers=(always_fireball, None))
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.rounds == 2, "Two 30-damage fireballs should finish a 60-health dummy"
+
+    def test_foreign_abilities_fall_back_to_attack(self):
+        """Test that a controller can't use another class's ability"""
+        async def wants_power_strike(actor, opponent):
+            return "power_strike"
+
+        encounter = Encounter(Mage("M"), Character("Dummy", 20, 0, 0), controllers=(wants_power_strike, None))
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.winner == 1, "Mage should still win with a basic attack"
+
+    def test_input_timeout_uses_basic_attack(self):
+        """Test that players who don't answer in time make a basic attack"""
+        idle = InputController()  # Nobody ever puts a choice
+        encounter = Encounter(Warrior("W"), Character("Dummy", 20, 0, 0), controllers=(idle, None),
+                              input_timeout=0.01)
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.winner == 1, "Timed-out warrior should attack and win"
+
+    def test_queued_player_input(self):
+        """Test that queued player input is used for the next turn"""
+        player = InputController()
+        player.put("power_strike")
+        encounter = Encounter(Warrior("W"), Character("Dummy", 30, 0, 0), controllers=(player, None))
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result == (1, 1, 120, 0), "One power strike should finish the dummy"
+
+class TestScheduler:
+    """Test multiplexing many encounters on one event loop"""
+
+    def test_many_encounters_complete(self):
+        """Test that thousands of encounters all finish"""
+        scheduler = EncounterScheduler()
+        for i in range(2000):
+            scheduler.add(Encounter(Rogue("R%d" % i), Warrior("W%d" % i)))
+
+        results = asyncio.run(scheduler.run())
+
+        assert all(result is not None for result in results), "Every encounter should have a result"
+        assert scheduler.latency_summary()["ticks"] == len(scheduler.tick_latencies) > 0, "Ticks should be timed"
+
+    def test_turns_are_interleaved_fairly(self):
+        """Test that ready encounters take turns in the order they were added"""
+        sink = BufferedSink()
+        scheduler = EncounterScheduler(sink=sink)
+        for i in range(3):
+            scheduler.add(Encounter(Warrior("W%d" % i), Mage("M%d" % i)))
+        asyncio.run(scheduler.run())
+
+        first_attackers = [event.attacker.name for event in sink.events[::2][:3]]
+        assert first_attackers == ["W0", "W1", "W2"], "Encounters should take turns in order"
+
+    def test_idle_player_does_not_delay_others(self):
+        """Test that an encounter waiting on input doesn't hold up the other encounters"""
+        sink = BufferedSink()
+        scheduler = EncounterScheduler(sink=sink)
+        scheduler.add(Encounter(Warrior("Idle"), Character("Dummy", 40, 0, 0), controllers=(InputController(), None),
+                                input_timeout=0.2))
+        for i in range(20):
+            scheduler.add(Encounter(Warrior("W%d" % i), Mage("M%d" % i)))
+        asyncio.run(scheduler.run())
+
+        lines = sink.render()
+        idle = [i for i, line in enumerate(lines) if "Idle" in line or "Dummy" in line]
+        assert min(idle) > max(set(range(len(lines))) - set(idle)), "Other encounters should finish while Idle waits"
+        assert len(scheduler.tick_latencies) == sum(e.turns_taken for e in scheduler.encounters), \
+            "Every turn should be timed"
+
+    def test_latency_summary_fields(self):
+        """Test the latency report"""
+        summary = EncounterScheduler().latency_summary()
+
+        assert set(summary) == {"ticks", "mean", "p50", "p99", "max"}, "All latency fields should be reported"
@@ -0,0 +1,37 @@
+import copy
+import pickle
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon
+
+class TestSlottedLayout:
+    """Test the compact __slots__ layout of the character hierarchy"""
+
+    def test_no_instance_dict(self):
+        """Test that characters and weapons don't carry a per-instance __dict__"""
+        objects = [Character("C", 10, 1, 1), Player("P", "Player", 10, 1, 1),
+                   Warrior("W"), Mage("M"), Rogue("R"), Weapon("Sword", 5)]
+
+        for obj in objects:
+            assert not hasattr(obj, "__dict__"), f"{type(obj).__name__} should not have a __dict__"
+
+    def test_attribute_names_are_unchanged(self):
+        """Test that the slotted classes keep the original attribute names"""
+        rogue = Rogue("SlotRogue")
+
+        assert (rogue.name, rogue.health, rogue.strength, rogue.magic) == ("SlotRogue", 90, 12, 10), \
+            "Base stats should be unchanged"
+        assert (rogue.character_class, rogue.level, rogue.experience) == ("Rogue", 1, 0), \
+            "Player stats should be unchanged"
+
+    def test_unknown_attributes_are_rejected(self):
+        """Test that typos in attribute names fail loudly instead of creating new fields"""
+        with pytest.raises(AttributeError):
+            Warrior("Typo").helth = 5
+
+    def test_copy_and_pickle(self):
+        """Test that slotted characters still copy and pickle (used by tournaments)"""
+        mage = Mage("CopyMage")
+        mage.health = 42
+
+        for clone in (copy.copy(mage), pickle.loads(pickle.dumps(mage))):
+            assert type(clone) is Mage and clone.health == 42, "Clones should keep class and stats"
@@ -0,0 +1,49 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, SimpleBattle, Battle, BattleResult
+
+class TestFightUntilDefeat:
+    """Test the multi-round battle loop"""
+
+    def test_battle_extends_simple_battle(self):
+        """Test that Battle keeps the original single-round fight available"""
+        battle = Battle(Warrior("W"), Mage("M"))
+
+        assert isinstance(battle, SimpleBattle), "Battle should inherit from SimpleBattle"
+        assert callable(battle.fight), "Original fight() should still be available"
+
+    def test_fights_until_one_side_is_defeated(self):
+        """Test that the loop stops as soon as one character reaches 0 health"""
+        warrior = Warrior("W")
+        mage = Mage("M")
+
+        result = Battle(warrior, mage).fight_until_defeat(output=False)
+
+        # Warrior deals 20 per round to 80 health, Mage deals 20 back until it falls
+        assert isinstance(result, BattleResult), "A compact result record should be returned"
+        assert result == (1, 4, 60, 0), "Warrior should win in four rounds with 60 health left"
+        assert (warrior.health, mage.health) == (60, 0), "Characters should keep their final health"
+
+    def test_round_cap(self):
+        """Test that max_rounds stops fights that cannot finish"""
+        first = Character("Pacifist1", 50, 0, 0)
+        second = Character("Pacifist2", 50, 0, 0)
+
+        result = Battle(first, second).fight_until_defeat(max_rounds=7, output=False)
+
+        assert result.rounds == 7, "Fight should stop at the round cap"
+        assert result.winner == 0, "Equal health after the cap is a tie"
+
+    def test_silent_mode_prints_nothing(self, capsys):
+        """Test that output=False skips banners, stats and attack messages"""
+        Battle(Rogue("R"), Mage("M")).fight_until_defeat(output=False)
+
+        assert capsys.readouterr().out == "", "Silent battles should not print"
+
+    def test_console_mode_reports_winner(self, capsys):
+        """Test that output=True prints the battle like SimpleBattle does"""
+        Battle(Warrior("Sir Galahad"), Mage("Merlin")).fight_until_defeat()
+        out = capsys.readouterr().out
+
+        assert "=== BATTLE: Sir Galahad vs Merlin ===" in out, "Battle banner should be printed"
+        assert "--- Round 4 ---" in out, "Each round should be announced"
+        assert "🏆 Sir Galahad wins!" in out, "Winner should be announced"
@@ -0,0 +1,60 @@
+import random
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, Battle, predict_outcome, attack_damage_distribution, Prediction,
+)
+
+class TestDamageDistributions:
+    """Test the per-class attack damage distributions"""
+
+    def test_fixed_damage_classes(self):
+        """Test that Warrior and Mage attacks have a single outcome"""
+        assert attack_damage_distribution(Warrior("W")) == ((20, 1.0),), "Warrior hits for strength + 5"
+        assert attack_damage_distribution(Mage("M")) == ((20, 1.0),), "Mage hits for magic"
+
+    def test_rogue_crit_distribution(self):
+        """Test that Rogue has a 30% chance of double damage"""
+        assert attack_damage_distribution(Rogue("R")) == ((24, 0.3), (12, 0.7)), "Rogue crits 30% of the time"
+
+class TestPredictOutcome:
+    """Test exact battle outcome predictions"""
+
+    def test_deterministic_matchup(self):
+        """Test a matchup that always ends the same way"""
+        prediction = predict_outcome(Warrior("W"), Mage("M"))
+
+        assert isinstance(prediction, Prediction), "A Prediction record should be returned"
+        assert prediction == (1.0, 0.0, 0.0, 4.0), "Warrior always wins in four rounds"
+
+    def test_probabilities_sum_to_one(self):
+        """Test that win, tie and loss cover every outcome"""
+        prediction = predict_outcome(Rogue("R"), Warrior("W"))
+
+        assert prediction.win + prediction.tie + prediction.loss == pytest.approx(1.0), "Probabilities should sum to 1"
+
+    def test_round_cap_decides_on_health(self):
+        """Test that fights stopped by the cap are decided on remaining health"""
+        prediction = predict_outcome(Character("A", 60, 0, 0), Character("B", 50, 0, 0), max_rounds=3)
+
+        assert prediction == (1.0, 0.0, 0.0, 3.0), "Healthier character wins at the cap"
+
+    def test_matches_simulation(self):
+        """Test the Rogue prediction against many seeded simulated battles"""
+        prediction = predict_outcome(Rogue("R"), Warrior("W"))
+        rng = random.Random(2024)
+        fights = 4000
+        wins = rounds = 0
+        for _ in range(fights):
+            result = Battle(Rogue("R"), Warrior("W"), rng=rng).fight_until_defeat(output=False)
+            wins += result.winner == 1
+            rounds += result.rounds
+
+        assert wins / fights == pytest.approx(prediction.win, abs=0.03), "Win rate should match simulation"
+        assert rounds / fights == pytest.approx(prediction.expected_rounds, abs=0.1), "Rounds should match simulation"
+
+    def test_results_are_memoized(self):
+        """Test that repeated queries with the same stats reuse the cached result"""
+        first = predict_outcome(Rogue("R1"), Mage("M1"))
+        second = predict_outcome(Rogue("Other"), Mage("Names"))
+
+        assert first is second, "Same stats should return the cached prediction"
@@ -0,0 +1,82 @@
+import random
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, PartyBattle, PartyResult, TargetIndex
+
+class TestTargetIndex:
+    """Test the heap-based target index"""
+
+    def test_best_is_lowest_health(self):
+        """Test that the lowest-health living member is chosen"""
+        members = [Character("A", 50, 0, 0), Character("B", 20, 0, 0), Character("C", 70, 0, 0)]
+        index = TargetIndex(members, key=lambda c: c.health)
+
+        assert index.best() is members[1], "B has the lowest health"
+
+    def test_update_after_damage(self):
+        """Test that a damaged member moves up the index"""
+        members = [Character("A", 50, 0, 0), Character("B", 20, 0, 0)]
+        index = TargetIndex(members, key=lambda c: c.health)
+        members[0].take_damage(45)
+        index.update(members[0])
+
+        assert index.best() is members[0], "A is now the weakest"
+
+    def test_defeated_members_drop_out(self):
+        """Test that defeated members are removed and never targeted"""
+        members = [Character("A", 10, 0, 0), Character("B", 30, 0, 0)]
+        index = TargetIndex(members, key=lambda c: c.health)
+        members[0].take_damage(10)
+        index.update(members[0])
+
+        assert len(index) == 1, "Only B is alive"
+        assert index.best() is members[1], "B should be the only target"
+
+    def test_already_defeated_members_are_ignored(self):
+        """Test that members starting at 0 health are not indexed"""
+        index = TargetIndex([Character("Down", 0, 0, 0)], key=lambda c: c.health)
+
+        assert index.best() is None, "Nobody is left to target"
+
+class TestPartyBattle:
+    """Test N-vs-M party battles"""
+
+    def test_focus_fire_on_lowest_health(self, capsys):
+        """Test that the whole party attacks the weakest enemy first"""
+        party1 = [Warrior("W1"), Warrior("W2")]
+        weak, strong = Character("Weak", 30, 0, 0), Character("Strong", 100, 0, 0)
+
+        PartyBattle(party1, [strong, weak]).fight(max_rounds=1)
+
+        assert weak.health == 0, "First two swings should finish the weak enemy"
+        assert strong.health == 100, "Nobody should touch the strong enemy in round one"
+
+    def test_highest_health_policy(self):
+        """Test the alternative targeting policy"""
+        weak, strong = Character("Weak", 30, 0, 0), Character("Strong", 100, 0, 0)
+
+        PartyBattle([Warrior("W")], [weak, strong], policy="highest_health").fight(max_rounds=1)
+
+        assert strong.health == 80, "The toughest enemy should be hit"
+
+    def test_unknown_policy(self):
+        """Test that unknown policies are rejected"""
+        with pytest.raises(ValueError):
+            PartyBattle([], [], policy="random")
+
+    def test_large_raid_finishes(self):
+        """Test hundreds of combatants per side"""
+        picker = random.Random(1)
+        raid = [picker.choice([Warrior, Mage, Rogue])("Hero%d" % i) for i in range(300)]
+        horde = [Character("Mob%d" % i, 60, 8, 0) for i in range(400)]
+
+        result = PartyBattle(raid, horde).fight()
+
+        assert isinstance(result, PartyResult), "A PartyResult should be returned"
+        assert result.winner in (1, 2), "One side should win"
+        assert not (result.survivors1 and result.survivors2), "Battle should end when a party is wiped out"
+
+    def test_silent_by_default(self, capsys):
+        """Test that party battles print nothing unless asked"""
+        PartyBattle([Warrior("W")], [Mage("M")]).fight()
+
+        assert capsys.readouterr().out == "", "No output expected"
@@ -0,0 +1,93 @@
+import random
+import pytest
+from project2_starter import Character, Rogue, Warrior, Battle, RollBuffer, set_event_sink, NullSink
+
+@pytest.fixture(autouse=True)
+def quiet():
+    """Keeps attack output out of these tests"""
+    previous = set_event_sink(NullSink())
+    yield
+    set_event_sink(previous)
+
+def rogue_damages(rng, swings=200):
+    """Returns the damage of many Rogue attacks using the given rng"""
+    rogue = Rogue("SeedRogue")
+    rogue.rng = rng
+    damages = []
+    for _ in range(swings):
+        target = Character("Target", 1000, 0, 0)
+        rogue.attack(target)
+        damages.append(1000 - target.health)
+    return damages
+
+class TestInjectableRng:
+    """Test per-character and per-battle random sources"""
+
+    def test_default_uses_global_random(self):
+        """Test that characters fall back to the global random module"""
+        assert Rogue("Default").rng is None, "No private rng should be set by default"
+
+    def test_seeded_rng_is_reproducible(self):
+        """Test that the same seed gives the same critical hits"""
+        first = rogue_damages(random.Random(123))
+        second = rogue_damages(random.Random(123))
+
+        assert first == second, "Seeded rogues should hit identically"
+        assert set(first) == {12, 24}, "Rogue should do normal and critical damage"
+
+    def test_private_rng_leaves_global_state_alone(self):
+        """Test that a private rng does not consume global random numbers"""
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        rogue_damages(random.Random(1))
+
+        assert random.random() == expected, "Global random state should be untouched"
+
+    def test_battle_rng_is_installed_temporarily(self):
+        """Test that a battle-wide rng is used during the fight and then removed"""
+        results = []
+        for _ in range(2):
+            rogue, warrior = Rogue("R"), Warrior("W")
+            results.append(Battle(rogue, warrior, rng=random.Random(77)).fight_until_defeat(output=False))
+            assert rogue.rng is None, "Characters should get their own rng back"
+
+        assert results[0] == results[1], "Seeded battles should be reproducible"
+
+class TestRollBuffer:
+    """Test the bulk-drawn roll buffer"""
+
+    def test_rolls_stay_in_range(self):
+        """Test that buffered rolls cover 1..10 and nothing else"""
+        buffer = RollBuffer(source=3, size=64)
+        rolls = [buffer.randint(1, 10) for _ in range(1000)]
+
+        assert set(rolls) == set(range(1, 11)), "All ten values should appear"
+
+    def test_crit_rate_is_about_thirty_percent(self):
+        """Test that a buffered Rogue still crits about 30% of the time"""
+        damages = rogue_damages(RollBuffer(source=11), swings=20000)
+        rate = damages.count(24) / len(damages)
+
+        assert 0.28 < rate < 0.32, "Critical hit rate should stay near 30%"
+
+    def test_same_seed_same_rolls(self):
+        """Test that buffers with the same seed produce the same rolls"""
+        first, second = RollBuffer(source=8, size=10), RollBuffer(source=8, size=10)
+
+        assert [first.randint(1, 10) for _ in range(35)] == [second.randint(1, 10) for _ in range(35)], \
+            "Refills should be reproducible"
+
+    def test_other_ranges_use_the_source(self):
+        """Test that rolls outside the buffered range still work"""
+        roll = RollBuffer(source=2).randint(1, 100)
+
+        assert 1 <= roll <= 100, "Unbuffered ranges should be drawn from the source"
+
+    def test_numpy_generator_source(self):
+        """Test that a numpy Generator can fill the buffer"""
+        np = pytest.importorskip("numpy")
+        first = rogue_damages(RollBuffer(np.random.default_rng(4)))
+        second = rogue_damages(RollBuffer(np.random.default_rng(4)))
+
+        assert first == second, "Generator-backed buffers should be reproducible"
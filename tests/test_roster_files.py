@@ -0,0 +1,93 @@
+import pickle
+import pytest
+from project2_starter import (
+    Character, Player, Warrior, Mage, Rogue, save_roster, load_roster, open_roster, RosterView,
+)
+
+def sample_roster():
+    """Builds a roster with varied stats and repeated names"""
+    warrior, mage, rogue = Warrior("Sir Galahad"), Mage("Merlin"), Rogue("Robin Hood")
+    warrior.health, warrior.level, warrior.experience = 77, 3, 450
+    rogue.strength = 19
+    custom = Player("Ünïcode Bard", "Bard", 60, 7, 14)
+    return [warrior, mage, rogue, custom, Warrior("Sir Galahad")]
+
+def fields(player):
+    """Returns everything a roster file stores about a player"""
+    return (type(player), player.name, player.character_class, player.health, player.strength,
+            player.magic, player.level, player.experience)
+
+class TestRosterRoundTrip:
+    """Test saving and loading whole rosters"""
+
+    def test_round_trip_keeps_every_field(self, tmp_path):
+        """Test that all stored fields and classes survive a round trip"""
+        path = tmp_path / "roster.bin"
+        roster = sample_roster()
+
+        assert save_roster(path, roster) == 5, "All players should be written"
+        assert [fields(p) for p in load_roster(path)] == [fields(p) for p in roster], "Fields should match"
+
+    def test_loaded_players_still_fight(self, tmp_path):
+        """Test that loaded characters keep their class behaviour"""
+        path = tmp_path / "roster.bin"
+        save_roster(path, [Warrior("W")])
+        warrior = load_roster(path)[0]
+        target = Character("Target", 100, 0, 0)
+
+        warrior.power_strike(target)
+
+        assert target.health == 70, "Loaded warrior should power strike for 30"
+
+    def test_strings_are_interned(self, tmp_path):
+        """Test that repeated names and classes are stored once"""
+        few, many = tmp_path / "few.bin", tmp_path / "many.bin"
+        save_roster(few, [Warrior("Grunt")])
+        save_roster(many, [Warrior("Grunt") for _ in range(1000)])
+
+        per_player = (many.stat().st_size - few.stat().st_size) / 999
+        assert per_player == 28, "Each extra player should cost exactly one fixed-width record"
+
+    def test_smaller_than_pickle(self, tmp_path):
+        """Test that the binary format beats pickle for a large roster"""
+        path = tmp_path / "roster.bin"
+        roster = [Rogue("Rogue%d" % i) for i in range(2000)]
+        save_roster(path, roster)
+
+        assert path.stat().st_size < len(pickle.dumps(roster)), "Binary roster should be smaller than pickle"
+
+    def test_rejects_non_players_and_bad_files(self, tmp_path):
+        """Test error handling for plain characters and foreign files"""
+        with pytest.raises(TypeError):
+            save_roster(tmp_path / "bad.bin", [Character("C", 1, 1, 1)])
+
+        junk = tmp_path / "junk.bin"
+        junk.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            load_roster(junk)
+
+class TestRosterView:
+    """Test lazy memory-mapped roster access"""
+
+    def test_random_access(self, tmp_path):
+        """Test indexing into a mapped roster"""
+        path = tmp_path / "roster.bin"
+        roster = sample_roster()
+        save_roster(path, roster)
+
+        with open_roster(path) as view:
+            assert isinstance(view, RosterView), "open_roster should return a RosterView"
+            assert len(view) == 5, "Length should come from the header"
+            assert fields(view[3]) == fields(roster[3]), "Custom player should decode lazily"
+            assert fields(view[-1]) == fields(roster[-1]), "Negative indexes should work"
+            assert view.record(0)[:3] == ("Sir Galahad", "Warrior", 77), "Raw records skip object creation"
+
+    def test_iteration_and_bounds(self, tmp_path):
+        """Test iterating a view and indexing past the end"""
+        path = tmp_path / "roster.bin"
+        save_roster(path, sample_roster())
+
+        with open_roster(path) as view:
+            assert [p.name for p in view][:2] == ["Sir Galahad", "Merlin"], "Iteration should be in file order"
+            with pytest.raises(IndexError):
+                view[5]
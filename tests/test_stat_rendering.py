@@ -0,0 +1,105 @@
+import io
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, CharacterFactory, render_roster
+
+class TestStatLine:
+    """Test stat lines built from shared fragments"""
+
+    def test_output_is_unchanged(self, capsys):
+        """Test that display_stats prints exactly what it used to"""
+        Character("Dummy", 50, 3, 4).display_stats()
+        Warrior("Sir Galahad").display_stats()
+
+        assert capsys.readouterr().out == (
+            "Dummy | Health: 50 | Strength: 3 | Magic: 4\n"
+            "Sir Galahad | Health: 120 | Strength: 15 | Magic: 5\n"
+            "Class: Warrior | Level: 1 | EXP: 0\n"
+        ), "Stat lines should match the original format"
+
+    def test_player_overrides_display_stats(self):
+        """Test that Player extends Character.display_stats instead of inheriting it"""
+        assert "display_stats" in Player.__dict__, "Player should override display_stats"
+
+    def test_characters_carry_no_cache(self):
+        """Test that the cached fragments are shared rather than stored per character"""
+        first, second = Mage("A"), Mage("B")
+        first.stat_line(), second.stat_line()
+
+        assert first.class_line() == "Class: Mage | Level: 1 | EXP: 0", "Class line should be formatted"
+        assert not hasattr(first, "__dict__") and "_stat_parts" not in Character.__slots__, \
+            "Characters should not carry a cache of their own"
+
+    def test_health_and_experience_are_live(self):
+        """Test that frequently changing fields are always current"""
+        rogue = Rogue("R")
+        rogue.stat_line()
+        rogue.take_damage(30)
+        rogue.experience = 40
+
+        assert rogue.stat_line().endswith("Health: 60 | Strength: 12 | Magic: 10\nClass: Rogue | Level: 1 | EXP: 40"), \
+            "Health and experience should be current"
+
+    @pytest.mark.parametrize("attribute, value, text", [
+        ("name", "Robin", "Robin | Health"),
+        ("strength", 20, "Strength: 20"),
+        ("magic", 7, "Magic: 7"),
+        ("level", 4, "Level: 4"),
+        ("character_class", "Thief", "Class: Thief"),
+    ])
+    def test_changes_show_up(self, attribute, value, text):
+        """Test that changing any displayed attribute is reflected in the next line"""
+        rogue = Rogue("R")
+        rogue.stat_line()
+        setattr(rogue, attribute, value)
+
+        assert text in rogue.stat_line(), f"Changing {attribute} should show up"
+
+    def test_level_up_is_shown(self):
+        """Test that leveling through experience refreshes the line"""
+        warrior = Warrior("W")
+        warrior.stat_line()
+        warrior.gain_experience(100)
+
+        assert "Strength: 17" in warrior.stat_line() and "Level: 2" in warrior.stat_line(), "Growth should show"
+
+    def test_factory_clones_have_their_own_lines(self):
+        """Test that spawned characters show their own names"""
+        first, second = CharacterFactory(registry={"Mage": Mage}).spawn_many("Mage", ["Ann", "Bo"])
+
+        assert first.stat_line().startswith("Ann |") and second.stat_line().startswith("Bo |"), \
+            "Each clone should show its own name"
+
+class TestRenderRoster:
+    """Test batched roster rendering"""
+
+    def test_single_write(self):
+        """Test that a whole roster goes out in one write call"""
+        class CountingStream(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingStream.writes += 1
+                return super().write(text)
+
+        roster = [Warrior("W"), Mage("M"), Character("Dummy", 10, 0, 0)]
+        stream = CountingStream()
+
+        assert render_roster(roster, stream) == 3, "Every character should be rendered"
+        assert CountingStream.writes == 1, "Output should be a single write"
+        assert stream.getvalue() == "".join(c.stat_line() + "\n" for c in roster), "Text should match stat_line"
+
+    def test_matches_display_stats(self, capsys):
+        """Test that rendering to stdout matches calling display_stats on each character"""
+        roster = [Rogue("R"), Mage("M")]
+        for character in roster:
+            character.display_stats()
+        expected = capsys.readouterr().out
+
+        render_roster(roster)
+        assert capsys.readouterr().out == expected, "Batched output should match"
+
+    def test_empty_roster(self):
+        """Test that an empty roster writes nothing"""
+        stream = io.StringIO()
+
+        assert render_roster([], stream) == 0 and stream.getvalue() == "", "Nothing should be written"
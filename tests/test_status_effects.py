@@ -0,0 +1,161 @@
+import asyncio
+import pytest
+from project2_starter import (
+    Character, Warrior, Mage, Rogue, SimpleBattle, Battle, Encounter, EncounterScheduler,
+    StatusEffects, EffectRule, STUN, BufferedSink, NullSink, set_event_sink, PartyBattle, record_battle, play_record,
+)
+
+BURN_ON_ATTACK = {"attack": EffectRule("burn", 2, 5, "{target} burns for {damage} damage!")}
+
+@pytest.fixture
+def silent():
+    """Routes combat events to a buffer for the duration of a test"""
+    sink = BufferedSink()
+    previous = set_event_sink(sink)
+    yield sink
+    set_event_sink(previous)
+
+class TestScheduling:
+    """Test applying, ticking and expiring effects"""
+
+    def test_fireball_burns_for_three_turns(self, silent):
+        """Test that a fireball burn ticks on the next three turns and then expires"""
+        dummy = Character("Dummy", 100, 0, 0)
+        with StatusEffects() as effects:
+            Mage("M").fireball(dummy)
+            ticks = [effects.advance() for _ in range(4)]
+
+        assert dummy.health == 100 - 30 - 3 * 5, "Burn should deal 5 damage three times"
+        assert ticks == [1, 1, 1, 0], "Burn should expire after its third tick"
+        assert len(effects) == 0, "No effects should remain active"
+
+    def test_reapplying_refreshes_instead_of_stacking(self, silent):
+        """Test that a second bleed replaces the first one"""
+        dummy = Character("Dummy", 200, 0, 0)
+        with StatusEffects() as effects:
+            rogue = Rogue("R")
+            rogue.sneak_attack(dummy)
+            effects.advance()
+            rogue.sneak_attack(dummy)
+            for _ in range(5):
+                effects.advance()
+
+        assert dummy.health == 200 - 2 * 24 - 3 * 4, "One tick from the first bleed and two from the refresh"
+
+    def test_only_due_effects_are_touched(self, silent):
+        """Test that advance() only pops heap entries due on the new turn"""
+        effects = StatusEffects()
+        targets = [Character(f"T{i}", 100, 0, 0) for i in range(50)]
+        long_burn = EffectRule("burn", 10, 1, "{target} burns for {damage} damage!")
+        effects.turn = 5  # Schedule 50 burns as if applied on turn 5
+        for target in targets:
+            effects.apply(target, long_burn)
+        effects.turn = 0
+        effects.apply(Character("Early", 100, 0, 0), long_burn)
+
+        assert effects.advance() == 1, "Only the burn due on turn 1 should tick"
+        assert all(target.health == 100 for target in targets), "Burns due on turn 6 should be untouched"
+
+    def test_defeated_targets_stop_ticking(self, silent):
+        """Test that effects on a defeated character are dropped"""
+        dummy = Character("Dummy", 40, 0, 0)
+        with StatusEffects() as effects:
+            Mage("M").fireball(dummy)
+            dummy.take_damage(100)
+
+        assert effects.advance() == 0 and len(effects) == 0, "Dead characters should not burn"
+
+    def test_ticks_are_reported_to_the_sink(self, silent):
+        """Test that ticks emit attack and damage events like any other hit"""
+        dummy = Character("Dummy", 100, 0, 0)
+        with StatusEffects() as effects:
+            Mage("M").fireball(dummy)
+            effects.advance()
+
+        assert silent.render()[-2:] == ["Dummy burns for 5 damage!", "Dummy takes 5 damage! Health is now 65."], \
+            "Burn tick should be logged"
+
+    def test_stun_skips_actions(self):
+        """Test that a stunned character loses exactly its next action"""
+        effects = StatusEffects()
+        mage = Mage("M")
+        effects.apply(mage, EffectRule(STUN, 1, 0, None))
+
+        assert effects.has_effect(mage, STUN), "Mage should be stunned"
+        assert [effects.can_act(mage), effects.can_act(mage)] == [False, True], "Only one action is skipped"
+
+    def test_context_restores_previous_sink(self):
+        """Test that leaving the context puts the original sink back"""
+        sink = NullSink()
+        previous = set_event_sink(sink)
+        try:
+            with StatusEffects():
+                pass
+            assert set_event_sink(sink) is sink, "Original sink should be restored"
+        finally:
+            set_event_sink(previous)
+
+class TestBattleIntegration:
+    """Test effects inside SimpleBattle, Battle and Encounter rounds"""
+
+    def test_simple_battle_round(self, capsys):
+        """Test that SimpleBattle rounds apply effects through the event sink"""
+        dummy = Character("Dummy", 100, 0, 0)
+        with StatusEffects(rules=BURN_ON_ATTACK) as effects:
+            SimpleBattle(Warrior("W"), dummy).fight()
+            effects.advance()
+
+        assert dummy.health == 75, "Dummy should take 20 from the sword and 5 from the burn"
+        assert "Dummy burns for 5 damage!" in capsys.readouterr().out, "Burn should be printed"
+
+    def test_silent_battles_inside_effects_print_nothing(self, capsys):
+        """Test that effects wrapping the console sink don't defeat output=False"""
+        with StatusEffects() as effects:
+            Battle(Warrior("W"), Mage("M")).fight_until_defeat(output=False)
+            PartyBattle([Warrior("W")], [Rogue("R")]).fight(output=False)
+            play_record(record_battle(Mage("M"), Warrior("W"), seed=1, actions=[(0, "fireball")]))
+
+        assert capsys.readouterr().out == "", "Silent runs should print nothing"
+        assert len(effects) == 1, "Effects should still be applied while silenced"
+
+    def test_battle_ticks_each_round(self):
+        """Test that Battle ticks burns at the start of every round"""
+        first = Character("A", 50, 10, 0)
+        second = Character("B", 50, 0, 0)
+        result = Battle(first, second, effects=StatusEffects(rules=BURN_ON_ATTACK)).fight_until_defeat(output=False)
+
+        assert result == (1, 4, 35, 0), "Both sides burn every round after the first"
+
+    def test_battle_stuns(self, capsys):
+        """Test that a stunned character skips its attack in Battle"""
+        effects = StatusEffects(rules={"attack": EffectRule(STUN, 1, 0, None)})
+        result = Battle(Warrior("W"), Mage("M"), effects=effects).fight_until_defeat()
+
+        assert result == (1, 4, 120, 0), "Mage should be stunned every round and never strike back"
+        assert "M is stunned!" in capsys.readouterr().out, "Stuns should be announced"
+
+    def test_encounter_burns(self):
+        """Test that an encounter applies and ticks effects from chosen abilities"""
+        async def always_fireball(actor, opponent):
+            return "fireball"
+
+        encounter = Encounter(Mage("M"), Character("Dummy", 100, 0, 0), controllers=(always_fireball, None),
+                              effects=StatusEffects())
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.rounds == 3, "Burn ticks should finish the dummy a round early"
+
+    def test_encounter_stuns(self):
+        """Test that power strikes keep the opponent from acting"""
+        async def always_power_strike(actor, opponent):
+            return "power_strike"
+
+        encounter = Encounter(Warrior("W"), Character("Hitter", 200, 50, 0),
+                              controllers=(always_power_strike, None), effects=StatusEffects())
+        scheduler = EncounterScheduler()
+        scheduler.add(encounter)
+        asyncio.run(scheduler.run())
+
+        assert encounter.result.health1 == 120, "Stunned opponent should never land a hit"
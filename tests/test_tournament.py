@@ -0,0 +1,57 @@
+import random
+import pytest
+from project2_starter import Warrior, Mage, Rogue, run_tournament, Standing, POINTS_PER_WIN
+
+def make_roster(count, seed=5):
+    """Builds a reproducible roster mixing all three classes"""
+    picker = random.Random(seed)
+    return [picker.choice([Warrior, Mage, Rogue])("Hero%d" % i) for i in range(count)]
+
+class TestTournament:
+    """Test the round-robin tournament runner"""
+
+    def test_every_pair_plays_once(self):
+        """Test that each character plays everyone else exactly once"""
+        roster = make_roster(6)
+        standings = run_tournament(roster, workers=1)
+
+        assert len(standings) == 6, "Every character should have a standing"
+        assert all(isinstance(row, Standing) for row in standings), "Rows should be Standing records"
+        assert all(row.wins + row.losses + row.ties == 5 for row in standings), "Each character plays 5 matchups"
+
+    def test_standings_are_sorted_by_points(self):
+        """Test that the standings table is ordered best first"""
+        standings = run_tournament(make_roster(8), workers=1)
+        points = [row.points for row in standings]
+
+        assert points == sorted(points, reverse=True), "Standings should be sorted by points"
+
+    def test_deterministic_classes_rank_as_expected(self):
+        """Test a roster without Rogues, where every result is fixed"""
+        roster = [Mage("M"), Warrior("W")]
+        top = run_tournament(roster, workers=1)[0]
+
+        assert top.name == "W" and top.points == POINTS_PER_WIN, "Warrior should beat Mage"
+
+    def test_roster_is_not_modified(self):
+        """Test that tournaments fight on copies of the roster"""
+        roster = make_roster(5)
+        run_tournament(roster, workers=1)
+
+        assert all(c.health == type(c)("x").health for c in roster), "Roster health should be untouched"
+
+    def test_same_seed_same_standings(self):
+        """Test that a seed fully determines the tournament"""
+        roster = make_roster(10)
+
+        assert run_tournament(roster, workers=1, seed=3) == run_tournament(roster, workers=1, seed=3), \
+            "Same seed should give the same standings"
+
+    def test_worker_count_does_not_change_results(self):
+        """Test that the process pool gives the same standings as a serial run"""
+        roster = make_roster(12)
+
+        serial = run_tournament(roster, workers=1, seed=9)
+        parallel = run_tournament(roster, workers=3, seed=9)
+
+        assert serial == parallel, "Results should not depend on the number of workers"
@@ -0,0 +1,110 @@
+import random
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon, predict_outcome
+
+def damage_of(use_ability):
+    """Returns the damage a call deals to a fresh 500-health target"""
+    target = Character("Target", 500, 0, 0)
+    use_ability(target)
+    return 500 - target.health
+
+class TestEquipping:
+    """Test equipping and unequipping weapons"""
+
+    def test_players_start_unarmed(self):
+        """Test that new players have no weapon"""
+        assert Warrior("Bare").weapon is None, "Players should start without a weapon"
+
+    def test_equip_returns_previous_weapon(self):
+        """Test swapping weapons hands back the old one"""
+        warrior = Warrior("Swapper")
+        sword, axe = Weapon("Sword", 10), Weapon("Axe", 12)
+
+        assert warrior.equip(sword) is None, "First equip has nothing to return"
+        assert warrior.equip(axe) is sword, "Second equip returns the sword"
+        assert warrior.unequip() is axe, "Unequip returns the axe"
+        assert warrior.weapon is None, "Warrior should be unarmed again"
+
+class TestWeaponDamage:
+    """Test that equipped weapons feed into every ability"""
+
+    def test_weapon_adds_to_attack_and_specials(self):
+        """Test that the bonus applies to attacks and special abilities"""
+        warrior, mage, rogue = Warrior("W"), Mage("M"), Rogue("R")
+        for player in (warrior, mage, rogue):
+            player.equip(Weapon("Relic", 10))
+
+        assert damage_of(warrior.attack) == 30, "Warrior attack: 15 + 5 + 10"
+        assert damage_of(warrior.power_strike) == 40, "Power strike: 15 + 15 + 10"
+        assert damage_of(mage.attack) == 30, "Mage attack: 20 + 10"
+        assert damage_of(mage.fireball) == 40, "Fireball: 20 + 10 + 10"
+        assert damage_of(rogue.sneak_attack) == 34, "Sneak attack: 12 * 2 + 10"
+
+    def test_unequip_restores_damage(self):
+        """Test that removing a weapon removes its bonus"""
+        mage = Mage("M")
+        mage.equip(Weapon("Staff", 15))
+        mage.unequip()
+
+        assert damage_of(mage.fireball) == 30, "Fireball should be back to magic + 10"
+
+class TestDamageTable:
+    """Test the cached per-character damage table"""
+
+    def test_table_is_cached(self):
+        """Test that the same table object is reused between attacks"""
+        warrior = Warrior("Cache")
+
+        assert warrior.damage_table() is warrior.damage_table(), "Table should be built once"
+
+    def test_stat_change_invalidates_table(self):
+        """Test that changing strength or magic rebuilds the table"""
+        warrior, mage = Warrior("W"), Mage("M")
+        warrior.damage_table(), mage.damage_table()
+        warrior.strength = 30
+        mage.magic = 40
+
+        assert warrior.damage_for("power_strike") == 45, "New strength should be used"
+        assert mage.damage_for("attack") == 40, "New magic should be used"
+
+    def test_health_change_keeps_table(self):
+        """Test that taking damage does not throw away the table"""
+        rogue = Rogue("R")
+        table = rogue.damage_table()
+        rogue.take_damage(10)
+
+        assert rogue.damage_table() is table, "Health is not part of the damage table"
+
+    def test_assigning_weapon_is_picked_up(self):
+        """Test that setting the weapon attribute directly works like equip()"""
+        warrior = Warrior("W")
+        warrior.damage_table()
+        warrior.weapon = Weapon("Axe", 12)
+
+        assert warrior.damage_for("attack") == 32, "Directly assigned weapon should be used"
+
+    def test_editing_equipped_weapon_is_picked_up(self):
+        """Test that changing an equipped weapon's bonus applies without any invalidation"""
+        warrior = Warrior("W")
+        sword = Weapon("Sword", 5)
+        warrior.equip(sword)
+        warrior.damage_for("attack")
+        sword.damage_bonus = 9
+
+        assert warrior.damage_for("attack") == 29, "Edited bonus should be picked up"
+        assert damage_of(warrior.attack) == 29, "Attacks should use the edited bonus too"
+
+    def test_tables_are_shared_between_builds(self):
+        """Test that characters with the same class and stats share one table"""
+        first, second = Rogue("A"), Rogue("B")
+
+        assert first.damage_table() is second.damage_table(), "Identical builds should share a table"
+        second.strength += 1
+        assert first.damage_table() is not second.damage_table(), "A stat change should move to another table"
+
+    def test_predictor_sees_weapons(self):
+        """Test that outcome predictions include weapon bonuses"""
+        mage = Mage("M")
+        mage.equip(Weapon("Staff", 30))
+
+        assert predict_outcome(mage, Warrior("W")).win == 1.0, "Armed mage should out-damage the warrior"
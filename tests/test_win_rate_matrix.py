@@ -0,0 +1,119 @@
+import json
+import pytest
+from project2_starter import (
+    Warrior, Mage, Rogue, Weapon, AbilitySpec, WinRateMatrix, build_fingerprint, matchup_win_rate,
+)
+
+def class_matrix(path=None, **kwargs):
+    """Builds a matrix holding the three standard classes"""
+    matrix = WinRateMatrix(path, **kwargs)
+    for cls in (Warrior, Mage, Rogue):
+        matrix.add_class(cls)
+    return matrix
+
+class TestFingerprints:
+    """Test build fingerprints"""
+
+    def test_names_do_not_matter(self):
+        """Test that two characters with the same class and stats share a fingerprint"""
+        assert build_fingerprint(Warrior("A")) == build_fingerprint(Warrior("B")), "Names shouldn't change builds"
+
+    def test_stats_and_equipment_matter(self):
+        """Test that stats and weapons change the fingerprint"""
+        buffed, armed = Warrior("A"), Warrior("B")
+        buffed.strength += 1
+        armed.equip(Weapon("Axe", 5))
+
+        assert len({build_fingerprint(c) for c in (Warrior("W"), buffed, armed)}) == 3, "Each build should differ"
+
+    def test_ability_specs_matter(self):
+        """Test that changing a class's ability specs changes the fingerprint"""
+        class SharpRogue(Rogue):
+            ABILITY_SPECS = {"attack": AbilitySpec("strength", crit_chance=0.5)}
+
+        assert build_fingerprint(SharpRogue("R")) != build_fingerprint(Rogue("R")), "Behaviour should be hashed"
+
+    def test_closure_values_matter(self):
+        """Test that formulas differing only in captured values get different fingerprints"""
+        def make(bonus):
+            class Bruiser(Warrior):
+                DAMAGE_FORMULAS = {**Warrior.DAMAGE_FORMULAS, "attack": lambda c: c.strength + bonus}
+            return Bruiser("B")
+
+        assert build_fingerprint(make(2)) != build_fingerprint(make(5)), "Captured values should be hashed"
+        assert build_fingerprint(make(2)) == build_fingerprint(make(2)), "Equal closures should still match"
+
+class TestMatrix:
+    """Test the cached win-rate matrix"""
+
+    def test_rates_are_complementary(self):
+        """Test that A vs B and B vs A add up to one"""
+        rates = class_matrix().matrix()
+
+        assert rates[("Warrior", "Mage")] == 1.0, "Warrior always beats Mage"
+        assert rates[("Rogue", "Rogue")] == 0.5, "Mirror matches are even"
+        assert rates[("Mage", "Rogue")] + rates[("Rogue", "Mage")] == pytest.approx(1.0), "Rates should complement"
+
+    def test_matches_direct_prediction(self):
+        """Test that cached rates equal a direct calculation"""
+        matrix = class_matrix()
+
+        assert matrix.win_rate("Rogue", "Mage") == pytest.approx(matchup_win_rate(Rogue("R"), Mage("M"))), \
+            "Matrix should match matchup_win_rate"
+
+    def test_only_changed_row_and_column_are_recomputed(self):
+        """Test that replacing one build only predicts its pairs"""
+        matrix = class_matrix()
+        matrix.add_class(Warrior, "Warrior2")
+        matrix.matrix()
+        assert matrix.computed == 3, "Two identical warriors share results, leaving three distinct pairs"
+
+        matrix.matrix()
+        assert matrix.computed == 3, "A second pass should be served from the cache"
+
+        class TankMage(Mage):
+            pass
+        matrix.add("Mage", TankMage("Mage"))
+        matrix.builds["Mage"].health = 200
+        matrix.matrix()
+        assert matrix.computed == 5, "Only Mage vs Warrior and Mage vs Rogue should be recomputed"
+
+    def test_cache_persists_between_runs(self, tmp_path):
+        """Test that a saved cache is reused by a new matrix"""
+        path = tmp_path / "rates.json"
+        first = class_matrix(path)
+        expected = first.matrix()
+        first.save()
+
+        second = class_matrix(path)
+        assert second.matrix() == expected, "Loaded rates should match"
+        assert second.computed == 0, "Nothing should be recomputed after loading"
+
+    def test_cache_for_other_round_cap_is_ignored(self, tmp_path):
+        """Test that rates computed with another max_rounds aren't reused"""
+        path = tmp_path / "rates.json"
+        first = class_matrix(path)
+        first.matrix()
+        first.save()
+
+        second = class_matrix(path, max_rounds=5)
+        second.matrix()
+        assert second.computed == 3, "A different round cap should start from scratch"
+
+    def test_save_without_path(self, tmp_path, monkeypatch):
+        """Test that saving with no path fails clearly before touching any file"""
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(ValueError):
+            class_matrix().save()
+
+        assert list(tmp_path.iterdir()) == [], "No temporary file should be written"
+
+    def test_prune_keeps_current_builds(self, tmp_path):
+        """Test that pruning drops rates for builds no longer in the matrix"""
+        path = tmp_path / "rates.json"
+        matrix = class_matrix(path)
+        matrix.matrix()
+        matrix.remove("Rogue")
+        matrix.save(prune=True)
+
+        assert len(json.loads(path.read_text())["rates"]) == 1, "Only Warrior vs Mage should remain"